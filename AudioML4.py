@@ -1,5 +1,5 @@
 import os
-from pydub import AudioSegment
+from segmenter import write_segments
 
 # Wav dosyalarının bulunduğu ana dizin
 wav_dir = "123/Sesler_wav"
@@ -22,28 +22,27 @@ for folder in folders:
     
     for wav_file in wav_files:
         file_path = os.path.join(folder_path, wav_file)
-        audio = AudioSegment.from_wav(file_path)
-        
-       # Ses dosyasını 5 saniyelik parçalara böl
-chunk_length_ms = 5000  # 5 saniye
-chunks = [audio[i:i + chunk_length_ms] for i in range(0, len(audio), chunk_length_ms)]
 
-# Parçaları kaydet
-for i, chunk in enumerate(chunks):
-    chunk.export(os.path.join(output_folder, f"{wav_file[:-4]}_part{i+1}.wav"), format="wav")
+        # Ses dosyasını bloklar halinde okuyup 5 saniyelik parçalara böl ve kaydet
+        write_segments(file_path, output_folder, segment_s=5.0)
 
 
 
 import librosa
 import numpy as np
 import os
+from feature_cache import FeatureCache
+from mfcc import mfcc_cikar_ve_kaydet
 
 # Bölünmüş ses dosyalarının bulunduğu dizin
 bolunmus_wav_dir = '123/Bolunmus_wav'
 
-# MFCC özelliklerinin kaydedileceği dizin
+# Ortalama MFCC vektörlerinin tek veri seti olarak yazılacağı dizin
 mfcc_dir = '123/MFCC'
 
+# Daha önce hesaplanan MFCC'lerin tutulduğu önbellek
+onbellek = FeatureCache('123/MFCC_Onbellek')
+
 # MFCC parametreleri
 n_mfcc = 128
 
@@ -51,33 +50,17 @@ n_mfcc = 128
 frame_length = 25  # milisaniye cinsinden
 frame_stride = 10   # milisaniye cinsinden
 
-# Dosya klasörlerini işleme
-folders = ["Kerem_ses", "Emir_ses",]
+parametreler = {
+    "sr": None,
+    "n_mfcc": n_mfcc,
+    "frame_length_ms": frame_length,
+    "frame_stride_ms": frame_stride
+}
 
-# Her klasör için işlemleri uygula
-for folder in folders:
-    folder_path = os.path.join(bolunmus_wav_dir, folder)
-    mfcc_folder = os.path.join(mfcc_dir, folder)
-    os.makedirs(mfcc_folder, exist_ok=True)  # MFCC çıktılarının saklanacağı dizini oluştur
-
-    for dosya_adı in os.listdir(folder_path):
-        if dosya_adı.endswith('.wav'):
-            dosya_yolu = os.path.join(folder_path, dosya_adı)
-            
-            # Ses dosyasını yükle
-            ses, sr = librosa.load(dosya_yolu, sr=None)
-            
-            # MFCC özelliklerini çıkar
-            mfcc = librosa.feature.mfcc(
-                y=ses, sr=sr, n_mfcc=n_mfcc,
-                hop_length=int(frame_stride * sr / 1000),
-                n_fft=int(frame_length * sr / 1000)
-            )
-            
-            # MFCC özelliklerini kaydet
-            mfcc_dosya_adı = dosya_adı.split('.')[0] + '.npy'
-            mfcc_dosya_yolu = os.path.join(mfcc_folder, mfcc_dosya_adı)
-            np.save(mfcc_dosya_yolu, mfcc)
+# Değişmeyen dosyalar atlanır, yalnızca yeni veya değişen dosyalar için MFCC hesaplanır.
+# Bu betik __main__ korumasız hücrelerden oluşur; Windows/macOS'ta (spawn) her işçi betiği
+# baştan yeniden çalıştıracağı için burada tek işlemle çalışılır. Paralel çıkarım için mfcc.py kullanılır.
+mfcc_cikar_ve_kaydet(bolunmus_wav_dir, mfcc_dir, parametreler, onbellek, isci_sayisi=1)
 
 print("MFCC özellikleri başarıyla çıkarıldı.")
 
@@ -214,24 +197,16 @@ while True:
 # In[17]:
 
 
-import speech_recognition as sr
 from pydub import AudioSegment
+from transcription import transcribe_file
 
 def convert_mp3_to_wav(mp3_file_path, wav_file_path):
     audio = AudioSegment.from_mp3(mp3_file_path)
     audio.export(wav_file_path, format="wav")
 
 def transcribe_audio(audio_file_path):
-    recognizer = sr.Recognizer()
-    with sr.AudioFile(audio_file_path) as source:
-        audio = recognizer.record(source)
-    try:
-        transcript = recognizer.recognize_google(audio, language="tr-TR")
-        return transcript
-    except sr.UnknownValueError:
-        return "Could not understand audio"
-    except sr.RequestError as e:
-        return f"Could not request results; {e}"
+    # Arka uç transcription.VARSAYILAN_ARKA_UC ile seçilir (çevrimdışı için "vosk")
+    return transcribe_file(audio_file_path)
 
 kelimeler = []
 
@@ -1,27 +1,29 @@
 import numpy as np
 import sounddevice as sd
-import joblib
-import librosa
-import soundfile as sf
+from model_registry import registry
 import os
+from audio_features import identify_speaker, save_wav_async
 
 # Eğitilmiş modeli yükleme
 model_kayit_yolu = r'C:\Users\Lenovo\Desktop\123\model-kerem-emir.pkl'
 try:
-    model = joblib.load(model_kayit_yolu)
+    # Sınıf isimleri model dosyasının içinden okunur
+    model, sinif_isimleri = registry.get(model_kayit_yolu)
     print("Model başarıyla yüklendi!")
 except Exception as e:
     print("Model yükleme sırasında hata oluştu:", e)
     exit()
 
-# Sınıf isimleri
-sinif_isimleri = ['Kerem', 'Emir', ]
-
 # Mikrofondan ses almak için gerekli parametreler
 saniye_basina_ornek = 44100  # Örnekleme hızı (örneğin, 44100 Hz)
 saniye = 5  # 5 saniyelik ses al
 kanal_sayisi = 1  # Tek kanallı ses
 
+# Kaydın diske yazılıp yazılmayacağı
+kaydi_sakla = True
+kayit_yolu = r'C:\Users\Lenovo\Desktop\123\kayit.wav'
+kayit_thread = None
+
 # Ses kaydı alma ve tahmin işlemi
 try:
     print("Konuşun...")
@@ -29,19 +31,13 @@ try:
     sd.wait()  # Ses alımının tamamlanmasını bekleyin
     print("Ses kaydı tamamlandı!")
     
-    # Kaydedilen sesi bir WAV dosyasına yazma
-    kayit_yolu = r'C:\Users\Lenovo\Desktop\123\kayit.wav'
-    sf.write(kayit_yolu, np.squeeze(ses), saniye_basina_ornek)
-    print(f"Ses {kayit_yolu} olarak kaydedildi.")
+    # Tahmin doğrudan bellekteki float32 tampon üzerinden yapılır
+    tahmin_isim = identify_speaker(ses, model, sinif_isimleri, sr=saniye_basina_ornek)
 
-    # WAV dosyasını yükleme ve MFCC özelliklerini çıkarma
-    y, sr = librosa.load(kayit_yolu, sr=saniye_basina_ornek)
-    mfcc = librosa.feature.mfcc(y=y, sr=sr, n_mfcc=128)
-    mfcc = np.mean(mfcc.T, axis=0)  # Ortalama MFCC vektörü
-
-    # Model üzerinden tahmin yapma
-    tahmin_indeksi = model.predict(mfcc.reshape(1, -1))[0]
-    tahmin_isim = sinif_isimleri[tahmin_indeksi]
+    # Kaydı diske yazmak isteğe bağlıdır ve tahmini bekletmez
+    if kaydi_sakla:
+        kayit_thread = save_wav_async(ses, pcm_path=kayit_yolu, sr=saniye_basina_ornek)
+        print(f"Ses {kayit_yolu} olarak kaydediliyor.")
 
     # Tahmini sonuç
     print("Tahmin edilen kişi: ", tahmin_isim)
@@ -49,8 +45,8 @@ try:
 except Exception as e:
     print("Bir hata oluştu:", e)
     
-import speech_recognition as sr
 from pydub import AudioSegment
+from transcription import transcribe_file
 
 
 # MP3 dosyasını WAV formatına dönüştürme fonksiyonu
@@ -60,16 +56,8 @@ def convert_mp3_to_wav(mp3_file_path, wav_file_path):
 
 # Ses dosyasını yazıya dökme fonksiyonu
 def transcribe_audio(audio_file_path):
-    recognizer = sr.Recognizer()
-    with sr.AudioFile(audio_file_path) as source:
-        audio = recognizer.record(source)
-    try:
-        transcript = recognizer.recognize_google(audio, language="tr-TR")
-        return transcript
-    except sr.UnknownValueError:
-        return "Could not understand audio"
-    except sr.RequestError as e:
-        return f"Could not request results; {e}"
+    # Arka uç transcription.VARSAYILAN_ARKA_UC ile seçilir (çevrimdışı için "vosk")
+    return transcribe_file(audio_file_path)
 
 kelimeler = []
 
@@ -77,6 +65,10 @@ if __name__ == "__main__":
     # Kaydedilen WAV dosyasının yolu
     wav_file_path = r'C:\Users\Lenovo\Desktop\123\kayit.wav'  # Projeye uygun dosya yolu
 
+    # Arka plandaki kayıt yazma işleminin bitmesini bekle
+    if kayit_thread is not None:
+        kayit_thread.join()
+
     # WAV dosyasını yazıya dökme
     transcript = transcribe_audio(wav_file_path)
     
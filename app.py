@@ -1,27 +1,62 @@
-from flask import Flask, render_template, jsonify, render_template_string
-import tkinter as tk
-from UserInterface import AudioRecorderUI
-import threading
-import numpy as np
+import json
+import os
+import base64
+from flask import Flask, render_template, jsonify, render_template_string, request, Response, g
+from recorder import AudioRecorder, MODEL_YOLU
+from text_analysis import EmotionAnalyzer, TopicAnalyzer
+from sessions import SessionManager, SessionLimitReached
 from sonar_dashboard import SonarDashboard
+from model_registry import registry
+from jobs import JobManager, JobQueueFull
+from ingest import UploadStream, ingest_wav
+from transcription import get_backend, ARKA_UC_DEGISKENI, VARSAYILAN_ARKA_UC
 
 app = Flask(__name__)
 
-# Global değişkenler
-root = tk.Tk()
-audio_recorder = AudioRecorderUI(root)
-root.withdraw()  # Tkinter penceresini gizle
+OTURUM_CEREZI = 'session_id'
 
-def update_tk():
-    while True:
-        try:
-            root.update()
-        except:
-            break
+# Analizciler durum tutmadığından tüm oturumlar aynı örnekleri paylaşır
+emotion_analyzer = EmotionAnalyzer()
+topic_analyzer = TopicAnalyzer()
 
-# Tkinter güncellemesi için thread başlat
-tk_thread = threading.Thread(target=update_tk, daemon=True)
-tk_thread.start()
+# Konuşma tanıma motoru: ağ bağlantısı olmayan sunucularda KONUSMA_TANIMA=vosk ile yerel model seçilir.
+# Motor başlangıçta bir kez yüklenir; model eksikse sunucu açık bir hata mesajıyla başlamaz.
+app.config['KONUSMA_TANIMA'] = os.environ.get(ARKA_UC_DEGISKENI, VARSAYILAN_ARKA_UC)
+transcriber = get_backend(app.config['KONUSMA_TANIMA'])
+
+def yeni_kayitci(gecici_klasor):
+    # Her oturumun kaydı kendi geçici klasöründeki dosyalara yazılır
+    return AudioRecorder(
+        kayit_yolu=os.path.join(gecici_klasor, "kayit.wav"),
+        pcm_yolu=os.path.join(gecici_klasor, "kayit1_pcm.wav"),
+        emotion_analyzer=emotion_analyzer,
+        topic_analyzer=topic_analyzer,
+        transcriber=transcriber
+    )
+
+# Her web istemcisi kendi kayıt durumuna sahiptir; boşta kalan oturumlar silinir
+sessions = SessionManager(yeni_kayitci)
+sessions.start_reaper()
+
+# Kayıt işleme istekleri sınırlı bir işçi havuzunda, istek thread'ini bloklamadan çalışır
+jobs = JobManager()
+
+def current_recorder():
+    """İsteği yapan istemcinin oturumundaki kayıt nesnesini döndürür"""
+    session_id, recorder = sessions.get_or_create(request.cookies.get(OTURUM_CEREZI))
+    g.session_id = session_id
+    return recorder
+
+@app.after_request
+def set_session_cookie(response):
+    session_id = g.get('session_id')
+    if session_id and request.cookies.get(OTURUM_CEREZI) != session_id:
+        response.set_cookie(OTURUM_CEREZI, session_id, httponly=True, samesite='Lax')
+    return response
+
+@app.errorhandler(SessionLimitReached)
+def session_limit(e):
+    return jsonify({"status": "error", "message": str(e)}), 503
 
 @app.route('/')
 def index():
@@ -29,6 +64,7 @@ def index():
 
 @app.route('/start_recording', methods=['POST'])
 def start_recording():
+    audio_recorder = current_recorder()
     try:
         audio_recorder.start_recording()
         return jsonify({"status": "success", "message": "Kayıt başlatıldı"})
@@ -38,6 +74,7 @@ def start_recording():
 
 @app.route('/stop_recording', methods=['POST'])
 def stop_recording():
+    audio_recorder = current_recorder()
     try:
         success = audio_recorder.stop_recording()
         if success:
@@ -59,33 +96,190 @@ def stop_recording():
 
 @app.route('/process_recording', methods=['POST'])
 def process_recording():
+    audio_recorder = current_recorder()
+    # İş, kuyruğa eklendiği andaki kaydın kopyasıyla çalışır; yeni kayıt sonucu etkilemez
+    snapshot = audio_recorder.snapshot()
+    if snapshot is None:
+        return jsonify({"status": "error", "message": f"{audio_recorder.pcm_yolu} bulunamadı!"})
+    try:
+        job_id = jobs.submit(audio_recorder.process_recording, snapshot=snapshot)
+    except JobQueueFull as e:
+        return jsonify({"status": "error", "message": str(e)}), 503
+
+    # Eski istemciler için ?wait=1 ile sonuç aynı istekte beklenebilir
+    if request.args.get('wait'):
+        job = jobs.wait(job_id)
+        if job["status"] == "error":
+            return jsonify({"status": "error", "message": job["error"]})
+        return jsonify(job["result"])
+
+    return jsonify({
+        "status": "accepted",
+        "job_id": job_id,
+        "status_url": f"/jobs/{job_id}",
+        "events_url": f"/jobs/{job_id}/events"
+    }), 202
+
+@app.route('/jobs/<job_id>', methods=['GET'])
+def job_status(job_id):
+    # İşin durumu ve o ana kadar biten aşamaların sonuçları
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({"status": "error", "message": "İş bulunamadı"}), 404
+    return jsonify(job)
+
+@app.route('/jobs/<job_id>/events', methods=['GET'])
+def job_events(job_id):
+    # Server-sent events: her aşama bittiğinde işin güncel hali gönderilir
+    if jobs.get(job_id) is None:
+        return jsonify({"status": "error", "message": "İş bulunamadı"}), 404
+
+    def stream():
+        for job in jobs.events(job_id, timeout=300):
+            yield f"data: {json.dumps(job, ensure_ascii=False)}\n\n"
+
+    return Response(stream(), mimetype='text/event-stream', headers={'Cache-Control': 'no-cache'})
+
+def _isleme_baslat(audio_recorder):
+    # Yüklenen kayıt işleme kuyruğuna eklenir, istemci sonucu /jobs/<id> ile izler
+    snapshot = audio_recorder.snapshot()
+    if snapshot is None:
+        return {"status": "error", "message": "İşlenecek kayıt bulunamadı"}
+    try:
+        job_id = jobs.submit(audio_recorder.process_recording, snapshot=snapshot)
+    except JobQueueFull as e:
+        return {"status": "error", "message": str(e)}
+    return {"job_id": job_id, "status_url": f"/jobs/{job_id}", "events_url": f"/jobs/{job_id}/events"}
+
+@app.route('/upload/start', methods=['POST'])
+def upload_start():
+    # Tarayıcıdan ham PCM akışı başlatılır: {"sr": 48000, "format": "s16le" | "f32le", "channels": 1}
+    audio_recorder = current_recorder()
+    ayarlar = request.get_json(silent=True) or {}
     try:
-        results = audio_recorder.process_recording()
-        return jsonify(results)
+        audio_recorder.upload_stream = UploadStream(
+            audio_recorder,
+            sr=ayarlar.get("sr", audio_recorder.saniye_basina_ornek),
+            sample_format=ayarlar.get("format", "s16le"),
+            channels=ayarlar.get("channels", 1)
+        )
+        return jsonify({"status": "success", "message": "Yükleme başlatıldı"})
     except Exception as e:
-        print(f"İşleme hatası: {str(e)}")
+        print(f"Yükleme başlatma hatası: {str(e)}")
+        return jsonify({"status": "error", "message": str(e)}), 400
+
+@app.route('/upload/chunk', methods=['POST'])
+def upload_chunk():
+    # İstek gövdesi ham PCM baytlarıdır; parçalar sırayla gönderilmelidir
+    audio_recorder = current_recorder()
+    stream = audio_recorder.upload_stream
+    if stream is None:
+        return jsonify({"status": "error", "message": "Önce /upload/start çağrılmalı"}), 409
+    try:
+        kabul = stream.write(request.get_data(cache=False))
+        return jsonify({
+            "status": "success" if kabul else "full",
+            "seconds": round(stream.received / stream.sr, 2)
+        })
+    except Exception as e:
+        print(f"Yükleme hatası: {str(e)}")
+        return jsonify({"status": "error", "message": str(e)}), 400
+
+@app.route('/upload/finish', methods=['POST'])
+def upload_finish():
+    # Akış kapatılır; ?process=1 verilirse kayıt hemen işleme kuyruğuna eklenir
+    audio_recorder = current_recorder()
+    stream = audio_recorder.upload_stream
+    if stream is None:
+        return jsonify({"status": "error", "message": "Devam eden yükleme yok"}), 409
+    audio_recorder.upload_stream = None
+    try:
+        if not stream.finish():
+            return jsonify({"status": "error", "message": "Yüklenen ses bulunamadı"})
+        sonuc = {"status": "success", "truncated": stream.truncated}
+        if request.args.get('process'):
+            sonuc.update(_isleme_baslat(audio_recorder))
+        return jsonify(sonuc)
+    except Exception as e:
+        print(f"Yükleme bitirme hatası: {str(e)}")
         return jsonify({"status": "error", "message": str(e)})
 
+@app.route('/upload', methods=['POST'])
+def upload_file():
+    # Tek seferde tam bir WAV dosyası (form alanı "audio" ya da ham gövde) yüklenip işlenir
+    audio_recorder = current_recorder()
+    dosya = request.files.get('audio')
+    veri = dosya.read() if dosya is not None else request.get_data(cache=False)
+    try:
+        var, kesildi = ingest_wav(audio_recorder, veri)
+        if not var:
+            return jsonify({"status": "error", "message": "Yüklenen ses bulunamadı"})
+        return jsonify(dict({"status": "success", "truncated": kesildi}, **_isleme_baslat(audio_recorder)))
+    except Exception as e:
+        print(f"Yükleme hatası: {str(e)}")
+        return jsonify({"status": "error", "message": str(e)}), 400
+
 @app.route('/get_visualization', methods=['GET'])
 def get_visualization():
+    audio_recorder = current_recorder()
     try:
-        # Ses ve histogram verilerini al
-        if len(audio_recorder.frames) > 0:
-            audio_data = np.concatenate(audio_recorder.frames, axis=0)
-            
-            # Base64 formatında görüntüleri döndür
-            signal_img = audio_recorder.get_signal_image()
-            histogram_img = audio_recorder.get_histogram_image()
-            
-            return jsonify({
-                "status": "success",
-                "signal": signal_img,
-                "histogram": histogram_img
-            })
+        # Yeni ses gelmediyse görüntüler önbellekten gelir; istemci aynı ETag'i gönderirse gövde hiç gönderilmez
+        signal_png, signal_etag = audio_recorder.visualizer.signal_png()
+        histogram_png, histogram_etag = audio_recorder.visualizer.histogram_png()
+        if signal_png is None:
+            return jsonify({"status": "error", "message": "Görselleştirilecek kayıt yok"})
+
+        etag = f"{signal_etag}-{histogram_etag}"
+        if request.if_none_match.contains(etag):
+            return Response(status=304, headers={'ETag': f'"{etag}"'})
+
+        response = jsonify({
+            "status": "success",
+            "signal": base64.b64encode(signal_png).decode('utf-8'),
+            "histogram": base64.b64encode(histogram_png).decode('utf-8')
+        })
+        response.set_etag(etag)
+        return response
     except Exception as e:
         print(f"Görselleştirme hatası: {str(e)}")
         return jsonify({"status": "error", "message": str(e)})
 
+@app.route('/visualization/<name>.png', methods=['GET'])
+def visualization_image(name):
+    # Görüntüler doğrudan PNG olarak da alınabilir (<img src> için base64'e gerek kalmaz)
+    audio_recorder = current_recorder()
+    renderers = {"signal": audio_recorder.visualizer.signal_png, "histogram": audio_recorder.visualizer.histogram_png}
+    if name not in renderers:
+        return jsonify({"status": "error", "message": "Bilinmeyen görüntü"}), 404
+    png, etag = renderers[name]()
+    if png is None:
+        return jsonify({"status": "error", "message": "Görselleştirilecek kayıt yok"}), 404
+    response = Response(png, mimetype='image/png', headers={'Cache-Control': 'no-cache'})
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+@app.route('/live_speaker', methods=['GET'])
+def live_speaker():
+    # Kayıt sürerken en son canlı tahmini döndürür; istemci bunu periyodik olarak sorgular
+    audio_recorder = current_recorder()
+    result = audio_recorder.get_live_result()
+    return jsonify({
+        "status": "success",
+        "recording": audio_recorder.is_recording,
+        "result": result
+    })
+
+@app.route('/reload_model', methods=['POST'])
+def reload_model():
+    # Model dosyası değiştiğinde bir sonraki istekte zaten otomatik yüklenir,
+    # bu uç nokta yeniden yüklemeyi hemen zorlamak için kullanılır
+    try:
+        _, sinif_isimleri = registry.reload(MODEL_YOLU)
+        return jsonify({"status": "success", "classes": sinif_isimleri, "models": registry.info()})
+    except Exception as e:
+        print(f"Model yükleme hatası: {str(e)}")
+        return jsonify({"status": "error", "message": str(e)})
+
 @app.route('/sonar-dashboard')
 def show_sonar_dashboard():
     try:
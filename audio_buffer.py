@@ -0,0 +1,76 @@
+import numpy as np
+
+
+class AudioRingBuffer:
+    """Kayıt için bir kez ayrılan, tek yazıcılı ve kilitsiz halka tampon
+
+    Ses callback'i tek yazıcıdır; yazma konumu veri kopyalandıktan sonra
+    güncellendiği için okuyucular her zaman tamamlanmış örnekleri görür.
+    """
+
+    def __init__(self, capacity, channels=1, dtype=np.float32):
+        self.capacity = capacity
+        self._data = np.zeros((capacity, channels), dtype=dtype)
+        self._written = 0  # Başlangıçtan beri yazılan toplam örnek sayısı
+        self.blocks = 0  # Yazılan blok sayısı
+        self.generation = 0  # Her temizlemede artar; önbellekler yeni kaydı bununla ayırt eder
+
+    def __len__(self):
+        return min(self._written, self.capacity)
+
+    @property
+    def written(self):
+        return self._written
+
+    @property
+    def full(self):
+        return self._written >= self.capacity
+
+    def clear(self):
+        self._written = 0
+        self.blocks = 0
+        self.generation += 1
+
+    def write(self, block):
+        """Bloğu tampona kopyalar; kapasite aşılırsa en eski örneklerin üzerine yazar"""
+        block = block.reshape(len(block), -1)[-self.capacity:]
+        n = len(block)
+        pos = self._written % self.capacity
+        first = min(n, self.capacity - pos)
+        self._data[pos:pos + first] = block[:first]
+        if first < n:
+            self._data[:n - first] = block[first:]
+        # Yazma konumu en son yayınlanır
+        self._written += n
+        self.blocks += 1
+
+    def view(self):
+        """Kaydedilen örnekleri zaman sırasıyla döndürür; tampon dönmediyse kopyasız görünümdür"""
+        written = self._written
+        if written <= self.capacity:
+            return self._data[:written]
+        pos = written % self.capacity
+        return np.concatenate((self._data[pos:], self._data[:pos]))
+
+    def latest(self, n):
+        """Son n örneği döndürür; tampon sınırından geçmiyorsa kopyasız görünümdür"""
+        written = self._written
+        n = min(n, written, self.capacity)
+        end = written % self.capacity or (self.capacity if written else 0)
+        if n <= end:
+            return self._data[end - n:end]
+        return np.concatenate((self._data[self.capacity - (n - end):], self._data[:end]))
+
+    def span(self, start, end):
+        """Kayıt başından itibaren [start, end) aralığındaki örnekleri döndürür
+
+        Aralık hâlâ tamponda olmalıdır (end - start <= kapasite ve üzerine yazılmamış).
+        """
+        if start < self._written - self.capacity or end > self._written or start > end:
+            raise IndexError("İstenen aralık tamponda değil")
+        lo, hi = start % self.capacity, end % self.capacity
+        if end - start == 0:
+            return self._data[:0]
+        if lo < hi or hi == 0:
+            return self._data[lo:hi or self.capacity]
+        return np.concatenate((self._data[lo:], self._data[:hi]))
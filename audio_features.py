@@ -0,0 +1,95 @@
+import threading
+import numpy as np
+import librosa
+import scipy.io.wavfile as wav
+
+# Modelin eğitildiği özellik ayarları
+ORNEKLEME_HIZI = 44100
+N_MFCC = 128
+N_FFT = 2048
+HOP_LENGTH = 512
+
+DIGER = "Diğer"  # Modelin sınıflarından hiçbirine eşlenemeyen tahminler
+
+
+def to_mono(signal):
+    """sd.InputStream çıktısını (N, 1) tek boyutlu float32 diziye çevirir"""
+    signal = np.asarray(signal, dtype=np.float32)
+    if signal.ndim > 1:
+        signal = signal.mean(axis=1)
+    return signal
+
+
+def to_pcm16(signal):
+    """Float32 sinyali [-1, 1] aralığında 16 bit PCM'e çevirir"""
+    return (np.clip(to_mono(signal), -1.0, 1.0) * 32767).astype(np.int16)
+
+
+def mfcc_vector(signal, sr=ORNEKLEME_HIZI):
+    """Bellekteki sinyalden ortalama MFCC vektörünü çıkarır"""
+    mfcc = librosa.feature.mfcc(y=to_mono(signal), sr=sr, n_mfcc=N_MFCC)
+    return np.mean(mfcc.T, axis=0)
+
+
+def prediction_indices(model, predictions, class_names):
+    """Model tahminlerini class_names içindeki sıralara çevirir; eşlenemeyenler len(class_names) olur
+
+    class_names model.classes_ ile aynı sıradadır (save_model bunu denetler); tahmin
+    classes_ içindeki konumuna eşlenir. classes_ taşımayan eski modellerde tamsayı
+    tahminler doğrudan sıra kabul edilir.
+    """
+    predictions = np.asarray(predictions)
+    diger = len(class_names)
+    classes = getattr(model, "classes_", None)
+    if classes is not None:
+        konum = {deger: i for i, deger in enumerate(np.asarray(classes).tolist())}
+        values, inverse = np.unique(predictions, return_inverse=True)
+        lookup = np.array([konum.get(deger, -1) for deger in values.tolist()], dtype=np.int64)
+        indices = lookup[inverse.reshape(-1)]
+    elif np.issubdtype(predictions.dtype, np.integer):
+        indices = predictions.astype(np.int64).reshape(-1)
+    else:
+        return np.full(predictions.size, diger, dtype=np.int64)
+    indices[(indices < 0) | (indices >= diger)] = diger
+    return indices
+
+
+def identify_speaker(signal, model, class_names, sr=ORNEKLEME_HIZI):
+    """Dosyaya yazmadan, doğrudan NumPy tamponu üzerinden konuşmacı tahmini yapar"""
+    mfcc = mfcc_vector(signal, sr)
+    tahmin_indeksi = prediction_indices(model, model.predict(mfcc.reshape(1, -1)), class_names)[0]
+    return class_names[tahmin_indeksi] if tahmin_indeksi < len(class_names) else DIGER
+
+
+def save_wav_async(signal, float_path=None, pcm_path=None, sr=ORNEKLEME_HIZI):
+    """Kaydı arka planda diske yazar; tahmin akışını bekletmez"""
+    def write():
+        try:
+            if float_path:
+                wav.write(float_path, sr, to_mono(signal))
+            if pcm_path:
+                wav.write(pcm_path, sr, to_pcm16(signal))
+        except Exception as e:
+            print(f"Kayıt kaydetme hatası: {str(e)}")
+
+    thread = threading.Thread(target=write)
+    thread.start()
+    return thread
+
+
+def mfcc_from_signal(y, sr, n_mfcc=N_MFCC, n_fft=N_FFT, hop_length=HOP_LENGTH,
+                     frame_length_ms=None, frame_stride_ms=None):
+    """Bellekteki sinyalden tam çözünürlüklü (n_mfcc x T) MFCC matrisini çıkarır"""
+    # Pencere/adım milisaniye olarak verildiyse örnek sayısına çevir
+    if frame_length_ms is not None:
+        n_fft = int(frame_length_ms * sr / 1000)
+    if frame_stride_ms is not None:
+        hop_length = int(frame_stride_ms * sr / 1000)
+
+    return librosa.feature.mfcc(y=to_mono(y), sr=sr, n_mfcc=n_mfcc, n_fft=n_fft, hop_length=hop_length)
+
+
+def mfcc_from_file(path, sr=None, **params):
+    """WAV dosyasından tam çözünürlüklü (n_mfcc x T) MFCC matrisini çıkarır"""
+    y, sr = librosa.load(path, sr=sr)
+    return mfcc_from_signal(y, sr, **params)
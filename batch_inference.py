@@ -0,0 +1,109 @@
+import os
+import csv
+import time
+import numpy as np
+import librosa
+from concurrent.futures import ProcessPoolExecutor
+from audio_features import ORNEKLEME_HIZI, DIGER, mfcc_vector, prediction_indices
+from model_registry import registry
+
+# Toplu puanlama için arşiv ve çıktı yolları
+arsiv_klasoru = r'C:\Users\Lenovo\Desktop\123\Arsiv'
+cikti_dosyasi = r'C:\Users\Lenovo\Desktop\123\arsiv_tahminleri.csv'
+model_kayit_yolu = 'model-kerem-emir.pkl'
+
+# Belleği sınırlamak için her seferde işlenecek kayıt sayısı
+PARTI_BOYUTU = 512
+ISCI_SAYISI = os.cpu_count() or 1
+
+
+def _item_features(args):
+    """Tek bir yol veya dizi için ortalama MFCC vektörünü ve süresini döndürür"""
+    item, sr = args
+    start = time.perf_counter()
+    try:
+        if isinstance(item, np.ndarray):
+            y = item
+        else:
+            y, sr = librosa.load(item, sr=sr)
+        return mfcc_vector(y, sr), time.perf_counter() - start, None
+    except Exception as e:
+        return None, time.perf_counter() - start, str(e)
+
+
+def predict_batch(model, items, class_names, sr=ORNEKLEME_HIZI, workers=1):
+    """Kayıtların özelliklerini paralel çıkarır ve tek bir toplu tahmin çağrısı yapar"""
+    tasks = [(item, sr) for item in items]
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            features = list(pool.map(_item_features, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
+    else:
+        features = [_item_features(task) for task in tasks]
+
+    results = [
+        {
+            "kaynak": item if isinstance(item, str) else i,
+            "konusmaci": None,
+            "olasiliklar": {},
+            "ozellik_suresi": elapsed,
+            "hata": error
+        }
+        for i, (item, (_, elapsed, error)) in enumerate(zip(items, features))
+    ]
+    valid = [i for i, (vector, _, _) in enumerate(features) if vector is not None]
+    timing = {"ozellik": sum(elapsed for _, elapsed, _ in features), "tahmin": 0.0}
+    if not valid:
+        return results, timing
+
+    # Tüm geçerli kayıtlar tek matriste toplanır
+    X = np.vstack([features[i][0] for i in valid])
+    start = time.perf_counter()
+    if hasattr(model, "predict_proba"):
+        probabilities = model.predict_proba(X)
+        predictions = np.asarray(model.classes_)[np.argmax(probabilities, axis=1)]
+    else:
+        predictions = model.predict(X)
+        probabilities = None
+    timing["tahmin"] = time.perf_counter() - start
+
+    # Tahminler ve olasılık sütunları (classes_ sırasında) isimlere model.classes_ üzerinden eşlenir
+    names = list(class_names) + [DIGER]
+    indices = prediction_indices(model, predictions, class_names)
+    columns = prediction_indices(model, model.classes_, class_names) if probabilities is not None else None
+    for row, i in enumerate(valid):
+        results[i]["konusmaci"] = names[indices[row]]
+        if probabilities is not None:
+            olasiliklar = {}
+            for c, p in zip(columns, probabilities[row]):
+                olasiliklar[names[c]] = olasiliklar.get(names[c], 0.0) + float(p)
+            results[i]["olasiliklar"] = {isim: round(p, 4) for isim, p in olasiliklar.items()}
+    return results, timing
+
+
+if __name__ == "__main__":
+    model, sinif_isimleri = registry.get(model_kayit_yolu)
+
+    dosyalar = sorted(
+        os.path.join(kok, dosya)
+        for kok, _, dosya_listesi in os.walk(arsiv_klasoru)
+        for dosya in dosya_listesi if dosya.endswith('.wav')
+    )
+    print(f"{len(dosyalar)} kayıt puanlanacak...")
+
+    with open(cikti_dosyasi, 'w', newline='', encoding='utf-8') as f:
+        yazici = csv.writer(f)
+        yazici.writerow(["kaynak", "konusmaci"] + [f"olasilik_{isim}" for isim in sinif_isimleri] + ["hata"])
+
+        for baslangic in range(0, len(dosyalar), PARTI_BOYUTU):
+            parti = dosyalar[baslangic:baslangic + PARTI_BOYUTU]
+            sonuclar, sure = predict_batch(model, parti, sinif_isimleri, workers=ISCI_SAYISI)
+            for sonuc in sonuclar:
+                yazici.writerow(
+                    [sonuc["kaynak"], sonuc["konusmaci"]]
+                    + [sonuc["olasiliklar"].get(isim, "") for isim in sinif_isimleri]
+                    + [sonuc["hata"] or ""]
+                )
+            print(f"[{baslangic + len(parti)}/{len(dosyalar)}] özellik: {sure['ozellik']:.2f} sn, "
+                  f"tahmin: {sure['tahmin'] * 1000:.1f} ms")
+
+    print(f"Tahminler kaydedildi: {cikti_dosyasi}")
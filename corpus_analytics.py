@@ -0,0 +1,201 @@
+import numpy as np
+from scipy import sparse
+from lexicon import tokenize
+from polarity import lexicon as polarity_lexicon
+from text_analysis import EmotionAnalyzer, TopicAnalyzer
+
+# Tekil analizle aynı şekilde sonuçsuz sayılan metin
+ANLASILAMADI = "Ses anlaşılamadı"
+BELIRSIZ = "belirsiz"
+
+
+def _label_matrix(keyword_labels, labels):
+    """Anahtar kelime x etiket üyelik matrisi; bir kelime birden fazla etikete ait olabilir"""
+    column = {label: j for j, label in enumerate(labels)}
+    rows, cols = [], []
+    for i, keyword_label_list in enumerate(keyword_labels):
+        for label in keyword_label_list:
+            rows.append(i)
+            cols.append(column[label])
+    data = np.ones(len(rows), dtype=np.int32)
+    return sparse.csr_matrix((data, (rows, cols)), shape=(len(keyword_labels), len(labels)))
+
+
+def _percentages(counts):
+    """Satır başına sayıları toplamı 100 olan yüzdelere çevirir; eşleşmesi olmayan satırlar 0 kalır"""
+    totals = counts.sum(axis=1, keepdims=True)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        pct = np.where(totals > 0, counts / totals * 100, 0.0)
+    return np.round(pct, 1)
+
+
+class CorpusAnalysis:
+    """Toplu analiz sonucu: her satır bir metin, her sütun bir duygu veya konu"""
+
+    def __init__(self, emotion_labels, emotions, dominant_emotion, confidence,
+                 topic_labels, topic_counts, topic_scores, dominant_topic,
+                 emotion_keywords, topic_keywords):
+        self.emotion_labels = emotion_labels
+        self.emotions = emotions  # (metin, duygu) yüzdeleri
+        self.dominant_emotion = dominant_emotion
+        self.confidence = confidence
+        self.topic_labels = topic_labels
+        self.topic_counts = topic_counts  # (metin, konu) eşleşme sayıları
+        self.topic_scores = topic_scores  # (metin, konu) yüzdeleri
+        self.dominant_topic = dominant_topic  # Eşleşme yoksa None
+        self.emotion_keywords = emotion_keywords  # (metin, duygu anahtar kelimesi) seyrek sayım matrisi
+        self.topic_keywords = topic_keywords  # (metin, konu ifadesi) seyrek sayım matrisi
+
+    def __len__(self):
+        return len(self.dominant_emotion)
+
+    def records(self):
+        """Her metin için sözlük listesi döndürür (JSON'a yazmaya uygun)"""
+        return [
+            {
+                "baskın_duygu": self.dominant_emotion[i],
+                "güven_skoru": float(self.confidence[i]),
+                "duygular": dict(zip(self.emotion_labels, self.emotions[i].tolist())),
+                "baskın_konu": self.dominant_topic[i],
+                "konular": {
+                    label: score
+                    for label, score in zip(self.topic_labels, self.topic_scores[i].tolist()) if score > 0
+                },
+            }
+            for i in range(len(self))
+        ]
+
+    def to_dataframe(self):
+        """Sonuçları pandas tablosu olarak döndürür (pandas kurulu olmalıdır)"""
+        try:
+            import pandas as pd
+        except ImportError:
+            raise RuntimeError("Tablo çıktısı için 'pandas' paketi kurulu olmalıdır (pip install pandas)")
+        table = {"baskın_duygu": self.dominant_emotion, "güven_skoru": self.confidence,
+                 "baskın_konu": self.dominant_topic}
+        for j, label in enumerate(self.emotion_labels):
+            table[f"duygu_{label}"] = self.emotions[:, j]
+        for j, label in enumerate(self.topic_labels):
+            table[f"konu_{label}"] = self.topic_scores[:, j]
+        return pd.DataFrame(table)
+
+
+class CorpusAnalyzer:
+    """Çok sayıda kayıt metnini tek seferde duygu ve konu açısından skorlar
+
+    Her metin bir kez kelimelere bölünür ve iki sözlüğe karşı seyrek bir
+    (metin x anahtar kelime) sayım matrisi kurulur. Duygu yüzdeleri ve konu
+    skorları bu matrislerin etiket üyelik matrisleriyle çarpımından hesaplanır.
+    Sonuçlar tekil analyze_emotion / analyze_topics ile aynıdır; duygu sözlüğünde
+    eşleşmesi olmayan metinler için yalnızca çevrimdışı kutupluluk sözlüğü kullanılır.
+    """
+
+    def __init__(self, emotion_analyzer=None, topic_analyzer=None):
+        self.emotion_analyzer = emotion_analyzer or EmotionAnalyzer()
+        self.topic_analyzer = topic_analyzer or TopicAnalyzer()
+
+        # Duygu anahtar kelimeleri (kök dizini) ve konu ifadeleri (otomat) sütunlara bir kez eşlenir
+        self._emotion_index = self.emotion_analyzer.emotion_index
+        self.emotion_keywords = self._emotion_index.keywords
+        self._emotion_column = {keyword: j for j, keyword in enumerate(self.emotion_keywords)}
+        self._emotion_map = _label_matrix(
+            [self._emotion_index.lookup(keyword)[1] for keyword in self.emotion_keywords],
+            self._emotion_index.labels
+        )
+
+        self._topic_matcher = self.topic_analyzer.topic_matcher
+        self.topic_keywords = [ifade for ifade, _ in self._topic_matcher.patterns]
+        self.topic_labels = self._topic_matcher.labels
+        self._topic_map = _label_matrix([labels for _, labels in self._topic_matcher.patterns], self.topic_labels)
+        # Birden fazla konuda geçen ifadelerin sütunları
+        self._shared = np.array([len(labels) > 1 for _, labels in self._topic_matcher.patterns], dtype=bool)
+
+        # Yedek analiz "üzgün" sütununu da üretir; tablo her iki yolun sütunlarını içerir
+        self.emotion_labels = list(self._emotion_index.labels)
+        for label in EmotionAnalyzer.polarity_percentages(0.0, 0.0):
+            if label not in self.emotion_labels:
+                self.emotion_labels.append(label)
+
+    def keyword_matrices(self, texts):
+        """(metin x duygu anahtar kelimesi, metin x konu ifadesi) seyrek sayım matrislerini döndürür"""
+        lookup = self._emotion_index.lookup
+        emotion_column = self._emotion_column
+        match_ids = self._topic_matcher.match_ids
+        e_rows, e_cols, t_rows, t_cols = [], [], [], []
+        for i, text in enumerate(texts):
+            if not text or text == ANLASILAMADI:
+                continue
+            words = tokenize(text)
+            for word in words:
+                hit = lookup(word)
+                if hit is not None:
+                    e_rows.append(i)
+                    e_cols.append(emotion_column[hit[0]])
+            for pid in match_ids(words):
+                t_rows.append(i)
+                t_cols.append(pid)
+
+        n = len(texts)
+        # Aynı (satır, sütun) çiftleri csr'ye dönüşürken toplanır
+        emotion_kw = sparse.csr_matrix(
+            (np.ones(len(e_rows), dtype=np.int32), (e_rows, e_cols)), shape=(n, len(self.emotion_keywords))
+        )
+        topic_kw = sparse.csr_matrix(
+            (np.ones(len(t_rows), dtype=np.int32), (t_rows, t_cols)), shape=(n, len(self.topic_keywords))
+        )
+        return emotion_kw, topic_kw
+
+    def analyze(self, texts):
+        """Metin listesini analiz eder ve CorpusAnalysis döndürür"""
+        texts = list(texts)
+        n = len(texts)
+        emotion_kw, topic_kw = self.keyword_matrices(texts)
+
+        # Duygular: sözlükte eşleşen metinler matris çarpımıyla
+        lexicon_counts = (emotion_kw @ self._emotion_map).toarray()
+        emotions = np.zeros((n, len(self.emotion_labels)))
+        emotions[:, :lexicon_counts.shape[1]] = _percentages(lexicon_counts)
+        matched = lexicon_counts.sum(axis=1) > 0
+
+        # Baskın duygu: tekil analizdeki gibi eşitlikte sözlük sırasındaki ilk duygu
+        order = np.argmax(emotions[:, :lexicon_counts.shape[1]], axis=1)
+        dominant = np.array([self.emotion_labels[j] for j in order], dtype=object)
+        confidence = emotions[np.arange(n), order] / 100
+
+        # Eşleşmesi olmayan dolu metinler çevrimdışı kutupluluk sözlüğüyle (aynı metinler bir kez) skorlanır
+        empty = np.array([not text or text == ANLASILAMADI for text in texts], dtype=bool)
+        fallback = np.flatnonzero(~matched & ~empty)
+        if len(fallback):
+            column = {label: j for j, label in enumerate(self.emotion_labels)}
+            scores = polarity_lexicon.analyze_batch([texts[i] for i in fallback])
+            for i, (polarity, subjectivity) in zip(fallback, scores):
+                pct = EmotionAnalyzer.polarity_percentages(polarity, subjectivity)
+                for label, value in pct.items():
+                    emotions[i, column[label]] = value
+                best = max(pct.items(), key=lambda x: x[1])
+                dominant[i] = best[0]
+                confidence[i] = best[1] / 100
+
+        dominant[empty] = BELIRSIZ
+        confidence[empty] = 0.0
+
+        # Konular: her konunun payı, metindeki tüm konu eşleşmelerine oranıdır
+        topic_counts = (topic_kw @ self._topic_map).toarray()
+        topic_scores = _percentages(topic_counts)
+        totals = topic_counts.sum(axis=1, keepdims=True)
+        has_topic = totals[:, 0] > 0
+        # Sıralama tekil analizle aynıdır: önce eşleşme sayısı, eşitlikte başka konuyla ortak
+        # kelimesi olmayan konu (ilk skoru 100), sonra sözlük sırası
+        shared = (topic_kw[:, self._shared] @ self._topic_map[self._shared]).toarray() > 0
+        with np.errstate(invalid="ignore", divide="ignore"):
+            first_score = np.where(shared, np.round(topic_counts / totals * 100, 1), 100.0)
+        top = np.argmax(topic_counts * 1000 + first_score, axis=1)
+        dominant_topic = np.array(
+            [self.topic_labels[j] if ok else None for j, ok in zip(top, has_topic)], dtype=object
+        )
+
+        return CorpusAnalysis(
+            self.emotion_labels, emotions, dominant, confidence,
+            self.topic_labels, topic_counts, topic_scores, dominant_topic,
+            emotion_kw, topic_kw
+        )
@@ -0,0 +1,115 @@
+import numpy as np
+import librosa
+from audio_features import ORNEKLEME_HIZI, N_MFCC, N_FFT, HOP_LENGTH, DIGER, to_mono, prediction_indices
+
+# Varsayılan pencere ayarları (saniye)
+PENCERE_SANIYE = 2.0
+ADIM_SANIYE = 0.5
+
+# Bu enerji oranının altındaki pencereler sessizlik sayılır
+SESSIZLIK_ORANI = 0.05
+
+
+def window_features(signal, sr=ORNEKLEME_HIZI, window_s=PENCERE_SANIYE, hop_s=ADIM_SANIYE):
+    """Tüm sinyal için MFCC'yi bir kez hesaplar ve kayan pencerelerin ortalama vektörlerini döndürür"""
+    signal = to_mono(signal)
+    if signal.size == 0:
+        return np.empty((0, N_MFCC), dtype=np.float32), np.empty(0), np.empty(0)
+
+    mfcc = librosa.feature.mfcc(y=signal, sr=sr, n_mfcc=N_MFCC, n_fft=N_FFT, hop_length=HOP_LENGTH)
+    rms = librosa.feature.rms(y=signal, frame_length=N_FFT, hop_length=HOP_LENGTH)[0]
+    n_frames = mfcc.shape[1]
+
+    # Pencere ve adım uzunluklarını frame cinsine çevir
+    window_frames = max(1, int(round(window_s * sr / HOP_LENGTH)))
+    hop_frames = max(1, int(round(hop_s * sr / HOP_LENGTH)))
+
+    if n_frames <= window_frames:
+        # Kayıt bir pencereden kısaysa tamamını tek pencere olarak kullan
+        starts = np.array([0])
+        window_frames = n_frames
+    else:
+        starts = np.arange(0, n_frames - window_frames + 1, hop_frames)
+    ends = starts + window_frames
+
+    # Kümülatif toplam ile tüm pencere ortalamalarını tek seferde hesapla
+    mfcc_cumsum = np.zeros((n_frames + 1, mfcc.shape[0]), dtype=np.float64)
+    np.cumsum(mfcc.T, axis=0, out=mfcc_cumsum[1:])
+    features = (mfcc_cumsum[ends] - mfcc_cumsum[starts]) / window_frames
+
+    rms_cumsum = np.concatenate(([0.0], np.cumsum(rms, dtype=np.float64)))
+    energy = (rms_cumsum[ends] - rms_cumsum[starts]) / window_frames
+
+    start_times = starts * HOP_LENGTH / sr
+    return features.astype(np.float32), start_times, energy
+
+
+def speaker_diarization(signal, model, class_names, sr=ORNEKLEME_HIZI,
+                        window_s=PENCERE_SANIYE, hop_s=ADIM_SANIYE, silence_ratio=SESSIZLIK_ORANI):
+    """Kayıt üzerinde kayan pencerelerle konuşmacı dağılımını çıkarır"""
+    signal = to_mono(signal)
+    speakers = list(class_names) + [DIGER]
+    features, start_times, energy = window_features(signal, sr, window_s, hop_s)
+
+    if len(features) == 0 or energy.max() <= 0:
+        return {
+            "speaker_counts": {speaker: 0 for speaker in speakers},
+            "speaker_percentages": {speaker: (100.0 if speaker == DIGER else 0.0) for speaker in speakers},
+            "windows": []
+        }
+
+    # Sessiz pencereleri konuşmacı tahmininden çıkar
+    voiced = energy >= energy.max() * silence_ratio
+
+    # Tüm pencereler için tek bir toplu tahmin; etiketler model.classes_ üzerinden isimlere eşlenir,
+    # sınıf listesinde olmayan tahminler "Diğer" sayılır
+    predictions = prediction_indices(model, model.predict(features[voiced]), class_names)
+    counts = np.bincount(predictions, minlength=len(speakers))
+    percentages = np.round(counts / counts.sum() * 100, 1)
+
+    voiced_starts = start_times[voiced]
+    window_len = min(window_s, len(signal) / sr)
+    windows = [
+        (float(start), float(start + window_len), speakers[index])
+        for start, index in zip(voiced_starts, predictions)
+    ]
+
+    return {
+        "speaker_counts": dict(zip(speakers, counts.tolist())),
+        "speaker_percentages": dict(zip(speakers, percentages.tolist())),
+        "windows": windows
+    }
+
+
+def attribute_words(words, windows):
+    """Her kelimeye, kelimenin ses aralığıyla en çok örtüşen pencerelerin konuşmacısını atar
+
+    words: {"word", "start", "end"} sözlükleri, windows: speaker_diarization'ın (başlangıç, bitiş, isim) listesi.
+    Hiçbir konuşmalı pencereyle örtüşmeyen kelimeler "Diğer" olarak işaretlenir.
+    """
+    if not words:
+        return []
+    if not windows:
+        return [dict(word, speaker=DIGER) for word in words]
+
+    names = sorted({name for _, _, name in windows})
+    name_index = {name: i for i, name in enumerate(names)}
+    window_starts = np.array([w[0] for w in windows])
+    window_ends = np.array([w[1] for w in windows])
+    window_names = np.array([name_index[w[2]] for w in windows])
+
+    word_starts = np.array([word["start"] for word in words])[:, None]
+    word_ends = np.array([word["end"] for word in words])[:, None]
+
+    # Kelime x pencere örtüşme süreleri, konuşmacı başına toplanır
+    overlap = np.clip(np.minimum(word_ends, window_ends) - np.maximum(word_starts, window_starts), 0, None)
+    per_speaker = np.zeros((len(words), len(names)))
+    for i in range(len(names)):
+        per_speaker[:, i] = overlap[:, window_names == i].sum(axis=1)
+
+    best = per_speaker.argmax(axis=1)
+    has_overlap = per_speaker.max(axis=1) > 0
+    return [
+        dict(word, speaker=names[b] if ok else DIGER)
+        for word, b, ok in zip(words, best, has_overlap)
+    ]
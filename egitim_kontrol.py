@@ -1,26 +1,12 @@
-import os
+from feature_dataset import FeatureDataset, EGITIM, TEST
 
-# Eğitim veri setini yükleme
-egitim_y = []
-egitim_dizin = r'C:\Users\Lenovo\Desktop\123\MFCC_Egitim'
+# Tek parça MFCC veri setini yükleme
+veri_seti_dizin = r'C:\Users\Lenovo\Desktop\123\MFCC_VeriSeti'
+veri_seti = FeatureDataset(veri_seti_dizin)
 
-for klasor_adı in os.listdir(egitim_dizin):
-    klasor_yolu = os.path.join(egitim_dizin, klasor_adı)
-    if os.path.isdir(klasor_yolu):
-        for dosya_adı in os.listdir(klasor_yolu):
-            if dosya_adı.endswith('.npy'):
-                egitim_y.append(klasor_adı)
-
-# Test veri setini yükleme
-test_y = []
-test_dizin = r'C:\Users\Lenovo\Desktop\123\MFCC_Test'
-
-for klasor_adı in os.listdir(test_dizin):
-    klasor_yolu = os.path.join(test_dizin, klasor_adı)
-    if os.path.isdir(klasor_yolu):
-        for dosya_adı in os.listdir(klasor_yolu):
-            if dosya_adı.endswith('.npy'):
-                test_y.append(klasor_adı)
+# Kaynak dosya sütunu kume sütununa göre eğitim/test olarak ayrılır
+egitim_y = veri_seti.sources[veri_seti.split == EGITIM]
+test_y = veri_seti.sources[veri_seti.split == TEST]
 
 # Eğitim ve test dosyalarını karşılaştırma
 egitim_dosyalar = set([str(dosya) for dosya in egitim_y])
@@ -31,4 +17,4 @@ ortak_dosyalar = egitim_dosyalar.intersection(test_dosyalar)
 if ortak_dosyalar:
     print(f"Veri sızıntısı var! Ortak dosyalar: {ortak_dosyalar}")
 else:
-    print("Eğitim ve Test veri setleri tamamen ayrı!")
\ No newline at end of file
+    print("Eğitim ve Test veri setleri tamamen ayrı!")
@@ -0,0 +1,94 @@
+import numpy as np
+
+# Piramit ayarları
+TABAN_KOVA = 16  # En ince seviyede bir kovadaki örnek sayısı
+KAT_SAYISI = 4  # Her üst seviyede kova boyu bu kadar büyür
+
+
+class EnvelopePyramid:
+    """Ses geldikçe güncellenen çok çözünürlüklü min/maks zarf piramidi
+
+    Her seviye sinyali sabit boyutlu kovalara böler ve kova başına min/maks
+    değerini tutar. Bir blok eklemek O(blok) sürer; herhangi bir aralığın
+    zarfı, kayıt uzunluğundan bağımsız olarak en fazla istenen sayıda sütunla
+    döndürülür.
+    """
+
+    def __init__(self, capacity, base=TABAN_KOVA, factor=KAT_SAYISI):
+        self.capacity = capacity
+        self.base = base
+        self.factor = factor
+        self.sizes = []
+        self.mins = []
+        self.maxs = []
+        size = base
+        while True:
+            n = -(-capacity // size)
+            self.sizes.append(size)
+            self.mins.append(np.full(n, np.inf, dtype=np.float32))
+            self.maxs.append(np.full(n, -np.inf, dtype=np.float32))
+            if n <= 1:
+                break
+            size *= factor
+        self.count = 0  # Piramide eklenmiş örnek sayısı
+
+    def reset(self):
+        for mins, maxs in zip(self.mins, self.maxs):
+            mins.fill(np.inf)
+            maxs.fill(-np.inf)
+        self.count = 0
+
+    def extend(self, samples):
+        """Yeni örnekleri ekler; yalnızca etkilenen kovalar yeniden hesaplanır"""
+        samples = np.asarray(samples, dtype=np.float32).ravel()[:self.capacity - self.count]
+        if len(samples) == 0:
+            return
+        start, end = self.count, self.count + len(samples)
+
+        # En ince seviye doğrudan örneklerden güncellenir
+        first, last = start // self.base, (end - 1) // self.base
+        offsets = np.arange(first + 1, last + 1) * self.base - start
+        idx = np.concatenate(([0], offsets))
+        new_mins = np.minimum.reduceat(samples, idx)
+        new_maxs = np.maximum.reduceat(samples, idx)
+        new_mins[0] = min(new_mins[0], self.mins[0][first])
+        new_maxs[0] = max(new_maxs[0], self.maxs[0][first])
+        self.mins[0][first:last + 1] = new_mins
+        self.maxs[0][first:last + 1] = new_maxs
+
+        # Üst seviyeler bir alttaki seviyenin değişen kovalarından türetilir
+        for level in range(1, len(self.sizes)):
+            lo = first // self.factor
+            hi = last // self.factor
+            child_lo, child_hi = lo * self.factor, min((hi + 1) * self.factor, len(self.mins[level - 1]))
+            self.mins[level][lo:hi + 1] = self._reduce(self.mins[level - 1][child_lo:child_hi], np.minimum, np.inf)
+            self.maxs[level][lo:hi + 1] = self._reduce(self.maxs[level - 1][child_lo:child_hi], np.maximum, -np.inf)
+            first, last = lo, hi
+
+        # Sayaç en son güncellenir; okuyucular yalnızca tamamlanmış kovaları kullanır
+        self.count = end
+
+    def _reduce(self, values, op, fill):
+        pad = -len(values) % self.factor
+        if pad:
+            values = np.concatenate((values, np.full(pad, fill, dtype=values.dtype)))
+        return op.reduce(values.reshape(-1, self.factor), axis=1)
+
+    def envelope(self, start=0, end=None, columns=1600):
+        """[start, end) aralığının zarfını (örnek konumları, değerler) olarak döndürür
+
+        Her kova iki nokta (min, maks) verir; sütun sayısı columns'u aşmayacak
+        en ince seviye seçilir.
+        """
+        end = self.count if end is None else min(end, self.count)
+        if end <= start:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        level = 0
+        while level + 1 < len(self.sizes) and (end - start) / self.sizes[level] > columns:
+            level += 1
+        size = self.sizes[level]
+        lo, hi = start // size, (end - 1) // size + 1
+        mins, maxs = self.mins[level][lo:hi], self.maxs[level][lo:hi]
+        positions = np.arange(lo, hi) * size
+        return np.repeat(positions, 2), np.column_stack((mins, maxs)).ravel()
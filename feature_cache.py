@@ -0,0 +1,89 @@
+import os
+import json
+import hashlib
+import numpy as np
+from audio_features import mfcc_from_file
+
+MANIFEST_ADI = '.mfcc_manifest.json'
+
+
+class FeatureCache:
+    """Dosya içeriği ve çıkarım parametrelerine göre adreslenen MFCC deposu"""
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def file_hash(path, block_size=1 << 20):
+        """Dosya içeriğinin SHA-256 özetini döndürür"""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(block_size), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def params_hash(params):
+        """Parametre sözlüğünün sıradan bağımsız özetini döndürür"""
+        encoded = json.dumps(params, sort_keys=True).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()[:16]
+
+    def key(self, path, params):
+        # Parametreler değişirse anahtar da değişir, eski kayıt kendiliğinden geçersiz olur
+        return f"{self.file_hash(path)}_{self.params_hash(params)}"
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, key[:2], key + '.npy')
+
+    def get(self, key):
+        entry = self._entry_path(key)
+        if not os.path.exists(entry):
+            return None
+        try:
+            return np.load(entry)
+        except Exception as e:
+            print(f"UYARI: Bozuk önbellek kaydı yok sayıldı: {entry}. Hata: {e}")
+            return None
+
+    def put(self, key, array):
+        entry = self._entry_path(key)
+        os.makedirs(os.path.dirname(entry), exist_ok=True)
+
+        # Yarım kalmış yazmalar okunmasın diye önce geçici dosyaya yaz
+        tmp = f"{entry}.{os.getpid()}.tmp"
+        with open(tmp, 'wb') as f:
+            np.save(f, array)
+        os.replace(tmp, entry)
+
+    def mfcc(self, path, params, key=None):
+        """Önbellekte varsa kaydı döndürür, yoksa MFCC'yi hesaplayıp saklar"""
+        if key is None:
+            key = self.key(path, params)
+        array = self.get(key)
+        hit = array is not None
+        if not hit:
+            array = mfcc_from_file(path, **params)
+            self.put(key, array)
+        return key, array, hit
+
+
+def load_manifest(folder):
+    """Hedef klasördeki .npy dosyalarının hangi anahtarla üretildiğini okur"""
+    path = os.path.join(folder, MANIFEST_ADI)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"UYARI: Manifest okunamadı, yeniden oluşturulacak: {path}. Hata: {e}")
+        return {}
+
+
+def save_manifest(folder, manifest):
+    path = os.path.join(folder, MANIFEST_ADI)
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(tmp, path)
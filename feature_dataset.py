@@ -0,0 +1,85 @@
+import os
+import json
+import numpy as np
+
+# Kume (split) sütunu değerleri
+EGITIM = 0
+TEST = 1
+
+_DOSYALAR = {
+    "features": "ozellikler.npy",
+    "labels": "etiketler.npy",
+    "sources": "kaynaklar.npy",
+    "n_frames": "kare_sayilari.npy",
+    "split": "kume.npy"
+}
+_META = "meta.json"
+
+
+def _atomic_save(path, array):
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        np.save(f, array)
+    os.replace(tmp, path)
+
+
+def write_dataset(path, features, label_names, sources, n_frames=None, split=None, params=None):
+    """Ortalama MFCC vektörlerini tek bir sütun tabanlı veri setine yazar"""
+    os.makedirs(path, exist_ok=True)
+    features = np.asarray(features, dtype=np.float32)
+    n = len(features)
+
+    # Sayısal etiketler sıralı etiket isimlerinden üretilir, isimler meta.json'da saklanır
+    classes, labels = np.unique(np.asarray(label_names, dtype=str), return_inverse=True)
+    if n_frames is None:
+        n_frames = np.zeros(n, dtype=np.int32)
+    if split is None:
+        split = np.full(n, EGITIM, dtype=np.uint8)
+
+    _atomic_save(os.path.join(path, _DOSYALAR["features"]), features.reshape(n, -1))
+    _atomic_save(os.path.join(path, _DOSYALAR["labels"]), labels.astype(np.int32))
+    _atomic_save(os.path.join(path, _DOSYALAR["sources"]), np.asarray(sources, dtype=str))
+    _atomic_save(os.path.join(path, _DOSYALAR["n_frames"]), np.asarray(n_frames, dtype=np.int32))
+    _atomic_save(os.path.join(path, _DOSYALAR["split"]), np.asarray(split, dtype=np.uint8))
+
+    with open(os.path.join(path, _META), 'w', encoding='utf-8') as f:
+        json.dump({"label_names": classes.tolist(), "params": params or {}, "count": n},
+                  f, ensure_ascii=False, indent=1)
+    return FeatureDataset(path)
+
+
+class FeatureDataset:
+    """Tek seferde bellek eşlemeli (mmap) açılan MFCC veri seti"""
+
+    def __init__(self, path, mmap_mode='r'):
+        self.path = path
+        with open(os.path.join(path, _META), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        self.label_names = np.asarray(meta["label_names"])
+        self.params = meta.get("params", {})
+
+        self.features = np.load(os.path.join(path, _DOSYALAR["features"]), mmap_mode=mmap_mode)
+        self.labels = np.load(os.path.join(path, _DOSYALAR["labels"]), mmap_mode=mmap_mode)
+        self.sources = np.load(os.path.join(path, _DOSYALAR["sources"]), mmap_mode=mmap_mode)
+        self.n_frames = np.load(os.path.join(path, _DOSYALAR["n_frames"]), mmap_mode=mmap_mode)
+        self.split = np.load(os.path.join(path, _DOSYALAR["split"]))
+
+    def __len__(self):
+        return len(self.labels)
+
+    def label_column(self):
+        """Her satır için etiket adını döndürür"""
+        return self.label_names[self.labels]
+
+    def subset(self, split):
+        """Verilen kümedeki (EGITIM/TEST) özellik ve etiketleri döndürür"""
+        mask = self.split == split
+        return self.features[mask], self.labels[mask]
+
+    def set_split(self, split):
+        """Eğitim/test ayrımını dosya kopyalamadan yalnızca kume sütununu yazarak günceller"""
+        split = np.asarray(split, dtype=np.uint8)
+        if split.shape != self.split.shape:
+            raise ValueError(f"Kume sütunu boyutu uyumsuz: {split.shape} != {self.split.shape}")
+        _atomic_save(os.path.join(self.path, _DOSYALAR["split"]), split)
+        self.split = split
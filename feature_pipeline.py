@@ -0,0 +1,109 @@
+import os
+import numpy as np
+import librosa
+from concurrent.futures import ProcessPoolExecutor
+from audio_features import mfcc_from_signal
+from feature_dataset import write_dataset, EGITIM
+from mfcc import MFCC_PARAMETRELERI, ISCI_SAYISI
+from segmenter import stream_segments, SEGMENT_SANIYE
+
+# Ham kayıtların bulunduğu dizin (kişi klasörleri altında uzun wav dosyaları)
+wav_dir = r'C:\Users\Lenovo\Desktop\123\Sesler_wav'
+
+# Parçalardan üretilen ortalama MFCC vektörlerinin yazılacağı veri seti
+veri_seti_klasoru = r'C:\Users\Lenovo\Desktop\123\MFCC_VeriSeti'
+
+# Tam çözünürlüklü MFCC matrisleri isteniyorsa kaydedileceği dizin (None = kaydetme)
+tam_mfcc_klasoru = None
+
+
+def recording_features(path, params=MFCC_PARAMETRELERI, segment_s=SEGMENT_SANIYE, overlap_s=0.0,
+                       silence_search_s=0.0, full_mfcc_folder=None):
+    """Kaydı bellekte parçalara bölüp her parçanın ortalama MFCC vektörünü üretir"""
+    params = dict(params)
+    target_sr = params.pop("sr", None)
+    name = os.path.splitext(os.path.basename(path))[0]
+
+    for index, start, segment, sr in stream_segments(path, segment_s, overlap_s, silence_search_s):
+        y = segment.mean(axis=1)
+        if target_sr is not None and target_sr != sr:
+            y = librosa.resample(y, orig_sr=sr, target_sr=target_sr)
+            sr = target_sr
+
+        mfcc = mfcc_from_signal(y, sr, **params)
+        segment_name = f"{name}_part{index + 1}"
+        if full_mfcc_folder is not None:
+            np.save(os.path.join(full_mfcc_folder, segment_name + '.npy'), mfcc)
+
+        yield segment_name, start, np.mean(mfcc, axis=1), mfcc.shape[1]
+
+
+def _kayit_gorevi(gorev):
+    """Tek bir ham kaydın tüm parçalarını işler; hatayı yakalayıp sonuç olarak döndürür"""
+    kisi, dosya_yolu, parametreler, ayarlar, tam_klasor = gorev
+    try:
+        if tam_klasor is not None:
+            tam_klasor = os.path.join(tam_klasor, kisi)
+            os.makedirs(tam_klasor, exist_ok=True)
+        satirlar = [
+            (segment_adi, vektor, kare_sayisi)
+            for segment_adi, _, vektor, kare_sayisi in
+            recording_features(dosya_yolu, parametreler, full_mfcc_folder=tam_klasor, **ayarlar)
+        ]
+        return satirlar, None
+    except Exception as e:
+        return [], str(e)
+
+
+def veri_seti_olustur(kaynak_klasor, veri_seti_yolu, parametreler=MFCC_PARAMETRELERI, isci_sayisi=1,
+                      tam_klasor=None, segment_s=SEGMENT_SANIYE, overlap_s=0.0, silence_search_s=0.0):
+    """Ham kayıtları ara wav/npy dosyası üretmeden doğrudan tek parça veri setine dönüştürür"""
+    ayarlar = {"segment_s": segment_s, "overlap_s": overlap_s, "silence_search_s": silence_search_s}
+    gorevler = []
+    for kisi in sorted(os.listdir(kaynak_klasor)):
+        kisi_yolu = os.path.join(kaynak_klasor, kisi)
+        if os.path.isdir(kisi_yolu):
+            for dosya in sorted(os.listdir(kisi_yolu)):
+                if dosya.endswith('.wav'):
+                    gorevler.append((kisi, os.path.join(kisi_yolu, dosya), parametreler, ayarlar, tam_klasor))
+
+    if isci_sayisi > 1 and len(gorevler) > 1:
+        havuz = ProcessPoolExecutor(max_workers=isci_sayisi)
+        sonuclar = havuz.map(_kayit_gorevi, gorevler)
+    else:
+        havuz = None
+        sonuclar = map(_kayit_gorevi, gorevler)
+
+    ozellikler, etiketler, kaynaklar, kare_sayilari, hatalar = [], [], [], [], []
+    try:
+        for i, (gorev, (satirlar, hata)) in enumerate(zip(gorevler, sonuclar), start=1):
+            kisi, dosya_yolu = gorev[0], gorev[1]
+            if hata is not None:
+                hatalar.append((dosya_yolu, hata))
+                print(f"[{i}/{len(gorevler)}] Hata: {dosya_yolu} işlenemedi. Hata: {hata}")
+                continue
+
+            for segment_adi, vektor, kare_sayisi in satirlar:
+                ozellikler.append(vektor)
+                etiketler.append(kisi)
+                kaynaklar.append(os.path.join(kisi, segment_adi + '.npy'))
+                kare_sayilari.append(kare_sayisi)
+            print(f"[{i}/{len(gorevler)}] {dosya_yolu}: {len(satirlar)} parça işlendi")
+    finally:
+        if havuz is not None:
+            havuz.shutdown()
+
+    if not ozellikler:
+        print("Hata: Hiçbir kayıttan özellik çıkarılamadı.")
+        return None, hatalar
+
+    veri_seti = write_dataset(veri_seti_yolu, np.array(ozellikler), etiketler, kaynaklar, kare_sayilari,
+                              np.full(len(ozellikler), EGITIM, dtype=np.uint8),
+                              dict(parametreler, **ayarlar))
+    print(f"Veri seti kaydedildi: {veri_seti_yolu} ({len(veri_seti)} parça, {len(hatalar)} hatalı kayıt)")
+    return veri_seti, hatalar
+
+
+if __name__ == "__main__":
+    # Bölme -> MFCC -> ortalama vektör adımları tek aşamada, ara dosya olmadan çalışır
+    veri_seti_olustur(wav_dir, veri_seti_klasoru, isci_sayisi=ISCI_SAYISI, tam_klasor=tam_mfcc_klasoru)
@@ -0,0 +1,34 @@
+import numpy as np
+
+# Histogram ayarları
+HISTOGRAM_KUTUSU = 100
+HISTOGRAM_ARALIGI = (-1.0, 1.0)
+
+
+class RunningHistogram:
+    """Sabit kutulu, her blokta np.bincount ile güncellenen birikimli genlik histogramı
+
+    Güncelleme maliyeti yalnızca blok boyuna bağlıdır; kayıt uzadıkça artmaz.
+    Kutular np.histogram ile aynıdır (son kutu sağ kenarı da içerir, aralık dışı değerler sayılmaz).
+    """
+
+    def __init__(self, bins=HISTOGRAM_KUTUSU, value_range=HISTOGRAM_ARALIGI):
+        self.bins = bins
+        self.lo, self.hi = value_range
+        self.edges = np.linspace(self.lo, self.hi, bins + 1)
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self._scale = bins / (self.hi - self.lo)
+
+    def reset(self):
+        self.counts[:] = 0
+
+    def add(self, samples):
+        samples = np.asarray(samples).ravel()
+        samples = samples[(samples >= self.lo) & (samples <= self.hi)]
+        idx = ((samples - self.lo) * self._scale).astype(np.intp)
+        np.minimum(idx, self.bins - 1, out=idx)
+        self.counts += np.bincount(idx, minlength=self.bins)
+
+    @property
+    def total(self):
+        return int(self.counts.sum())
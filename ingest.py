@@ -0,0 +1,79 @@
+import io
+import numpy as np
+import soundfile as sf
+import soxr
+
+# Desteklenen ham PCM örnek biçimleri
+ORNEK_BICIMLERI = {
+    "s16le": np.dtype('<i2'),
+    "f32le": np.dtype('<f4'),
+}
+
+
+class UploadStream:
+    """Tarayıcıdan parça parça gelen ham PCM sesi kayıt nesnesinin tamponuna aktarır
+
+    Parça sınırları örnek sınırına denk gelmek zorunda değildir; artan baytlar
+    bir sonraki parçaya eklenir. Farklı örnekleme hızları akış halinde modele
+    uygun hıza dönüştürülür.
+    """
+
+    def __init__(self, recorder, sr, sample_format="s16le", channels=1):
+        if sample_format not in ORNEK_BICIMLERI:
+            raise ValueError(f"Desteklenmeyen örnek biçimi: {sample_format}")
+        if channels < 1:
+            raise ValueError("Kanal sayısı en az 1 olmalıdır")
+
+        self.recorder = recorder
+        self.sr = int(sr)
+        self.dtype = ORNEK_BICIMLERI[sample_format]
+        self.channels = int(channels)
+        self._frame_bytes = self.dtype.itemsize * self.channels
+        self._leftover = b""
+        self._resampler = None
+        if self.sr != recorder.saniye_basina_ornek:
+            self._resampler = soxr.ResampleStream(self.sr, recorder.saniye_basina_ornek, 1, dtype='float32')
+        self.received = 0  # Alınan örnek sayısı (kaynak hızında)
+        self.truncated = False  # Tampon dolduğu için atılan veri var mı
+
+        recorder.begin_ingest()
+
+    def _to_float(self, raw):
+        samples = np.frombuffer(raw, dtype=self.dtype).reshape(-1, self.channels)
+        if self.dtype.kind == 'i':
+            samples = samples.astype(np.float32) / 32768.0
+        # Kanallar ortalanarak tek kanala indirilir
+        return samples.mean(axis=1, dtype=np.float32) if self.channels > 1 else samples[:, 0].astype(np.float32)
+
+    def write(self, data):
+        """Bir veri parçasını işler; tampon dolduysa False döner"""
+        data = self._leftover + data
+        usable = len(data) - len(data) % self._frame_bytes
+        self._leftover = data[usable:]
+        if usable == 0:
+            return not self.truncated
+
+        samples = self._to_float(data[:usable])
+        self.received += len(samples)
+        if self._resampler is not None:
+            samples = self._resampler.resample_chunk(samples)
+        return self._ingest(samples)
+
+    def _ingest(self, samples):
+        if not self.truncated and not self.recorder.ingest(samples):
+            self.truncated = True
+        return not self.truncated
+
+    def finish(self):
+        """Akışı kapatır ve kaydı diske yazar; kayıtta ses varsa True döner"""
+        if self._resampler is not None:
+            self._ingest(self._resampler.resample_chunk(np.empty(0, dtype=np.float32), last=True))
+        return bool(self.recorder.stop_recording())
+
+
+def ingest_wav(recorder, data):
+    """Tam bir WAV (veya soundfile'ın okuyabildiği) dosya içeriğini kayıt nesnesine aktarır"""
+    y, sr = sf.read(io.BytesIO(data), dtype='float32', always_2d=True)
+    stream = UploadStream(recorder, sr, "f32le", y.shape[1])
+    stream.write(np.ascontiguousarray(y).astype('<f4').tobytes())
+    return stream.finish(), stream.truncated
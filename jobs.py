@@ -0,0 +1,130 @@
+import time
+import uuid
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# İş kuyruğu ayarları
+ISCI_SAYISI = 2  # Aynı anda çalışabilecek işleme sayısı
+MAKS_BEKLEYEN = 32  # Kuyrukta bekleyebilecek en fazla iş
+SAKLAMA_SURESI = 600  # Biten işlerin sonuçlarının saklanma süresi (saniye)
+
+
+class JobQueueFull(Exception):
+    """Kuyruk dolu olduğunda yeni iş kabul edilmez"""
+
+
+class JobManager:
+    """Uzun süren işlemleri sınırlı bir işçi havuzunda çalıştırıp aşama sonuçlarını saklar"""
+
+    def __init__(self, workers=ISCI_SAYISI, max_pending=MAKS_BEKLEYEN, ttl=SAKLAMA_SURESI):
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="is")
+        self._slots = threading.BoundedSemaphore(workers + max_pending)
+        self._changed = threading.Condition()
+        self._jobs = {}
+        self.ttl = ttl
+
+    def submit(self, func, *args, **kwargs):
+        """İşi kuyruğa ekler ve hemen iş kimliğini döndürür
+
+        func, aşama sonuçlarını bildirmek için on_stage(isim, veri) parametresi almalıdır.
+        İş kuyrukta beklerken ve çalışırken argümanlar değişmemelidir; kayıt işleri
+        paylaşılan tampon yerine AudioRecorder.snapshot() ile alınmış kopyayı almalıdır.
+        """
+        if not self._slots.acquire(blocking=False):
+            raise JobQueueFull("İş kuyruğu dolu, lütfen daha sonra tekrar deneyin")
+
+        self._evict()
+        job_id = uuid.uuid4().hex
+        job = {
+            "id": job_id,
+            "status": "queued",
+            "stages": {},
+            "result": None,
+            "error": None,
+            "created": time.time(),
+            "finished": None
+        }
+        with self._changed:
+            self._jobs[job_id] = job
+        try:
+            self._pool.submit(self._run, job, func, args, kwargs)
+        except Exception:
+            # Havuz işi almadıysa (ör. kapatıldıysa) yer geri verilir, kuyruk kapasitesi kalıcı olarak azalmaz
+            with self._changed:
+                self._jobs.pop(job_id, None)
+            self._slots.release()
+            raise
+        return job_id
+
+    def _run(self, job, func, args, kwargs):
+        def on_stage(name, data):
+            with self._changed:
+                job["stages"][name] = data
+                self._changed.notify_all()
+
+        try:
+            self._update(job, status="running")
+            result = func(*args, on_stage=on_stage, **kwargs)
+            self._update(job, status="done", result=result)
+        except Exception as e:
+            print(f"İş hatası ({job['id']}): {str(e)}")
+            self._update(job, status="error", error=str(e))
+        finally:
+            self._slots.release()
+
+    def _update(self, job, **fields):
+        with self._changed:
+            job.update(fields)
+            if fields.get("status") in ("done", "error"):
+                job["finished"] = time.time()
+            self._changed.notify_all()
+
+    def _evict(self):
+        """Saklama süresi dolan biten işleri siler"""
+        limit = time.time() - self.ttl
+        with self._changed:
+            for job_id in [j for j, job in self._jobs.items() if job["finished"] and job["finished"] < limit]:
+                del self._jobs[job_id]
+
+    def get(self, job_id):
+        """İşin anlık durumunun kopyasını döndürür; iş yoksa None"""
+        with self._changed:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            return dict(job, stages=dict(job["stages"]))
+
+    def wait(self, job_id, timeout=None):
+        """İş bitene kadar bekler ve son durumunu döndürür"""
+        with self._changed:
+            self._changed.wait_for(
+                lambda: self._jobs.get(job_id, {}).get("status") in (None, "done", "error"), timeout
+            )
+        return self.get(job_id)
+
+    def events(self, job_id, timeout=None):
+        """Her aşama veya durum değişiminde işin güncel halini üretir; iş bitince sona erer"""
+        seen = None
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            with self._changed:
+                self._changed.wait_for(
+                    lambda: self._snapshot_key(job_id) != seen,
+                    None if deadline is None else max(0.0, deadline - time.time())
+                )
+                key = self._snapshot_key(job_id)
+            if key == seen:
+                return  # Zaman aşımı
+            seen = key
+            job = self.get(job_id)
+            if job is None:
+                return
+            yield job
+            if job["status"] in ("done", "error"):
+                return
+
+    def _snapshot_key(self, job_id):
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        return job["status"], tuple(job["stages"])
@@ -0,0 +1,219 @@
+import re
+from functools import lru_cache
+
+# Kök aramasında soyulabilecek Türkçe çekim ekleri; büyük harfler ünlü uyumuna göre açılır
+# (I: ı/i/u/ü, A: a/e, D: d/t). Anlamı değiştiren yapım ekleri (-sız, -lık gibi) bilerek yoktur.
+EK_KALIPLARI = [
+    "lAr", "lArI", "lArDA", "lArDAn", "lArA", "lArIn",
+    "I", "yI", "A", "yA", "DA", "DAn", "In", "nIn", "nA", "nDA", "nDAn", "lA", "ylA",
+    "m", "Im", "ImIz", "n", "InIz", "sI", "mIz", "nIz",
+    "yIm", "sIn", "Iz", "yIz", "sInIz", "DIr", "DIrlAr",
+    "DI", "yDI", "DIm", "DIn", "DIk", "yDIm", "yDIn", "yDIk", "mIş", "ymIş",
+    "sA", "ysA", "ken", "yken", "ki", "k",
+]
+# Yalnızca başka bir ekten sonra gelebilen ekler (gel-di-k, mutlu-ysa-k); kökten hemen sonra
+# soyulmaz, aksi halde "acıktım" acı + k + tım olarak ayrılır
+KOK_SONRASI_OLMAYAN = frozenset({"k"})
+# Sözlükteki daha kısa bir kelimeyle başlayan ama ondan türemeyen kökler (acık- "acı" değildir,
+# hastane "hasta" değildir). Bu köklerle başlayan kelimeler daha kısa köke indirgenmez.
+ISTISNA_KOKLER = frozenset({"acık", "hastane"})
+EN_FAZLA_EK = 4  # Bir kelimede art arda soyulabilecek en fazla ek
+MIN_KOK_UZUNLUGU = 3  # Daha kısa kökler (ev, su, ağ) yalnızca tam eşleşir; "evet" gibi yanlış eşleşmeleri önler
+ONBELLEK_BOYUTU = 20000  # Kelime -> eşleşme sonuçlarının tutulduğu en fazla kelime
+
+# Ünlüyle başlayan ek alınca yumuşayan son ünsüzler (kitap -> kitabı, ilaç -> ilacı)
+YUMUSAMA = {"p": "b", "ç": "c", "t": "d", "k": "ğ"}
+UNLULER = set("aeıioöuü")
+
+
+def _ekleri_ac(kaliplar):
+    acilimlar = {"I": "ıiuü", "A": "ae", "D": "dt"}
+    ekler = {""}
+    for kalip in kaliplar:
+        varyantlar = [""]
+        for harf in kalip:
+            secenekler = acilimlar.get(harf, harf)
+            varyantlar = [v + s for v in varyantlar for s in secenekler]
+        ekler.update(varyantlar)
+    ekler.discard("")
+    return frozenset(ekler)
+
+
+EKLER = _ekleri_ac(EK_KALIPLARI)
+EN_UZUN_EK = max(len(ek) for ek in EKLER)
+
+
+def turkce_kucuk(text):
+    """Türkçe büyük/küçük harf kurallarına göre küçültür (I -> ı, İ -> i)"""
+    return text.replace("I", "ı").replace("İ", "i").lower()
+
+
+_KELIME = re.compile(r"\w+")
+
+
+def tokenize(text):
+    """Metni küçük harfli kelimelere böler; noktalama işaretleri atılır"""
+    return _KELIME.findall(turkce_kucuk(text))
+
+
+@lru_cache(maxsize=ONBELLEK_BOYUTU)
+def ek_zinciri_mi(kalan):
+    """kalan metin art arda gelen en fazla EN_FAZLA_EK çekim ekinden oluşuyorsa True"""
+    if not kalan:
+        return True
+    # Her konumdan o konuma kadar en az kaç ekle gelinebildiği (kısa metin üzerinde küçük bir DP)
+    adim = [0] + [None] * len(kalan)
+    for son in range(1, len(kalan) + 1):
+        for bas in range(max(0, son - EN_UZUN_EK), son):
+            ek = kalan[bas:son]
+            if bas == 0 and ek in KOK_SONRASI_OLMAYAN:
+                continue
+            if adim[bas] is not None and ek in EKLER:
+                aday = adim[bas] + 1
+                if adim[son] is None or aday < adim[son]:
+                    adim[son] = aday
+    return adim[-1] is not None and adim[-1] <= EN_FAZLA_EK
+
+
+class StemIndex:
+    """Anahtar kelime sözlüğünü bir kez derlenmiş kök -> etiket karma tablosuna dönüştürür
+
+    Bir kelime önce olduğu gibi, bulunamazsa en uzun önekten başlayarak
+    "kök + çekim ekleri" biçiminde aranır; böylece "mutluyum" -> mutlu,
+    "bilgisayarda" -> bilgisayar eşleşir. Kelime başına maliyet yalnızca kelimenin
+    uzunluğuna bağlıdır, sözlüğün büyüklüğüne bağlı değildir.
+    """
+
+    def __init__(self, sozluk):
+        self.labels = list(sozluk)
+        self._index = {}  # kök -> (anahtar kelime, etiketler)
+        self._yumusak = {}  # yumuşamış kök (kitab) -> (anahtar kelime, etiketler)
+        for label, kelimeler in sozluk.items():
+            for kelime in kelimeler:
+                kelime = turkce_kucuk(kelime)
+                if " " in kelime:
+                    continue  # Çok kelimeli ifadeler kelime bazlı eşleşmez
+                self._ekle(self._index, kelime, kelime, label)
+                if len(kelime) >= MIN_KOK_UZUNLUGU and kelime[-1] in YUMUSAMA:
+                    self._ekle(self._yumusak, kelime[:-1] + YUMUSAMA[kelime[-1]], kelime, label)
+        self._index = {k: (kelime, tuple(etiketler)) for k, (kelime, etiketler) in self._index.items()}
+        self.keywords = list(self._index)  # Tek kelimelik anahtar kelimeler, sözlükteki sırayla
+        self._yumusak = {k: (kelime, tuple(etiketler)) for k, (kelime, etiketler) in self._yumusak.items()}
+        self.lookup = lru_cache(maxsize=ONBELLEK_BOYUTU)(self._lookup)
+
+    @staticmethod
+    def _ekle(index, kok, kelime, label):
+        _, etiketler = index.setdefault(kok, (kelime, []))
+        if label not in etiketler:
+            etiketler.append(label)
+
+    def _lookup(self, word):
+        """(anahtar kelime, etiketler) ya da eşleşme yoksa None döndürür"""
+        hit = self._index.get(word)
+        if hit is not None:
+            return hit
+        for son in range(len(word) - 1, MIN_KOK_UZUNLUGU - 1, -1):
+            kalan = word[son:]
+            kok = word[:son]
+            hit = self._index.get(kok)
+            if hit is not None and ek_zinciri_mi(kalan):
+                return hit
+            hit = self._yumusak.get(kok)
+            if hit is not None and kalan[0] in UNLULER and ek_zinciri_mi(kalan):
+                return hit
+            if kok in ISTISNA_KOKLER:
+                return None
+        return None
+
+    def count(self, words):
+        """Kelime listesindeki eşleşmeleri tek geçişte etiket başına sayar"""
+        counts = dict.fromkeys(self.labels, 0)
+        for word in words:
+            hit = self.lookup(word)
+            if hit is not None:
+                for label in hit[1]:
+                    counts[label] += 1
+        return counts
+
+
+class PhraseMatcher:
+    """Tek ve çok kelimeli anahtar ifadeleri kelime düzeyinde Aho–Corasick otomatı ile bulur
+
+    Metindeki her kelime önce kök dizini ile sözlükteki kelimeye indirgenir
+    ("zekada" -> "zeka"), ardından otomat tek doğrusal taramada tüm ifadeleri
+    ("yapay zeka", "geri dönüşüm") ve tek kelimeleri, iç içe geçenler dahil, raporlar.
+    """
+
+    def __init__(self, sozluk):
+        self.labels = list(sozluk)
+        ifadeler = {}  # ifade -> etiketler
+        for label, kelimeler in sozluk.items():
+            for kelime in kelimeler:
+                ifade = " ".join(tokenize(kelime))
+                if ifade:
+                    etiketler = ifadeler.setdefault(ifade, [])
+                    if label not in etiketler:
+                        etiketler.append(label)
+        self.patterns = [(ifade, tuple(etiketler)) for ifade, etiketler in ifadeler.items()]
+
+        # İfadelerde geçen her kelime bir kez kök dizinine alınır
+        kelimeler = sorted({kelime for ifade, _ in self.patterns for kelime in ifade.split()})
+        self._vocab = StemIndex({"kelime": kelimeler})
+
+        # Otomat: geçişler, hata bağlantıları ve her durumda biten ifadeler
+        self._goto = [{}]
+        self._out = [[]]
+        for pid, (ifade, _) in enumerate(self.patterns):
+            state = 0
+            for kelime in ifade.split():
+                nxt = self._goto[state].get(kelime)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][kelime] = nxt
+                    self._goto.append({})
+                    self._out.append([])
+                state = nxt
+            self._out[state].append(pid)
+
+        self._fail = [0] * len(self._goto)
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for kelime, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and kelime not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(kelime, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def canonical(self, word):
+        """Kelimenin sözlükteki karşılığını ya da None döndürür"""
+        hit = self._vocab.lookup(word)
+        return None if hit is None else hit[0]
+
+    def matches(self, words):
+        """Kelime listesindeki tüm eşleşmeleri (ifade, etiketler) olarak sırayla üretir"""
+        for pid in self.match_ids(words):
+            yield self.patterns[pid]
+
+    def match_ids(self, words):
+        """Eşleşen ifadelerin self.patterns içindeki sıra numaralarını üretir"""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for word in words:
+            kelime = self.canonical(word)
+            if kelime is None:
+                state = 0
+                continue
+            while state and kelime not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(kelime, 0)
+            yield from out[state]
+
+    def count(self, words):
+        """Eşleşmeleri etiket başına sayar"""
+        counts = dict.fromkeys(self.labels, 0)
+        for _, etiketler in self.matches(words):
+            for label in etiketler:
+                counts[label] += 1
+        return counts
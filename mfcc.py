@@ -1,46 +1,182 @@
 import os
-import librosa
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from feature_cache import FeatureCache, load_manifest, save_manifest
+from feature_dataset import FeatureDataset, write_dataset, EGITIM, TEST
 
 # Eğitim ve Test klasörlerinin yolları
 egitim_klasoru = r'C:\Users\Lenovo\Desktop\123\Egitim'
 test_klasoru = r'C:\Users\Lenovo\Desktop\123\Test'
 
-# MFCC'leri kaydedeceğiniz klasörlerin yolları
+# Eğitim ve test kümelerinin ortalama MFCC veri setlerinin yazılacağı klasörler
 mfcc_egitim_klasoru = r'C:\Users\Lenovo\Desktop\123\MFCC_Egitim'
 mfcc_test_klasoru = r'C:\Users\Lenovo\Desktop\123\MFCC_Test'
 
-# MFCC klasörlerini oluştur
-os.makedirs(mfcc_egitim_klasoru, exist_ok=True)
-os.makedirs(mfcc_test_klasoru, exist_ok=True)
+# Tüm eğitim/test özelliklerini tutan tek parça veri setinin yolu
+veri_seti_klasoru = r'C:\Users\Lenovo\Desktop\123\MFCC_VeriSeti'
 
-def mfcc_cikar_ve_kaydet(kaynak_klasor, hedef_klasor):
-    for kisi_klasoru in os.listdir(kaynak_klasor):
+# İçerik adresli MFCC önbelleğinin yolu
+onbellek_klasoru = r'C:\Users\Lenovo\Desktop\123\MFCC_Onbellek'
+
+# MFCC çıkarım parametreleri (değişirse önbellek kayıtları yeniden hesaplanır)
+MFCC_PARAMETRELERI = {
+    "sr": None,  # Orijinal örnekleme hızında yükle
+    "n_mfcc": 128,
+    "n_fft": 2048,
+    "hop_length": 512
+}
+
+# Paralel çıkarımda kullanılacak işlemci sayısı (1 = seri çalışma)
+ISCI_SAYISI = os.cpu_count() or 1
+
+# Her işçi sürecinde bir kez kurulan önbellek ve parametreler
+_isci_onbellek = None
+_isci_parametreler = None
+
+def _isci_baslat(onbellek_dizini, parametreler):
+    global _isci_onbellek, _isci_parametreler
+    _isci_onbellek = FeatureCache(onbellek_dizini)
+    _isci_parametreler = parametreler
+
+def _mfcc_gorevi(gorev):
+    """Tek bir wav dosyası için ortalama MFCC vektörünü üretir; hatayı yakalayıp sonuç olarak döndürür"""
+    dosya_yolu, eski_anahtar = gorev
+    try:
+        anahtar = _isci_onbellek.key(dosya_yolu, _isci_parametreler)
+
+        # Girdi ve parametreler değişmediyse vektör önceki veri setinden alınır, dosya açılmaz
+        if eski_anahtar == anahtar:
+            return anahtar, "degismeyen", None, None
+
+        _, mfcc, onbellekte_var = _isci_onbellek.mfcc(dosya_yolu, _isci_parametreler, anahtar)
+        durum = "onbellekten" if onbellekte_var else "hesaplanan"
+
+        # Veri seti için ortalama MFCC vektörü ve kare sayısı
+        return anahtar, durum, None, (np.mean(mfcc, axis=1), mfcc.shape[1])
+    except Exception as e:
+        return None, "hatali", str(e), None
+
+def _onceki_veri_seti(hedef_klasor):
+    """Hedef klasördeki önceki çıkarımın veri setini ve kaynak -> satır eşlemesini döndürür"""
+    try:
+        veri_seti = FeatureDataset(hedef_klasor)
+        return veri_seti, {str(kaynak): i for i, kaynak in enumerate(veri_seti.sources)}
+    except FileNotFoundError:
+        return None, {}
+    except Exception as e:
+        print(f"UYARI: Önceki veri seti okunamadı, tüm dosyalar yeniden işlenecek: {hedef_klasor}. Hata: {e}")
+        return None, {}
+
+def _gorevleri_topla(kaynak_klasor, manifest, satirlar):
+    gorevler = []
+    manifest_anahtarlari = []
+    for kisi_klasoru in sorted(os.listdir(kaynak_klasor)):
         kisi_yolu = os.path.join(kaynak_klasor, kisi_klasoru)
         if os.path.isdir(kisi_yolu):
-            kisi_hedef_klasoru = os.path.join(hedef_klasor, kisi_klasoru)
-            os.makedirs(kisi_hedef_klasoru, exist_ok=True)
-            
-            for dosya in os.listdir(kisi_yolu):
+            for dosya in sorted(os.listdir(kisi_yolu)):
                 if dosya.endswith('.wav'):
-                    dosya_yolu = os.path.join(kisi_yolu, dosya)
-                    try:
-                        y, sr = librosa.load(dosya_yolu, sr=None)  # Orijinal örnekleme hızında yükle
-                        mfcc = librosa.feature.mfcc(y=y, sr=sr, n_mfcc=128)
-                        mfcc_dosya_adi = os.path.splitext(dosya)[0] + '.npy'
-                        mfcc_dosya_yolu = os.path.join(kisi_hedef_klasoru, mfcc_dosya_adi)
-                        np.save(mfcc_dosya_yolu, mfcc)
-                        print(f"MFCC kaydedildi: {mfcc_dosya_yolu}")
-                    except Exception as e:
-                        print(f"Hata: {dosya_yolu} dosyasından MFCC çıkarılamadı. Hata: {e}")
-
-# Eğitim seti için MFCC çıkarma
-print("Eğitim seti için MFCC özellikleri çıkarılıyor...")
-mfcc_cikar_ve_kaydet(egitim_klasoru, mfcc_egitim_klasoru)
-
-# Test seti için MFCC çıkarma
-print("Test seti için MFCC özellikleri çıkarılıyor...")
-mfcc_cikar_ve_kaydet(test_klasoru, mfcc_test_klasoru)
-
-print("MFCC çıkarma işlemi tamamlandı!")
+                    manifest_anahtari = os.path.join(kisi_klasoru, os.path.splitext(dosya)[0] + '.npy')
+                    # Önceki veri setinde satırı olmayan dosya değişmemiş sayılmaz
+                    eski_anahtar = manifest.get(manifest_anahtari) if manifest_anahtari in satirlar else None
+                    gorevler.append((os.path.join(kisi_yolu, dosya), eski_anahtar))
+                    manifest_anahtarlari.append(manifest_anahtari)
+    return gorevler, manifest_anahtarlari
+
+def mfcc_cikar_ve_kaydet(kaynak_klasor, hedef_klasor, parametreler=MFCC_PARAMETRELERI, onbellek=None,
+                         isci_sayisi=1, parca_boyutu=None):
+    """Kişi klasörlerindeki wav dosyalarının ortalama MFCC vektörlerini hedef klasöre tek veri seti olarak yazar
+
+    Dosya başına .npy üretilmez; değişmeyen dosyaların vektörleri hedef klasördeki
+    önceki veri setinden, değişenler içerik adresli önbellekten ya da hesaplanarak alınır.
+    """
+    if onbellek is None:
+        onbellek = FeatureCache(onbellek_klasoru)
+
+    os.makedirs(hedef_klasor, exist_ok=True)
+    sayac = {"hesaplanan": 0, "onbellekten": 0, "degismeyen": 0, "hatali": 0, "hatalar": [], "kayitlar": []}
+    manifest = load_manifest(hedef_klasor)
+    onceki, satirlar = _onceki_veri_seti(hedef_klasor)
+    gorevler, manifest_anahtarlari = _gorevleri_topla(kaynak_klasor, manifest, satirlar)
+    yeni_manifest = {}
+
+    if isci_sayisi > 1 and len(gorevler) > 1:
+        # Görevleri parçalar halinde gönder; map sonuçları sıralı döndürür
+        if parca_boyutu is None:
+            parca_boyutu = max(1, len(gorevler) // (isci_sayisi * 8))
+        havuz = ProcessPoolExecutor(
+            max_workers=isci_sayisi,
+            initializer=_isci_baslat,
+            initargs=(onbellek.cache_dir, parametreler)
+        )
+        sonuclar = havuz.map(_mfcc_gorevi, gorevler, chunksize=parca_boyutu)
+    else:
+        havuz = None
+        _isci_baslat(onbellek.cache_dir, parametreler)
+        sonuclar = map(_mfcc_gorevi, gorevler)
+
+    try:
+        for i, (gorev, manifest_anahtari, (anahtar, durum, hata, ozet)) in enumerate(
+                zip(gorevler, manifest_anahtarlari, sonuclar), start=1):
+            sayac[durum] += 1
+            if durum == "hatali":
+                sayac["hatalar"].append((gorev[0], hata))
+                print(f"[{i}/{len(gorevler)}] Hata: {gorev[0]} dosyasından MFCC çıkarılamadı. Hata: {hata}")
+                continue
+
+            if durum == "degismeyen":
+                # Veri seti yeniden yazılacağı için satır bellek eşlemesinden kopyalanır
+                satir = satirlar[manifest_anahtari]
+                ozet = (np.array(onceki.features[satir]), int(onceki.n_frames[satir]))
+            else:
+                print(f"[{i}/{len(gorevler)}] MFCC çıkarıldı: {gorev[0]}")
+            yeni_manifest[manifest_anahtari] = anahtar
+            sayac["kayitlar"].append((manifest_anahtari, ozet[0], ozet[1]))
+    finally:
+        if havuz is not None:
+            havuz.shutdown()
+
+    # Önceki veri setinin dosyaları üzerine yazılmadan önce bırakılır
+    onceki = None
+    if sayac["kayitlar"]:
+        kaynaklar, vektorler, kare_sayilari = zip(*sayac["kayitlar"])
+        write_dataset(hedef_klasor, np.array(vektorler), [os.path.dirname(k) for k in kaynaklar],
+                      kaynaklar, kare_sayilari, params=parametreler)
+    save_manifest(hedef_klasor, yeni_manifest)
+
+    print(f"Hesaplanan: {sayac['hesaplanan']}, önbellekten: {sayac['onbellekten']}, "
+          f"değişmeyen: {sayac['degismeyen']}, hatalı: {sayac['hatali']}")
+    return sayac
+
+def veri_setine_yaz(veri_seti_yolu, kume_sonuclari, parametreler=MFCC_PARAMETRELERI):
+    """mfcc_cikar_ve_kaydet sonuçlarını tek parça, mmap ile açılabilen veri setine yazar"""
+    ozellikler, etiketler, kaynaklar, kare_sayilari, kumeler = [], [], [], [], []
+    for sayac, kume in kume_sonuclari:
+        for kaynak, vektor, kare_sayisi in sayac["kayitlar"]:
+            ozellikler.append(vektor)
+            etiketler.append(os.path.dirname(kaynak))  # Kişi klasörü etiket olarak kullanılır
+            kaynaklar.append(kaynak)
+            kare_sayilari.append(kare_sayisi)
+            kumeler.append(kume)
+
+    veri_seti = write_dataset(veri_seti_yolu, np.array(ozellikler), etiketler, kaynaklar,
+                              kare_sayilari, kumeler, parametreler)
+    print(f"Veri seti kaydedildi: {veri_seti_yolu} ({len(veri_seti)} kayıt)")
+    return veri_seti
+
+if __name__ == "__main__":
+    onbellek = FeatureCache(onbellek_klasoru)
+
+    # Eğitim seti için MFCC çıkarma
+    print("Eğitim seti için MFCC özellikleri çıkarılıyor...")
+    egitim_sonuc = mfcc_cikar_ve_kaydet(egitim_klasoru, mfcc_egitim_klasoru, onbellek=onbellek,
+                                        isci_sayisi=ISCI_SAYISI)
+
+    # Test seti için MFCC çıkarma
+    print("Test seti için MFCC özellikleri çıkarılıyor...")
+    test_sonuc = mfcc_cikar_ve_kaydet(test_klasoru, mfcc_test_klasoru, onbellek=onbellek,
+                                      isci_sayisi=ISCI_SAYISI)
+
+    # Eğitim ve test kayıtlarını kume sütunuyla tek veri setinde topla
+    veri_setine_yaz(veri_seti_klasoru, [(egitim_sonuc, EGITIM), (test_sonuc, TEST)])
 
+    print("MFCC çıkarma işlemi tamamlandı!")
@@ -3,38 +3,27 @@ from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import LabelEncoder
 from sklearn.metrics import classification_report, confusion_matrix
 from sklearn.utils import resample
-import joblib
 import os
+from datetime import datetime
 import numpy as np
 import collections
+from feature_dataset import FeatureDataset
+from model_registry import save_model
 
-# MFCC özelliklerinin bulunduğu dizin
-mfcc_dizin = r'C:\Users\Lenovo\Desktop\123\MFCC'
+# Tek parça MFCC veri setinin bulunduğu dizin (mfcc.py tarafından üretilir)
+veri_seti_dizin = r'C:\Users\Lenovo\Desktop\123\MFCC_VeriSeti'
 
-X = []
-y = []
-
-# MFCC dosyalarını yükleme
+# Veri setini tek seferde bellek eşlemeli olarak aç
 print("Eğitim veri seti hazırlanıyor...")
-for klasor_adı in os.listdir(mfcc_dizin):
-    klasor_yolu = os.path.join(mfcc_dizin, klasor_adı)
-    if os.path.isdir(klasor_yolu):  # Sadece klasörler üzerinde çalış
-        for dosya_adı in os.listdir(klasor_yolu):
-            if dosya_adı.endswith('.npy'):
-                dosya_yolu = os.path.join(klasor_yolu, dosya_adı)
-                try:
-                    mfcc = np.load(dosya_yolu)
-                    if mfcc.size > 0:  # Boş dosyaları atla
-                        X.append(np.mean(mfcc, axis=1))  # Ortalama MFCC vektörü
-                        y.append(klasor_adı)  # Klasör adını etiket olarak kullan
-                    else:
-                        print(f"UYARI: Boş MFCC dosyası atlandı: {dosya_yolu}")
-                except Exception as e:
-                    print(f"HATA: Dosya yüklenemedi: {dosya_yolu}. Hata: {e}")
-
-# X ve y dizilerini numpy dizilerine dönüştür
-X = np.array(X)
-y = np.array(y)
+veri_seti = FeatureDataset(veri_seti_dizin)
+
+# Boş MFCC kayıtlarını atla
+gecerli = veri_seti.n_frames > 0
+if not gecerli.all():
+    print(f"UYARI: {np.count_nonzero(~gecerli)} boş MFCC kaydı atlandı")
+
+X = np.asarray(veri_seti.features[gecerli])  # Ortalama MFCC vektörleri
+y = veri_seti.label_column()[gecerli]  # Kişi klasörü adları
 
 # Veri seti kontrolü
 if X.size == 0 or y.size == 0:
@@ -94,7 +83,10 @@ print(classification_report(y_test, tahminler))
 print("Karışıklık Matrisi:")
 print(confusion_matrix(y_test, tahminler, labels=np.unique(y_test)))
 
-# Modeli diske kaydetme
+# Modeli sınıf isimleriyle birlikte diske kaydetme
+# (isimler model.classes_ sırasındadır, klasör adlarındaki "_ses" gibi ekler atılır;
+# çalışan uygulama yeni modeli otomatik alır)
 model_kayit_yolu = r'C:\Users\Lenovo\Desktop\123\model-kerem-emir.pkl'
-joblib.dump(model, model_kayit_yolu)
+sinif_isimleri = [isim.split('_')[0] for isim in le.classes_]
+save_model(model_kayit_yolu, model, sinif_isimleri, version=datetime.now().strftime('%Y%m%d%H%M%S'))
 print(f"Model başarıyla kaydedildi: {model_kayit_yolu}")
\ No newline at end of file
@@ -0,0 +1,84 @@
+import os
+import threading
+import joblib
+
+# Etiket listesi içermeyen eski model dosyaları için varsayılan sınıf isimleri
+VARSAYILAN_SINIF_ISIMLERI = ['Kerem', 'Emir']
+
+
+def save_model(path, model, class_names, version=None):
+    """Modeli sınıf isimleriyle birlikte tek dosyada saklar
+
+    class_names[i], model.classes_[i] sınıfının ismidir; tahminler bu sıra üzerinden isimlere eşlenir.
+    """
+    classes = getattr(model, "classes_", None)
+    if classes is not None and len(classes) != len(class_names):
+        raise ValueError(f"Sınıf isimleri modelin sınıflarıyla eşleşmiyor: {len(class_names)} isim, {len(classes)} sınıf")
+    # Önce geçici dosyaya yazılır; çalışan uygulama yarım yazılmış modeli hiç görmez
+    artifact = {"model": model, "sinif_isimleri": list(class_names), "surum": version}
+    tmp = path + '.tmp'
+    joblib.dump(artifact, tmp)
+    os.replace(tmp, path)
+
+
+def load_model(path):
+    """Model dosyasını yükler; (model, sınıf isimleri, sürüm) döndürür"""
+    artifact = joblib.load(path)
+    if isinstance(artifact, dict) and "model" in artifact:
+        return artifact["model"], list(artifact["sinif_isimleri"]), artifact.get("surum")
+    return artifact, list(VARSAYILAN_SINIF_ISIMLERI), None
+
+
+class ModelRegistry:
+    """Her modeli süreç başına bir kez yükleyip tüm thread'lerle salt okunur paylaşır"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    def get(self, path):
+        """Modeli döndürür; dosya değiştiyse yeni sürüm yüklenip sıcak olarak değiştirilir"""
+        path = os.path.abspath(path)
+        mtime = os.path.getmtime(path)
+        entry = self._entries.get(path)
+        if entry is None or entry["mtime"] != mtime:
+            entry = self._load(path, mtime)
+        return entry["model"], entry["class_names"]
+
+    def _load(self, path, mtime):
+        with self._lock:
+            # Kilidi beklerken başka bir thread yüklemiş olabilir
+            entry = self._entries.get(path)
+            if entry is not None and entry["mtime"] == mtime:
+                return entry
+            try:
+                model, class_names, version = load_model(path)
+            except Exception as e:
+                if entry is None:
+                    raise
+                # Yeni sürüm okunamazsa çalışan sürümle devam et
+                print(f"Model yeniden yükleme hatası, önceki sürüm kullanılıyor: {str(e)}")
+                return entry
+
+            entry = {"model": model, "class_names": class_names, "version": version, "mtime": mtime}
+            # Sözlük tek atamayla değiştirilir; okuyucular ya eski ya yeni kaydı görür
+            self._entries = dict(self._entries, **{path: entry})
+            print(f"Model yüklendi: {path} (sürüm: {version}, sınıflar: {class_names})")
+            return entry
+
+    def reload(self, path):
+        """Dosya zamanından bağımsız olarak modeli yeniden yükler"""
+        path = os.path.abspath(path)
+        with self._lock:
+            self._entries = {p: e for p, e in self._entries.items() if p != path}
+        return self.get(path)
+
+    def info(self):
+        return {
+            path: {"version": entry["version"], "class_names": entry["class_names"], "mtime": entry["mtime"]}
+            for path, entry in self._entries.items()
+        }
+
+
+# Süreç genelinde paylaşılan kayıt defteri
+registry = ModelRegistry()
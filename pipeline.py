@@ -0,0 +1,68 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# Aşamaların çalıştığı ortak havuz; tüm oturumların işleme aşamaları burada sıraya girer
+ASAMA_ISCI_SAYISI = 8
+_havuz = ThreadPoolExecutor(max_workers=ASAMA_ISCI_SAYISI, thread_name_prefix="asama")
+
+
+class Stage:
+    """Bağımlılık grafiğindeki tek aşama; func bağımlı aşamaların sonuçlarını sırasıyla alır"""
+
+    def __init__(self, func, deps=()):
+        self.func = func
+        self.deps = tuple(deps)
+
+
+def run_stages(stages, on_stage=None, executor=None):
+    """Aşamaları bağımlılık sırasına göre çalıştırır; birbirinden bağımsız aşamalar aynı anda yürür
+
+    (sonuçlar, süreler) döndürür. Süreler her aşamanın kendi çalışma süresidir (saniye).
+    on_stage(isim, sonuç) her aşama bittiği anda çağrılır. Bir aşama hata verirse
+    bekleyen aşamalar başlatılmaz ve hata yeniden fırlatılır.
+    """
+    executor = executor or _havuz
+    for name, stage in stages.items():
+        missing = [dep for dep in stage.deps if dep not in stages]
+        if missing:
+            raise ValueError(f"{name} aşamasının bağımlılığı tanımlı değil: {missing}")
+
+    results, timings = {}, {}
+    pending = dict(stages)
+    running = {}
+
+    def timed(name, func, args):
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            timings[name] = time.perf_counter() - start
+
+    def submit_ready():
+        for name, stage in list(pending.items()):
+            if all(dep in results for dep in stage.deps):
+                del pending[name]
+                args = [results[dep] for dep in stage.deps]
+                running[executor.submit(timed, name, stage.func, args)] = name
+
+    submit_ready()
+    if pending and not running:
+        raise ValueError(f"Döngüsel bağımlılık: {sorted(pending)}")
+
+    while running:
+        done, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in done:
+            name = running.pop(future)
+            error = future.exception()
+            if error is not None:
+                for other in running:
+                    other.cancel()
+                raise error
+            results[name] = future.result()
+            if on_stage is not None:
+                on_stage(name, results[name])
+        submit_ready()
+        if pending and not running:
+            raise ValueError(f"Döngüsel bağımlılık: {sorted(pending)}")
+
+    return results, timings
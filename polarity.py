@@ -0,0 +1,135 @@
+from functools import lru_cache
+from lexicon import StemIndex, tokenize
+
+# Çevrimdışı Türkçe kutupluluk sözlüğü: kelime -> [-1, 1] arası skor
+POLARITE_SOZLUGU = {
+    # Olumlu
+    "iyi": 0.6, "güzel": 0.7, "harika": 0.9, "mükemmel": 1.0, "muhteşem": 1.0, "süper": 0.9,
+    "mutlu": 0.8, "sevinçli": 0.8, "neşeli": 0.7, "keyifli": 0.7, "huzurlu": 0.6, "rahat": 0.4,
+    "başarılı": 0.7, "başarı": 0.6, "teşekkür": 0.5, "sevgi": 0.7, "sev": 0.6, "seviyorum": 0.8,
+    "beğendim": 0.7, "hoş": 0.5, "tatlı": 0.5, "eğlenceli": 0.7, "heyecanlı": 0.5, "umut": 0.5,
+    "umutlu": 0.6, "şanslı": 0.6, "gurur": 0.5, "memnun": 0.6, "olumlu": 0.5, "doğru": 0.3,
+    "kolay": 0.3, "faydalı": 0.5, "yararlı": 0.5, "değerli": 0.5, "tebrik": 0.7, "bravo": 0.8,
+    "şahane": 0.9, "enfes": 0.9, "nefis": 0.8, "başardım": 0.7, "kazandık": 0.7, "kazandım": 0.7,
+    # Olumsuz
+    "kötü": -0.7, "berbat": -0.9, "rezil": -0.9, "korkunç": -0.9, "mutsuz": -0.8, "üzgün": -0.7,
+    "üzücü": -0.7, "kederli": -0.7, "acı": -0.6, "acılı": -0.6, "sıkıcı": -0.5, "yorgun": -0.4,
+    "yorucu": -0.4, "zor": -0.3, "sorun": -0.4, "problem": -0.4, "hata": -0.4, "başarısız": -0.7,
+    "kızgın": -0.7, "sinirli": -0.6, "öfkeli": -0.8, "rahatsız": -0.5, "bıktım": -0.7,
+    "nefret": -0.9, "endişe": -0.5, "endişeli": -0.5, "korku": -0.6, "korktum": -0.6,
+    "kaygı": -0.5, "kaygılı": -0.5, "stres": -0.5, "stresli": -0.5, "yalnız": -0.4,
+    "hasta": -0.4, "ağrı": -0.5, "kayıp": -0.5, "kaybettik": -0.6, "kaybettim": -0.6,
+    "olumsuz": -0.5, "yanlış": -0.3, "zarar": -0.5, "tehlike": -0.5, "tehlikeli": -0.6,
+    "felaket": -0.9, "maalesef": -0.4, "ne yazık": -0.5, "pişman": -0.6, "hayal kırıklığı": -0.7,
+}
+
+# Kökü başka kelimelerin başında da geçen belirsiz kelimeler (hasta -> hastane, sev -> sevim);
+# ek soyularak eşleşmezler, yalnızca kendileri ve burada sayılan çekimli halleri eşleşir
+BELIRSIZ_KOKLER = {
+    "hasta": ("hastayım", "hastaydım", "hastasın", "hastaydı", "hastayız", "hastalar"),
+    "acı": ("acısı", "acıyı", "acılar", "acıydı", "acıyla"),
+    "sev": ("sevdim", "sevdi", "sevdik", "seviyor", "seviyoruz", "sevmedim"),
+    "zor": ("zordu", "zordur", "zorlu"),
+    "hata": ("hatayı", "hatalar", "hatası", "hataydı"),
+}
+
+# Hemen önündeki kutuplu kelimenin ya da ifadenin yönünü çeviren kelimeler ("iyi değil")
+OLUMSUZLUK = {"değil", "değildi", "değilim", "değiliz", "değilsin", "yok"}
+
+# Sonraki kutuplu kelimenin etkisini değiştiren kelimeler
+YOGUNLUK = {"çok": 1.5, "gerçekten": 1.3, "aşırı": 1.6, "son derece": 1.6, "en": 1.3, "biraz": 0.6, "az": 0.5}
+
+ONBELLEK_BOYUTU = 4096  # Normalize edilmiş metin başına tutulan en fazla sonuç
+
+
+class PolarityLexicon:
+    """Yerel sözlükle, ağ gerektirmeden Türkçe metnin kutupluluğunu ve öznelliğini hesaplar
+
+    Kelimeler kök dizini üzerinden eşleşir (güzeldi -> güzel). Sonuçlar normalize
+    edilmiş metne göre sınırlı bir LRU önbellekte tutulur.
+    """
+
+    def __init__(self, sozluk=POLARITE_SOZLUGU):
+        self.scores = {}
+        self.phrases = {}
+        for kelime, skor in sozluk.items():
+            tokens = tuple(tokenize(kelime))
+            if len(tokens) == 1:
+                self.scores[tokens[0]] = skor
+            else:
+                self.phrases[tokens] = skor
+        self.exact = {}  # Belirsiz köklerin izin verilen halleri -> kök
+        for kok, haller in BELIRSIZ_KOKLER.items():
+            if kok in self.scores:
+                self.exact.update(dict.fromkeys((kok,) + haller, kok))
+        self.index = StemIndex({"kelime": [k for k in self.scores if k not in BELIRSIZ_KOKLER]})
+        self.intensity = {}
+        for kelime, katsayi in YOGUNLUK.items():
+            self.intensity[tuple(tokenize(kelime))] = katsayi
+        self.polarity = lru_cache(maxsize=ONBELLEK_BOYUTU)(self._polarity)
+
+    @staticmethod
+    def normalize(text):
+        return " ".join(tokenize(text or ""))
+
+    def analyze(self, text):
+        """(kutupluluk, öznellik) döndürür; sözlükten hiçbir kelime geçmiyorsa öznellik 0'dır"""
+        return self.polarity(self.normalize(text))
+
+    def analyze_batch(self, texts):
+        """Bekleyen birden fazla metni tek seferde skorlar; aynı metinler bir kez hesaplanır"""
+        keys = [self.normalize(text) for text in texts]
+        unique = {key: self.polarity(key) for key in dict.fromkeys(keys)}
+        return [unique[key] for key in keys]
+
+    def _polarity(self, normalized):
+        words = normalized.split()
+        if not words:
+            return 0.0, 0.0
+
+        skorlar = []
+        katsayi = 1.0
+        son_kutuplu = None  # Son kutuplu kelimenin/ifadenin bittiği konum
+        i = 0
+        while i < len(words):
+            # Önce iki kelimelik ifadeler denenir
+            pair = tuple(words[i:i + 2])
+            if len(pair) == 2 and pair in self.intensity:
+                katsayi *= self.intensity[pair]
+                i += 2
+                continue
+            if len(pair) == 2 and pair in self.phrases:
+                skorlar.append(self.phrases[pair] * katsayi)
+                katsayi = 1.0
+                i += 2
+                son_kutuplu = i
+                continue
+
+            word = words[i]
+            if (word,) in self.intensity:
+                katsayi *= self.intensity[(word,)]
+            elif word in OLUMSUZLUK:
+                # Yalnızca hemen önündeki kutuplu kelime çevrilir ("param yok" öncesindeki "kötü" değil)
+                if son_kutuplu == i:
+                    skorlar[-1] = -skorlar[-1]
+            else:
+                kok = self.exact.get(word)
+                if kok is None:
+                    hit = self.index.lookup(word)
+                    kok = None if hit is None else hit[0]
+                if kok is not None:
+                    skorlar.append(self.scores[kok] * katsayi)
+                    son_kutuplu = i + 1
+                katsayi = 1.0
+            i += 1
+
+        if not skorlar:
+            return 0.0, 0.0
+        polarity = max(-1.0, min(1.0, sum(skorlar) / len(skorlar)))
+        # Öznellik: kutuplu kelimelerin metindeki yoğunluğu
+        subjectivity = min(1.0, len(skorlar) / len(words))
+        return round(polarity, 3), round(subjectivity, 3)
+
+
+# Sözlük süreç başına bir kez derlenir ve tüm oturumlarca paylaşılır
+lexicon = PolarityLexicon()
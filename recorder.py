@@ -0,0 +1,417 @@
+import os
+import threading
+import numpy as np
+import librosa
+from audio_features import identify_speaker, save_wav_async, to_mono
+from diarization import speaker_diarization, attribute_words
+from model_registry import registry
+from streaming import StreamingIdentifier
+from audio_buffer import AudioRingBuffer
+from text_analysis import EmotionAnalyzer, TopicAnalyzer
+from visualization import VisualizationService
+from envelope import EnvelopePyramid
+from histogram import RunningHistogram
+from transcription import get_backend, transcribe_chunked
+from pipeline import Stage, run_stages
+
+# Kayıt ayarları: callback başına örnek sayısı ve izin verilen en fazla blok
+BLOK_BOYUTU = 1024
+MAX_FRAMES = 1300
+
+MODEL_YOLU = 'model-kerem-emir.pkl'
+
+
+def en_cok_konusan(diarization):
+    """En çok pencerede tespit edilen konuşmacıyı tahmin olarak döndürür"""
+    return max(diarization["speaker_counts"].items(), key=lambda x: x[1])[0]
+
+
+class RecordingSnapshot:
+    """Bir işleme işinin kullandığı ses ve ayarlar; iş kuyruğa eklenirken alınır ve değişmez"""
+
+    def __init__(self, audio, sr, model_kayit_yolu, transcriber, emotion_analyzer, topic_analyzer):
+        self.audio = audio  # Salt okunur kopya
+        self.sr = sr
+        self.model_kayit_yolu = model_kayit_yolu
+        self.transcriber = transcriber
+        self.emotion_analyzer = emotion_analyzer
+        self.topic_analyzer = topic_analyzer
+
+
+class AudioRecorder:
+    """Arayüzden bağımsız kayıt ve işleme çekirdeği; masaüstü arayüzü ve web oturumları bunu kullanır"""
+
+    def __init__(self, kayit_yolu="kayit.wav", pcm_yolu="kayit1_pcm.wav", model_kayit_yolu=MODEL_YOLU,
+                 emotion_analyzer=None, topic_analyzer=None, transcriber=None, arka_uc=None):
+        self.is_recording = False
+        # Maksimum kayıt süresi kadar tampon bir kez ayrılır
+        self.buffer = AudioRingBuffer(MAX_FRAMES * BLOK_BOYUTU)
+        # Çizim için min/maks zarf piramidi; ses geldikçe blok blok güncellenir
+        self.envelope = EnvelopePyramid(self.buffer.capacity)
+        # Genlik dağılımı her blokta birikimli olarak güncellenir
+        self.histogram = RunningHistogram()
+        self.save_thread = None  # Arka planda çalışan kayıt yazma işlemi
+        self.stop_identification = False  # Konuşmacı tanıma işlemini durdurmak için bayrak
+        self.live_identifier = None  # Kayıt sırasında canlı konuşmacı tahmini yapan işçi
+        self.upload_stream = None  # Tarayıcıdan parça parça yüklenen kayıt (ingest.UploadStream)
+
+        # Kaydın yazılacağı dosyalar; her oturum kendi dosyalarını kullanır
+        self.kayit_yolu = kayit_yolu
+        self.pcm_yolu = pcm_yolu
+
+        # Eğitilmiş model süreç genelindeki kayıt defterinden bir kez yüklenir,
+        # sınıf isimleri model dosyasının içinden okunur
+        self.model_kayit_yolu = model_kayit_yolu
+        registry.get(self.model_kayit_yolu)
+
+        # Mikrofondan ses almak için gerekli parametreler
+        self.saniye_basina_ornek = 44100  # Örnekleme hızı (örneğin, 44100 Hz)
+        self.saniye = 5  # 5 saniyelik ses al
+        self.kanal_sayisi = 1  # Tek kanallı ses
+
+        # Web arayüzü için sinyal ve histogram görüntüleri
+        self.visualizer = VisualizationService(self.buffer, self.saniye_basina_ornek, self.envelope, self.histogram)
+
+        # Konuşma tanıma arka ucu süreç başına bir kez yüklenir ve sıcak tutulur;
+        # arka_uc verilmezse KONUSMA_TANIMA ortam değişkeni (yoksa "google") kullanılır
+        self.transcriber = transcriber or get_backend(arka_uc)
+
+        # Analizciler oturumlar arasında paylaşılabilir
+        self.emotion_analyzer = emotion_analyzer or EmotionAnalyzer()
+        self.topic_analyzer = topic_analyzer or TopicAnalyzer()
+
+    def _on_recording_started(self):
+        """Kayıt başladığında çağrılır; arayüzler canlı güncellemeleri burada başlatır"""
+
+    def _on_recording_error(self, message):
+        """Kayıt başlatılamadığında çağrılır"""
+
+    def _on_block(self, block):
+        """Her yeni blok tampona yazıldıktan sonra ses thread'inden çağrılır"""
+
+    def _on_live_result(self, result):
+        """Canlı tanıma thread'inden her yeni tahminde çağrılır"""
+
+    def _on_max_reached(self):
+        # Stream kendi callback'i içinden durdurulamaz, ayrı bir thread'de durdurulur
+        threading.Thread(target=self.stop_recording, daemon=True).start()
+
+    def start_recording(self):
+        if not self.is_recording:
+            try:
+                print("Kayıt başlatılıyor...")
+                self.is_recording = True
+                self.stop_identification = False
+                # Önceki kayıt hâlâ diske yazılıyorsa tampon üzerine yazılmadan önce bitmesi beklenir
+                if self.save_thread is not None:
+                    self.save_thread.join()
+                self.envelope.reset()
+                self.histogram.reset()
+                self.buffer.clear()
+                
+                # Ses seviyesi kontrolü için değişken
+                self.max_amplitude = 0
+                
+                # Mikrofon yalnızca yerel kayıtta gerekir; sunucu yüklemelerle PortAudio olmadan çalışır
+                import sounddevice as sd
+
+                devices = sd.query_devices()
+                input_device = None
+                
+                for i, device in enumerate(devices):
+                    if device['max_input_channels'] > 0:
+                        input_device = i
+                        break
+                
+                if input_device is None:
+                    raise Exception("Ses giriş cihazı bulunamadı!")
+                
+                print(f"Seçilen mikrofon: {devices[input_device]['name']}")
+                
+                self.stream = sd.InputStream(
+                    device=input_device,
+                    channels=1,
+                    samplerate=self.saniye_basina_ornek,
+                    blocksize=BLOK_BOYUTU,
+                    dtype=np.float32,
+                    callback=self.callback
+                )
+                
+                # Canlı tanıma işçisi callback'ten beslenir, tahminleri kendi thread'inde üretir
+                self.live_identifier = StreamingIdentifier(
+                    self.model_kayit_yolu, sr=self.saniye_basina_ornek, on_result=self._on_live_result
+                )
+                self.live_identifier.start()
+
+                self.stream.start()
+                self._on_recording_started()
+                
+            except Exception as e:
+                print(f"Kayıt başlatma hatası: {str(e)}")
+                self._on_recording_error(f"Ses girişi başlatılamadı: {str(e)}")
+                self.is_recording = False
+
+    def begin_ingest(self):
+        """Mikrofon yerine dışarıdan (ör. tarayıcıdan) gelecek ses için kaydı başlatır"""
+        if self.is_recording:
+            raise RuntimeError("Kayıt zaten devam ediyor")
+        self.is_recording = True
+        self.stop_identification = False
+        if self.save_thread is not None:
+            self.save_thread.join()
+        self.envelope.reset()
+        self.histogram.reset()
+        self.buffer.clear()
+
+        self.live_identifier = StreamingIdentifier(
+            self.model_kayit_yolu, sr=self.saniye_basina_ornek, on_result=self._on_live_result
+        )
+        self.live_identifier.start()
+
+    def ingest(self, samples):
+        """Mono float32 örnekleri mikrofon bloklarıyla aynı şekilde tampona yazar; tampon dolunca False döner"""
+        for i in range(0, len(samples), BLOK_BOYUTU):
+            remaining = self.buffer.capacity - self.buffer.written
+            if remaining <= 0:
+                return False
+            block = samples[i:i + min(BLOK_BOYUTU, remaining)].reshape(-1, 1)
+            # Türetilmiş yapılar önce güncellenir, tampon yazımı yeni örnekleri en son yayınlar
+            self.envelope.extend(block)
+            self.histogram.add(block)
+            self.buffer.write(block)
+            if self.live_identifier is not None:
+                self.live_identifier.feed(block)
+        return True
+
+    def stop_recording(self):
+        try:
+            if self.is_recording:
+                print("Kayıt durduruluyor...")
+                # Önce kayıt durumunu güncelle
+                self.is_recording = False
+                self.stop_identification = True
+                
+                # Stream'i güvenli bir şekilde durdur
+                if hasattr(self, 'stream'):
+                    try:
+                        self.stream.stop()
+                        self.stream.close()
+                        print("Stream kapatıldı")
+                    except Exception as e:
+                        print(f"Stream kapatma hatası: {str(e)}")
+
+                if self.live_identifier is not None:
+                    self.live_identifier.stop()
+
+                if len(self.buffer) > 0:
+                    print(f"Toplam frame sayısı: {self.buffer.blocks}")
+                    self.save_recording()
+                    print("Kayıt başarıyla kaydedildi")
+                    return True
+                else:
+                    print("Kayıt için frame bulunamadı!")
+                    return False
+                    
+        except Exception as e:
+            print(f"Kayıt durdurma hatası: {str(e)}")
+            raise e
+        finally:
+            # Her durumda stream'i temizlemeye çalış
+            if hasattr(self, 'stream'):
+                try:
+                    self.stream.close()
+                except:
+                    pass
+
+    def callback(self, indata, frames, time, status):
+        if status and status.input_overflow:
+            return  # Overflow durumunda işlemi atla
+            
+        try:
+            # Maksimum kayıt süresi kontrolü
+            if self.buffer.full:
+                print("Maksimum kayıt süresine ulaşıldı...")
+                self._on_max_reached()
+                return
+            
+            # Ses verilerini önceden ayrılmış tampona kopyala
+            # Türetilmiş yapılar önce güncellenir, tampon yazımı yeni örnekleri en son yayınlar
+            self.envelope.extend(indata)
+            self.histogram.add(indata)
+            self.buffer.write(indata)
+            if self.live_identifier is not None:
+                self.live_identifier.feed(indata)
+            self._on_block(indata)
+            
+        except Exception as e:
+            print(f"Callback hatası: {str(e)}")
+
+    def get_live_result(self):
+        """Kayıt sırasında üretilen son canlı konuşmacı tahminini döndürür"""
+        if self.live_identifier is None:
+            return None
+        return self.live_identifier.latest()
+
+    def save_recording(self):
+        try:
+            if len(self.buffer) > 0:
+                audio_data = self.buffer.view()
+                
+                print(f"Ses verisi boyutu: {audio_data.shape}")
+                
+                # kayit.wav ve PCM formatındaki kayit1_pcm.wav arka planda yazılır,
+                # işleme adımları bellekteki tampon üzerinden devam eder
+                self.save_thread = save_wav_async(
+                    audio_data, self.kayit_yolu, self.pcm_yolu, sr=self.saniye_basina_ornek
+                )
+                
+        except Exception as e:
+            print(f"Kayıt kaydetme hatası: {str(e)}")
+            raise e
+
+    def snapshot(self):
+        """İşlenecek kaydın ve işleme ayarlarının değişmez bir kopyasını alır
+
+        Arka plandaki işler tampon yerine bu kopyayı kullanır; böylece iş sürerken
+        başlatılan yeni bir kayıt işlenen sesi değiştiremez. Kayıt yoksa None döner.
+        """
+        if len(self.buffer) > 0:
+            audio_data = self.buffer.view().copy()
+        elif os.path.exists(self.pcm_yolu):
+            audio_data, _ = librosa.load(self.pcm_yolu, sr=self.saniye_basina_ornek)
+        else:
+            return None
+        audio_data.setflags(write=False)
+        return RecordingSnapshot(
+            audio_data, self.saniye_basina_ornek, self.model_kayit_yolu,
+            self.transcriber, self.emotion_analyzer, self.topic_analyzer
+        )
+
+    def process_recording(self, on_stage=None, snapshot=None):
+        """Kaydı işler; on_stage verilirse her aşamanın sonucu bittiği anda bildirilir
+
+        snapshot verilmezse kaydın o anki kopyası alınır; arka plan işleri kopyayı
+        kuyruğa eklenirken almalıdır.
+        """
+        def stage(name, data):
+            if on_stage is not None:
+                on_stage(name, data)
+
+        try:
+            snapshot = snapshot or self.snapshot()
+            if snapshot is None:
+                return {
+                    "status": "error",
+                    "message": f"{self.pcm_yolu} bulunamadı!"
+                }
+            audio_data = snapshot.audio
+
+            # Bağımsız aşamalar (yazıya dökme ve yalnızca sese bakan konuşmacı tespiti) aynı anda çalışır;
+            # duygu/konu analizi metni, kelime ataması hem metni hem konuşmacı pencerelerini bekler.
+            # Arka uç kelime zamanı vermiyorsa kelimeler parça aralığını taşır, atama parça bazında yapılır.
+            model, sinif_isimleri = registry.get(snapshot.model_kayit_yolu)
+            sr = snapshot.sr
+            asamalar = {
+                "transcript": Stage(lambda: transcribe_chunked(snapshot.transcriber, to_mono(audio_data), sr)),
+                "speakers": Stage(lambda: speaker_diarization(audio_data, model, sinif_isimleri, sr=sr)),
+                "words": Stage(lambda yazi, d: {"words": attribute_words(yazi["words"], d["windows"]),
+                                                "wordTimingsApproximate": yazi["approximate"]},
+                               deps=("transcript", "speakers")),
+                "emotions": Stage(lambda yazi: snapshot.emotion_analyzer.analyze_emotion(yazi["text"]),
+                                  deps=("transcript",)),
+                "topics": Stage(lambda yazi: snapshot.topic_analyzer.analyze_topics(yazi["text"]),
+                                deps=("transcript",)),
+            }
+
+            def asama_bitti(name, result):
+                if name == "transcript":
+                    stage(name, {"transcript": result["text"], "wordCount": len(result["text"].split())})
+                elif name == "speakers":
+                    stage(name, {"speaker": en_cok_konusan(result),
+                                 "speakerPercentages": result["speaker_percentages"]})
+                elif name == "words":
+                    stage(name, result)
+                elif name == "emotions":
+                    stage(name, {"emotions": result["duygular"]})
+                else:
+                    stage(name, {"topics": result})
+
+            sonuclar, sureler = run_stages(asamalar, on_stage=asama_bitti)
+            sureler = {name: round(s * 1000, 1) for name, s in sureler.items()}
+            stage("timings", {"timings": sureler})
+
+            transcript = sonuclar["transcript"]["text"]
+            kelime_sayisi = len(transcript.split())
+            diarization = sonuclar["speakers"]
+            speaker_percentages = diarization["speaker_percentages"]
+            tahmin = en_cok_konusan(diarization)
+            emotion_results = sonuclar["emotions"]
+            topic_results = sonuclar["topics"]
+            
+            print(f"Transcript sonucu: {transcript}")
+            print(f"Kelime sayısı: {kelime_sayisi}")
+            print(f"Konuşmacı tahmini: {tahmin}")
+            print(f"Konuşmacı dağılımı: {speaker_percentages}")
+            print(f"Duygu analizi: {emotion_results}")
+            print(f"Konu analizi: {topic_results}")
+            print(f"Aşama süreleri (ms): {sureler}")
+            
+            return {
+                "status": "success",
+                "speaker": tahmin,
+                "wordCount": kelime_sayisi,
+                "transcript": transcript,
+                "emotions": emotion_results["duygular"],
+                "topics": topic_results,
+                "speakerPercentages": speaker_percentages,
+                "words": sonuclar["words"]["words"],
+                "wordTimingsApproximate": sonuclar["words"]["wordTimingsApproximate"],
+                "timings": sureler
+            }
+            
+        except Exception as e:
+            print(f"İşleme hatası: {str(e)}")
+            return {
+                "status": "error",
+                "message": f"İşleme hatası: {str(e)}"
+            }
+
+    def transcribe(self, file):
+        """Kaydı sessizliklerden bölüp parçaları paralel yazıya döker; {"text", "words", "approximate"} döndürür"""
+        if isinstance(file, np.ndarray):
+            signal, sr = to_mono(file), self.saniye_basina_ornek
+        else:
+            signal, sr = librosa.load(file, sr=None)
+        # Yazıya dökme seçili arka uçla yapılır (çevrimdışı kurulumda yerel Vosk modeli)
+        return transcribe_chunked(self.transcriber, signal, sr)
+
+    def getWords(self, file):
+        transcript = self.transcribe(file)["text"]
+        kelimeler = transcript.split()
+        return transcript, len(kelimeler)
+        
+    def speaker_identification(self, file):
+        # Dosya yolu verilirse ses yüklenir, NumPy tamponu doğrudan kullanılır
+        if isinstance(file, np.ndarray):
+            y = file
+        else:
+            y, _ = librosa.load(file, sr=self.saniye_basina_ornek)
+        
+        # Model üzerinden tahmin yapma
+        model, sinif_isimleri = registry.get(self.model_kayit_yolu)
+        return identify_speaker(y, model, sinif_isimleri, sr=self.saniye_basina_ornek)
+    
+    def get_signal_image(self):
+        # Görüntüler önbellekli görselleştirme servisinden alınır; yeni ses yoksa yeniden çizilmez
+        try:
+            return self.visualizer.signal_base64()
+        except Exception as e:
+            print(f"Sinyal görüntüsü oluşturma hatası: {str(e)}")
+            return None
+
+    def get_histogram_image(self):
+        try:
+            return self.visualizer.histogram_base64()
+        except Exception as e:
+            print(f"Histogram görüntüsü oluşturma hatası: {str(e)}")
+            return None
@@ -0,0 +1,82 @@
+import os
+import numpy as np
+import soundfile as sf
+
+# Varsayılan bölme ayarları
+SEGMENT_SANIYE = 5.0
+SESSIZLIK_KARE_SANIYE = 0.01  # Sessizlik aramasında kullanılan enerji karesi (10 ms)
+
+
+def _quietest_cut(buffer, lo, hi, frame):
+    """buffer[lo:hi] aralığında enerjisi en düşük karenin ortasını döndürür"""
+    region = buffer[lo:hi]
+    n_frames = len(region) // frame
+    if n_frames == 0:
+        return hi
+    energy = np.square(region[:n_frames * frame]).mean(axis=1).reshape(n_frames, frame).mean(axis=1)
+    return lo + int(np.argmin(energy)) * frame + frame // 2
+
+
+def stream_segments(path, segment_s=SEGMENT_SANIYE, overlap_s=0.0, silence_search_s=0.0):
+    """WAV dosyasını sabit boyutlu bloklarla okuyup parçaları sırayla üretir
+
+    Bellek kullanımı kayıt uzunluğundan bağımsızdır. Üretilen parça iç tampona
+    ait bir görünümdür; bir sonraki adımdan sonra da kullanılacaksa kopyalanmalıdır.
+    """
+    with sf.SoundFile(path) as f:
+        sr = f.samplerate
+        segment_len = int(segment_s * sr)
+        overlap = int(overlap_s * sr)
+        search = int(silence_search_s * sr)
+        frame = max(1, int(SESSIZLIK_KARE_SANIYE * sr))
+
+        if overlap >= segment_len:
+            raise ValueError("Örtüşme süresi parça süresinden kısa olmalıdır")
+
+        # Tek parça + sessizlik arama payı kadar tampon bir kez ayrılır
+        buffer = np.empty((segment_len + search, f.channels), dtype=np.float32)
+        filled = 0
+        start = 0  # Tamponun ilk örneğinin dosyadaki konumu
+        index = 0
+        eof = False
+
+        while True:
+            if not eof and filled < len(buffer):
+                read = f.read(len(buffer) - filled, dtype='float32', always_2d=True,
+                              out=buffer[filled:])
+                filled += len(read)
+                eof = filled < len(buffer)
+
+            if filled <= (overlap if index > 0 else 0):
+                break
+
+            cut = min(segment_len, filled)
+            if search > 0 and not eof:
+                # Parça sınırını sınır çevresindeki en sessiz noktaya kaydır
+                cut = _quietest_cut(buffer, max(overlap + 1, segment_len - search), filled, frame)
+
+            yield index, start, buffer[:cut], sr
+            index += 1
+
+            if eof and cut >= filled:
+                break
+
+            # Örtüşen kısım dahil kalan örnekleri tamponun başına taşı
+            keep_from = cut - overlap
+            remaining = filled - keep_from
+            buffer[:remaining] = buffer[keep_from:filled]
+            filled = remaining
+            start += keep_from
+
+
+def write_segments(path, output_folder, segment_s=SEGMENT_SANIYE, overlap_s=0.0, silence_search_s=0.0):
+    """Parçaları üretildikleri anda kaynakla aynı formatta diske yazar"""
+    os.makedirs(output_folder, exist_ok=True)
+    name = os.path.splitext(os.path.basename(path))[0]
+    subtype = sf.info(path).subtype
+
+    count = 0
+    for index, _, segment, sr in stream_segments(path, segment_s, overlap_s, silence_search_s):
+        sf.write(os.path.join(output_folder, f"{name}_part{index + 1}.wav"), segment, sr, subtype=subtype)
+        count += 1
+    return count
@@ -1,5 +1,5 @@
-from pydub import AudioSegment
 import os
+from segmenter import write_segments
 
 # WAV dosyalarının bulunduğu tam dizin
 wav_dir = r'C:\Users\Lenovo\Desktop\123\Sesler_wav'
@@ -8,6 +8,11 @@ wav_dir = r'C:\Users\Lenovo\Desktop\123\Sesler_wav'
 output_dir = r'C:\Users\Lenovo\Desktop\123\bolunmus_wav'
 os.makedirs(output_dir, exist_ok=True)
 
+# Parça ayarları (saniye)
+parca_suresi = 5.0
+ortusme_suresi = 0.0  # Ardışık parçalar arasındaki örtüşme
+sessizlik_arama_suresi = 0.0  # >0 ise parça sınırı bu aralıktaki en sessiz noktaya kaydırılır
+
 # Klasörleri tanımla
 folders = ["Kerem_ses", "Emir_ses",]
 
@@ -33,18 +38,12 @@ for folder in folders:
             print(f"İşleniyor: {file_path}")
 
         try:
-            # Ses dosyasını yükle
-            audio = AudioSegment.from_wav(file_path)
-
-            # Ses dosyasını 5 saniyelik parçalara böl
-            chunk_length_ms = 5000  # 5 saniye
-            chunks = [audio[i:i + chunk_length_ms] for i in range(0, len(audio), chunk_length_ms)]
+            # Ses dosyasını bloklar halinde okuyup 5 saniyelik parçaları anında kaydet
+            # (kaydın tamamı belleğe alınmaz)
+            parca_sayisi = write_segments(file_path, output_folder, parca_suresi,
+                                          ortusme_suresi, sessizlik_arama_suresi)
+            print(f"{wav_file}: {parca_sayisi} parça kaydedildi")
 
-# Parçaları kaydet
-            for i, chunk in enumerate(chunks):
-             chunk.export(os.path.join(output_folder, f"{wav_file[:-4]}_part{i+1}.wav"), format="wav")
-
-        
         except Exception as e:
             print(f"Hata oluştu: {wav_file} - {e}")
 
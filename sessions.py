@@ -0,0 +1,110 @@
+import time
+import uuid
+import shutil
+import tempfile
+import threading
+
+# Oturum ayarları
+BOSTA_KALMA_SURESI = 900  # Bu süre boyunca istek gelmeyen oturumlar silinir (saniye)
+MAKS_OTURUM = 64  # Aynı anda tutulabilecek en fazla oturum
+TEMIZLIK_ARALIGI = 60  # Boşta kalan oturumların kontrol edilme sıklığı (saniye)
+
+
+class SessionLimitReached(Exception):
+    """Tüm oturumlar kullanımdayken yeni oturum açılamaz"""
+
+
+class SessionManager:
+    """Her web istemcisine kendi kayıt nesnesini ve geçici dosya klasörünü verir"""
+
+    def __init__(self, factory, max_idle=BOSTA_KALMA_SURESI, max_sessions=MAKS_OTURUM):
+        # factory(gecici_klasor) yeni bir kayıt nesnesi döndürür
+        self.factory = factory
+        self.max_idle = max_idle
+        self.max_sessions = max_sessions
+        self._lock = threading.Lock()
+        self._sessions = {}
+        self._reaper = None
+
+    def get(self, session_id):
+        """Oturumun kayıt nesnesini döndürür; oturum yoksa None"""
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                return None
+            session["last_seen"] = time.time()
+            return session["recorder"]
+
+    def get_or_create(self, session_id=None):
+        """Var olan oturumu döndürür, yoksa yeni kimlikle oluşturur; (kimlik, kayıt nesnesi) döndürür"""
+        recorder = self.get(session_id) if session_id else None
+        if recorder is not None:
+            return session_id, recorder
+
+        self.evict_idle()
+        with self._lock:
+            oldest = self._pop_oldest() if len(self._sessions) >= self.max_sessions else None
+        # Kaydetme beklemesi uzun sürebilir; diğer oturumlar kilidi beklemesin diye kapatma kilit dışında yapılır
+        if oldest is not None:
+            self._close(oldest)
+
+        # İstemcinin gönderdiği bilinmeyen kimlik kullanılmaz, her zaman yeni kimlik üretilir
+        session_id = uuid.uuid4().hex
+        temp_dir = tempfile.mkdtemp(prefix="oturum_")
+        recorder = self.factory(temp_dir)
+        with self._lock:
+            self._sessions[session_id] = {"recorder": recorder, "temp_dir": temp_dir, "last_seen": time.time()}
+        return session_id, recorder
+
+    def _pop_oldest(self):
+        # Kilit altında çağrılır; kayıt yapmayan en eski oturumu listeden çıkarıp döndürür
+        idle = [(s["last_seen"], sid) for sid, s in self._sessions.items() if not s["recorder"].is_recording]
+        if not idle:
+            raise SessionLimitReached("Oturum sınırına ulaşıldı, lütfen daha sonra tekrar deneyin")
+        return self._sessions.pop(min(idle)[1])
+
+    def remove(self, session_id):
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+        if session is not None:
+            self._close(session)
+
+    def evict_idle(self):
+        """Boşta kalma süresini aşan ve kayıt yapmayan oturumları siler"""
+        limit = time.time() - self.max_idle
+        with self._lock:
+            expired = [
+                sid for sid, s in self._sessions.items()
+                if s["last_seen"] < limit and not s["recorder"].is_recording
+            ]
+            sessions = [self._sessions.pop(sid) for sid in expired]
+        for session in sessions:
+            self._close(session)
+        return len(sessions)
+
+    def _close(self, session):
+        recorder = session["recorder"]
+        try:
+            if recorder.is_recording:
+                recorder.stop_recording()
+            if recorder.save_thread is not None:
+                recorder.save_thread.join()
+        except Exception as e:
+            print(f"Oturum kapatma hatası: {str(e)}")
+        shutil.rmtree(session["temp_dir"], ignore_errors=True)
+
+    def start_reaper(self, interval=TEMIZLIK_ARALIGI):
+        """Boşta kalan oturumları arka planda periyodik olarak temizler"""
+        def run():
+            while True:
+                time.sleep(interval)
+                removed = self.evict_idle()
+                if removed:
+                    print(f"{removed} boşta oturum silindi")
+
+        if self._reaper is None:
+            self._reaper = threading.Thread(target=run, daemon=True)
+            self._reaper.start()
+
+    def __len__(self):
+        return len(self._sessions)
@@ -0,0 +1,135 @@
+import time
+import queue
+import threading
+import numpy as np
+import librosa
+from audio_features import ORNEKLEME_HIZI, N_MFCC, N_FFT, HOP_LENGTH, DIGER, to_mono, prediction_indices
+from model_registry import registry
+
+# Canlı tahmin ayarları
+PENCERE_SANIYE = 2.0  # Tahminde kullanılan kayan pencere
+ARALIK_MS = 250  # Tahminlerin yayınlanma sıklığı
+SESSIZLIK_ESIGI = 1e-3  # Bu RMS değerinin altındaki pencereler için tahmin yapılmaz
+
+
+class StreamingIdentifier:
+    """Kayıt sürerken gelen bloklardan MFCC'yi artımlı hesaplayıp kayan pencerede konuşmacı tahmini yapar"""
+
+    def __init__(self, model_path, sr=ORNEKLEME_HIZI, window_s=PENCERE_SANIYE, interval_ms=ARALIK_MS,
+                 on_result=None):
+        self.model_path = model_path
+        self.sr = sr
+        self.interval = interval_ms / 1000
+        self.on_result = on_result
+
+        self._pending = queue.SimpleQueue()
+        self._tail = np.empty(0, dtype=np.float32)  # Henüz tam kareye dönüşmemiş örnekler
+        self._mel_basis = None
+
+        # Son pencereye ait MFCC kareleri için sabit boyutlu halka tampon ve toplamlar
+        self._window_frames = max(1, int(round(window_s * sr / HOP_LENGTH)))
+        self._mfcc_ring = np.zeros((self._window_frames, N_MFCC), dtype=np.float64)
+        self._rms_ring = np.zeros(self._window_frames, dtype=np.float64)
+        self._mfcc_sum = np.zeros(N_MFCC, dtype=np.float64)
+        self._rms_sum = 0.0
+        self._ring_pos = 0
+        self._ring_count = 0
+        self._processed_frames = 0
+
+        self._latest = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+
+    def feed(self, block):
+        """Ses callback'inden çağrılır; yalnızca bloğu kuyruğa ekler, hesaplama yapmaz"""
+        self._pending.put(to_mono(block).copy())
+
+    def latest(self):
+        return self._latest
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                if self._process_pending():
+                    self._predict()
+            except Exception as e:
+                print(f"Canlı tanıma hatası: {str(e)}")
+
+    def _process_pending(self):
+        """Kuyruktaki yeni blokların MFCC karelerini hesaplayıp pencereye ekler"""
+        blocks = []
+        while True:
+            try:
+                blocks.append(self._pending.get_nowait())
+            except queue.Empty:
+                break
+        if not blocks:
+            return False
+
+        samples = np.concatenate([self._tail] + blocks)
+        if len(samples) < N_FFT:
+            self._tail = samples
+            return False
+
+        # Yalnızca yeni örnekleri kapsayan kareler hesaplanır (center=False ile akışa uygun çerçeveleme)
+        n_frames = 1 + (len(samples) - N_FFT) // HOP_LENGTH
+        used = (n_frames - 1) * HOP_LENGTH + N_FFT
+        stft = np.abs(librosa.stft(samples[:used], n_fft=N_FFT, hop_length=HOP_LENGTH, center=False)) ** 2
+        if self._mel_basis is None:
+            self._mel_basis = librosa.filters.mel(sr=self.sr, n_fft=N_FFT)
+        mel = librosa.power_to_db(self._mel_basis @ stft)
+        mfcc = librosa.feature.mfcc(S=mel, n_mfcc=N_MFCC).T
+        rms = np.sqrt(stft.sum(axis=0) * 2 / N_FFT ** 2)
+        self._tail = samples[n_frames * HOP_LENGTH:]
+
+        for frame, frame_rms in zip(mfcc, rms):
+            # Halka tamponda en eski karenin yerine yenisini yaz, toplamları güncelle
+            self._mfcc_sum += frame - self._mfcc_ring[self._ring_pos]
+            self._rms_sum += frame_rms - self._rms_ring[self._ring_pos]
+            self._mfcc_ring[self._ring_pos] = frame
+            self._rms_ring[self._ring_pos] = frame_rms
+            self._ring_pos = (self._ring_pos + 1) % self._window_frames
+            self._ring_count = min(self._ring_count + 1, self._window_frames)
+        self._processed_frames += n_frames
+        return True
+
+    def _predict(self):
+        start = time.perf_counter()
+        mean_rms = self._rms_sum / self._ring_count
+        result = {
+            "zaman": round(self._processed_frames * HOP_LENGTH / self.sr, 2),
+            "konusmaci": None,
+            "olasiliklar": {}
+        }
+
+        if mean_rms >= SESSIZLIK_ESIGI:
+            model, class_names = registry.get(self.model_path)
+            features = (self._mfcc_sum / self._ring_count).reshape(1, -1)
+            # Etiketler isimlere model.classes_ üzerinden eşlenir; eşlenemeyenler "Diğer" olur
+            names = list(class_names) + [DIGER]
+            if hasattr(model, "predict_proba"):
+                probabilities = model.predict_proba(features)[0]
+                columns = prediction_indices(model, model.classes_, class_names)
+                olasiliklar = {}
+                for c, p in zip(columns, probabilities):
+                    olasiliklar[names[c]] = olasiliklar.get(names[c], 0.0) + float(p)
+                result["olasiliklar"] = {isim: round(p, 3) for isim, p in olasiliklar.items()}
+                result["konusmaci"] = names[columns[int(np.argmax(probabilities))]]
+            else:
+                result["konusmaci"] = names[prediction_indices(model, model.predict(features), class_names)[0]]
+
+        result["gecikme_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        self._latest = result
+        if self.on_result is not None:
+            self.on_result(result)
@@ -1,44 +1,34 @@
 from sklearn.metrics import classification_report, confusion_matrix, accuracy_score
-import joblib
-import os
 import numpy as np
-from sklearn.preprocessing import LabelEncoder
+from feature_dataset import FeatureDataset, TEST
+from model_registry import load_model
 
-# Kaydedilmiş modeli yükleme
+# Kaydedilmiş modeli sınıf isimleriyle birlikte yükleme
 model_yolu = r'C:\Users\Lenovo\Desktop\123\model-kerem-emir.pkl'
-model = joblib.load(model_yolu)
+model, sinif_isimleri, surum = load_model(model_yolu)
+print(f"Model sürümü: {surum}")
 
 # Test veri setini hazırlama
-mfcc_dizin = r'C:\Users\Lenovo\Desktop\123\MFCC_Test'
-X_test = []
-y_test = []
+veri_seti_dizin = r'C:\Users\Lenovo\Desktop\123\MFCC_VeriSeti'
 
 print("Test veri seti hazırlanıyor...")
-for klasor_adı in os.listdir(mfcc_dizin):
-    klasor_yolu = os.path.join(mfcc_dizin, klasor_adı)
-    if os.path.isdir(klasor_yolu):
-        for dosya_adı in os.listdir(klasor_yolu):
-            if dosya_adı.endswith('.npy'):
-                dosya_yolu = os.path.join(klasor_yolu, dosya_adı)
-                try:
-                    mfcc = np.load(dosya_yolu)
-                    if mfcc.size > 0:
-                        # MFCC'nin ortalamasını kullanma (gerekirse düzeltin)
-                        X_test.append(np.mean(mfcc, axis=1))
-                        y_test.append(klasor_adı)
-                except Exception as e:
-                    print(f"Hata: {dosya_yolu} yüklenemedi. Hata: {e}")
-
-X_test = np.array(X_test)
-y_test = np.array(y_test)
+veri_seti = FeatureDataset(veri_seti_dizin)
+test_mask = (veri_seti.split == TEST) & (veri_seti.n_frames > 0)
+X_test = np.asarray(veri_seti.features[test_mask])
+y_test = veri_seti.label_column()[test_mask]
 
 if X_test.size == 0 or y_test.size == 0:
     print("Hata: Test veri seti boş.")
     exit()
 
-# Etiketleri sayısal değerlere dönüştürme
-le = LabelEncoder()
-y_test = le.fit_transform(y_test)
+# Etiketleri modelin eğitimde kullandığı sınıf sırasına göre sayısal değerlere dönüştürme
+# (klasör adları "Kerem_ses" gibidir, sınıf isimleri "_" öncesidir)
+sinif_indeksi = {isim: i for i, isim in enumerate(sinif_isimleri)}
+bilinmeyen = sorted({etiket for etiket in y_test if etiket.split('_')[0] not in sinif_indeksi})
+if bilinmeyen:
+    print(f"Hata: Modelde olmayan sınıflar: {bilinmeyen}")
+    exit()
+y_test = np.array([sinif_indeksi[etiket.split('_')[0]] for etiket in y_test])
 
 # Test veri seti üzerinde tahmin yapma
 tahminler = model.predict(X_test)
@@ -49,7 +39,9 @@ print(f"Model doğruluğu: {dogruluk * 100:.2f}%")
 
 # Sınıflandırma raporu ve karışıklık matrisi yazdırma
 print("Sınıflandırma Raporu:")
-print(classification_report(y_test, tahminler))
+print(classification_report(
+    y_test, tahminler, labels=list(range(len(sinif_isimleri))), target_names=sinif_isimleri, zero_division=0
+))
 
 print("Karışıklık Matrisi:")
-print(confusion_matrix(y_test, tahminler))
\ No newline at end of file
+print(confusion_matrix(y_test, tahminler, labels=list(range(len(sinif_isimleri)))))
\ No newline at end of file
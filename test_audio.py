@@ -0,0 +1,792 @@
+import unittest
+import os
+import shutil
+import tempfile
+import numpy as np
+import scipy.io.wavfile as wav
+from feature_cache import FeatureCache
+from feature_dataset import FeatureDataset, EGITIM, TEST
+from segmenter import stream_segments, write_segments
+from feature_pipeline import veri_seti_olustur
+from audio_features import mfcc_from_file, mfcc_vector, identify_speaker
+from batch_inference import predict_batch
+from model_registry import ModelRegistry, save_model
+from streaming import StreamingIdentifier
+from audio_buffer import AudioRingBuffer
+from jobs import JobManager, JobQueueFull
+from sessions import SessionManager, SessionLimitReached
+from recorder import AudioRecorder
+from ingest import UploadStream
+from visualization import VisualizationService, signal_points
+from envelope import EnvelopePyramid
+from histogram import RunningHistogram
+from transcription import get_backend, StubBackend, ANLASILAMADI, silence_chunks, transcribe_chunked
+from transcription import TranscriptionBackend, VoskBackend
+from diarization import attribute_words, speaker_diarization
+from pipeline import Stage, run_stages
+from tk_bridge import TkBridge
+from mfcc import mfcc_cikar_ve_kaydet, veri_setine_yaz, MFCC_PARAMETRELERI
+
+class TestAudioPipeline(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Tahmin testlerinde ortak kullanılan küçük modeller bir kez eğitilir"""
+        from sklearn.neural_network import MLPClassifier
+        X = np.random.default_rng(5).standard_normal((20, 128))
+        # Tamsayı etiketli (LabelEncoder çıktısı gibi) ve metin etiketli iki model
+        cls.model = MLPClassifier(hidden_layer_sizes=(8,), max_iter=50, random_state=42)
+        cls.model.fit(X, np.array([0, 1] * 10))
+        cls.metin_modeli = MLPClassifier(hidden_layer_sizes=(8,), max_iter=50, random_state=42)
+        cls.metin_modeli.fit(X, np.array(["s1", "s2"] * 10))
+
+    def setUp(self):
+        """Her test öncesi geçici bir kişi/wav klasör yapısı oluştur"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.kaynak = os.path.join(self.temp_dir, "Egitim")
+        self.hedef = os.path.join(self.temp_dir, "MFCC_Egitim")
+        self.onbellek = FeatureCache(os.path.join(self.temp_dir, "MFCC_Onbellek"))
+
+        rng = np.random.default_rng(42)
+        for kisi in ["Kerem", "Emir"]:
+            os.makedirs(os.path.join(self.kaynak, kisi))
+            for i in range(2):
+                ses = (rng.standard_normal(44100) * 3000).astype(np.int16)
+                wav.write(os.path.join(self.kaynak, kisi, f"{kisi}_part{i + 1}.wav"), 44100, ses)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_case_01_feature_cache(self):
+        """
+        Test Case ID: TC_AUDIO_01
+        Test Case Name: MFCC Önbellek Testi
+        Objective: Değişmeyen dosyaların atlandığını ve parametre değişince yeniden hesaplandığını kontrol etme
+        """
+        ilk = mfcc_cikar_ve_kaydet(self.kaynak, self.hedef, onbellek=self.onbellek)
+        ikinci = mfcc_cikar_ve_kaydet(self.kaynak, self.hedef, onbellek=self.onbellek)
+        yeni_parametreler = dict(MFCC_PARAMETRELERI, n_mfcc=40)
+        ucuncu = mfcc_cikar_ve_kaydet(self.kaynak, self.hedef, yeni_parametreler, self.onbellek)
+
+        # Assertions
+        self.assertEqual(ilk["hesaplanan"], 4)
+        self.assertEqual(ikinci["degismeyen"], 4)
+        self.assertEqual(ikinci["hesaplanan"], 0)
+        self.assertEqual(ucuncu["hesaplanan"], 4)
+        self.assertEqual(FeatureDataset(self.hedef).features.shape, (4, 40))
+        # Değişmeyen dosyaların vektörleri önceki veri setinden alınır; dosya başına .npy yazılmaz
+        np.testing.assert_array_equal(ikinci["kayitlar"][0][1], ilk["kayitlar"][0][1])
+        self.assertFalse(os.path.exists(os.path.join(self.hedef, "Kerem")))
+
+    def test_case_02_parallel_extraction(self):
+        """
+        Test Case ID: TC_AUDIO_02
+        Test Case Name: Paralel MFCC Çıkarma Testi
+        Objective: Paralel çıkarımın seri çıkarımla aynı sonucu verdiğini ve hataları topladığını kontrol etme
+        """
+        # Bozuk bir wav dosyası ekle
+        bozuk = os.path.join(self.kaynak, "Emir", "bozuk.wav")
+        with open(bozuk, "wb") as f:
+            f.write(b"bozuk veri")
+
+        seri_hedef = os.path.join(self.temp_dir, "MFCC_Seri")
+        seri = mfcc_cikar_ve_kaydet(self.kaynak, seri_hedef, onbellek=self.onbellek)
+        paralel_onbellek = FeatureCache(os.path.join(self.temp_dir, "MFCC_Onbellek_Paralel"))
+        paralel = mfcc_cikar_ve_kaydet(self.kaynak, self.hedef, onbellek=paralel_onbellek,
+                                       isci_sayisi=2, parca_boyutu=1)
+
+        # Assertions
+        self.assertEqual(paralel["hesaplanan"], 4)
+        self.assertEqual(paralel["hatali"], 1)
+        self.assertEqual(paralel["hatalar"][0][0], bozuk)
+        self.assertEqual(seri["hesaplanan"], 4)
+        np.testing.assert_allclose(FeatureDataset(seri_hedef).features, FeatureDataset(self.hedef).features)
+
+    def test_case_03_packed_dataset(self):
+        """
+        Test Case ID: TC_AUDIO_03
+        Test Case Name: Tek Parça Veri Seti Testi
+        Objective: Çıkarım sonuçlarının tek veri setine yazıldığını ve kume sütununun güncellendiğini kontrol etme
+        """
+        sonuc = mfcc_cikar_ve_kaydet(self.kaynak, self.hedef, onbellek=self.onbellek)
+        veri_seti_yolu = os.path.join(self.temp_dir, "MFCC_VeriSeti")
+        veri_setine_yaz(veri_seti_yolu, [(sonuc, EGITIM)])
+
+        veri_seti = FeatureDataset(veri_seti_yolu)
+        mfcc = mfcc_from_file(os.path.join(self.kaynak, "Emir", "Emir_part1.wav"))
+        satir = list(veri_seti.sources).index(os.path.join("Emir", "Emir_part1.npy"))
+
+        # Assertions
+        self.assertEqual(len(veri_seti), 4)
+        self.assertEqual(sorted(veri_seti.label_names), ["Emir", "Kerem"])
+        self.assertEqual(veri_seti.n_frames[satir], mfcc.shape[1])
+        np.testing.assert_allclose(veri_seti.features[satir], np.mean(mfcc, axis=1), rtol=1e-5)
+
+        veri_seti.set_split([EGITIM, TEST, EGITIM, TEST])
+        self.assertEqual(len(FeatureDataset(veri_seti_yolu).subset(TEST)[0]), 2)
+
+    def test_case_04_streaming_segmenter(self):
+        """
+        Test Case ID: TC_AUDIO_04
+        Test Case Name: Akışlı Bölme Testi
+        Objective: Blok blok bölmenin kaynak sinyalle birebir aynı parçaları ürettiğini kontrol etme
+        """
+        kaynak = os.path.join(self.temp_dir, "uzun.wav")
+        ses = (np.random.default_rng(0).standard_normal(8000 * 12) * 3000).astype(np.int16)
+        wav.write(kaynak, 8000, ses)
+
+        parcalar = [(baslangic, parca[:, 0].copy()) for _, baslangic, parca, _ in
+                    stream_segments(kaynak, segment_s=5.0, overlap_s=1.0)]
+        sayi = write_segments(kaynak, os.path.join(self.temp_dir, "Bolunmus_wav"), segment_s=5.0)
+
+        # Assertions
+        self.assertEqual([baslangic for baslangic, _ in parcalar], [0, 32000, 64000])
+        for baslangic, parca in parcalar:
+            np.testing.assert_allclose(parca, ses[baslangic:baslangic + len(parca)] / 32768.0)
+        self.assertEqual(sayi, 3)
+        self.assertEqual(len(wav.read(os.path.join(self.temp_dir, "Bolunmus_wav", "uzun_part3.wav"))[1]), 16000)
+
+    def test_case_05_fused_pipeline(self):
+        """
+        Test Case ID: TC_AUDIO_05
+        Test Case Name: Birleşik Özellik Hattı Testi
+        Objective: Ara dosyasız hattın, parça dosyaları üzerinden hesaplanan vektörlerle aynı sonucu verdiğini kontrol etme
+        """
+        kaynak = os.path.join(self.temp_dir, "Sesler_wav")
+        os.makedirs(os.path.join(kaynak, "Kerem_ses"))
+        ses = (np.random.default_rng(1).standard_normal(44100 * 7) * 3000).astype(np.int16)
+        wav.write(os.path.join(kaynak, "Kerem_ses", "kerem.wav"), 44100, ses)
+
+        veri_seti, hatalar = veri_seti_olustur(kaynak, os.path.join(self.temp_dir, "MFCC_VeriSeti"),
+                                               isci_sayisi=2)
+        write_segments(os.path.join(kaynak, "Kerem_ses", "kerem.wav"), os.path.join(self.temp_dir, "parcalar"))
+        beklenen = mfcc_from_file(os.path.join(self.temp_dir, "parcalar", "kerem_part2.wav"), **MFCC_PARAMETRELERI)
+
+        # Assertions
+        self.assertEqual(hatalar, [])
+        self.assertEqual(len(veri_seti), 2)
+        self.assertEqual(veri_seti.sources[1], os.path.join("Kerem_ses", "kerem_part2.npy"))
+        np.testing.assert_allclose(veri_seti.features[1], np.mean(beklenen, axis=1), rtol=1e-4, atol=1e-3)
+
+    def test_case_06_batch_prediction(self):
+        """
+        Test Case ID: TC_AUDIO_06
+        Test Case Name: Toplu Tahmin Testi
+        Objective: Yol ve dizi karışık girdilerin tek toplu çağrıyla tekil tahminlerle aynı sonucu verdiğini kontrol etme
+        """
+        rng = np.random.default_rng(3)
+        yol = os.path.join(self.kaynak, "Kerem", "Kerem_part1.wav")
+        dizi = (rng.standard_normal(44100) * 0.1).astype(np.float32)
+        sonuclar, sure = predict_batch(self.model, [yol, dizi, "olmayan.wav"], ["Kerem", "Emir"], workers=2)
+
+        # Assertions
+        self.assertEqual(sonuclar[0]["kaynak"], yol)
+        self.assertIsNotNone(sonuclar[2]["hata"])
+        self.assertIsNone(sonuclar[2]["konusmaci"])
+        self.assertIn(sonuclar[1]["konusmaci"], ["Kerem", "Emir"])
+        self.assertAlmostEqual(sum(sonuclar[0]["olasiliklar"].values()), 1.0, places=3)
+        self.assertGreaterEqual(sure["tahmin"], 0.0)
+
+        # Metin etiketli model: isimler classes_ sırasıyla eşlenir
+        metin_sonuclari, _ = predict_batch(self.metin_modeli, [yol, dizi], ["Kerem", "Emir"])
+        self.assertEqual(sorted(metin_sonuclari[0]["olasiliklar"]), ["Emir", "Kerem"])
+        self.assertIn(metin_sonuclari[1]["konusmaci"], ["Kerem", "Emir"])
+        # İsim listesi sınıflardan kısaysa eşlenemeyen sınıf "Diğer" olur, hata verilmez
+        eksik, _ = predict_batch(self.metin_modeli, [yol, dizi], ["Kerem"])
+        self.assertEqual(sorted(eksik[0]["olasiliklar"]), ["Diğer", "Kerem"])
+
+    def test_case_07_model_registry(self):
+        """
+        Test Case ID: TC_AUDIO_07
+        Test Case Name: Model Kayıt Defteri Testi
+        Objective: Modelin bir kez yüklendiğini ve dosya değişince yeni sürümün alındığını kontrol etme
+        """
+        kayit_defteri = ModelRegistry()
+        model_yolu = os.path.join(self.temp_dir, "model.pkl")
+        save_model(model_yolu, {"agirlik": 1}, ["Kerem", "Emir"], version="1")
+
+        ilk_model, ilk_isimler = kayit_defteri.get(model_yolu)
+        ikinci_model, _ = kayit_defteri.get(model_yolu)
+
+        save_model(model_yolu, {"agirlik": 2}, ["Kerem", "Emir", "Ayşe"], version="2")
+        os.utime(model_yolu, (0, os.path.getmtime(model_yolu) + 5))
+        yeni_model, yeni_isimler = kayit_defteri.get(model_yolu)
+
+        # Assertions
+        self.assertIs(ilk_model, ikinci_model)
+        self.assertEqual(ilk_isimler, ["Kerem", "Emir"])
+        self.assertEqual(yeni_model, {"agirlik": 2})
+        self.assertEqual(yeni_isimler, ["Kerem", "Emir", "Ayşe"])
+
+    def test_case_08_streaming_identification(self):
+        """
+        Test Case ID: TC_AUDIO_08
+        Test Case Name: Canlı Konuşmacı Tanıma Testi
+        Objective: Bloklarla beslenen artımlı MFCC'nin toplu hesaplamayla aynı pencere ortalamasını verdiğini kontrol etme
+        """
+        import librosa
+        rng = np.random.default_rng(5)
+        model_yolu = os.path.join(self.temp_dir, "model.pkl")
+        save_model(model_yolu, self.model, ["Kerem", "Emir"])
+
+        sonuclar = []
+        tanima = StreamingIdentifier(model_yolu, window_s=0.5, on_result=sonuclar.append)
+        ses = (rng.standard_normal(44100) * 0.1).astype(np.float32)
+        for i in range(0, len(ses), 1024):
+            tanima.feed(ses[i:i + 1024].reshape(-1, 1))
+            if i % 8192 == 0:
+                tanima._process_pending()
+        tanima._process_pending()
+        tanima._predict()
+
+        toplu = librosa.feature.mfcc(y=ses, sr=44100, n_mfcc=128, n_fft=2048, hop_length=512, center=False)
+        pencere = tanima._window_frames
+
+        # Assertions
+        self.assertEqual(tanima._processed_frames, toplu.shape[1])
+        np.testing.assert_allclose(tanima._mfcc_sum / pencere, toplu[:, -pencere:].mean(axis=1), rtol=1e-3, atol=1e-2)
+        self.assertIn(sonuclar[-1]["konusmaci"], ["Kerem", "Emir"])
+
+        tanima._pending.put(np.zeros(44100, dtype=np.float32))
+        tanima._process_pending()
+        tanima._predict()
+        self.assertIsNone(tanima.latest()["konusmaci"])
+
+        # Metin etiketli model canlı tanımada da classes_ sırasıyla isimlere eşlenir
+        metin_yolu = os.path.join(self.temp_dir, "metin_model.pkl")
+        save_model(metin_yolu, self.metin_modeli, ["Kerem", "Emir"])
+        metin_tanima = StreamingIdentifier(metin_yolu, window_s=0.5)
+        metin_tanima._pending.put(ses)
+        metin_tanima._process_pending()
+        metin_tanima._predict()
+        self.assertIn(metin_tanima.latest()["konusmaci"], ["Kerem", "Emir"])
+        self.assertEqual(sorted(metin_tanima.latest()["olasiliklar"]), ["Emir", "Kerem"])
+
+    def test_case_09_ring_buffer(self):
+        """
+        Test Case ID: TC_AUDIO_09
+        Test Case Name: Halka Tampon Testi
+        Objective: Tamponun kopyasız görünüm verdiğini ve dolunca en eski örneklerin üzerine yazdığını kontrol etme
+        """
+        tampon = AudioRingBuffer(10)
+        tampon.write(np.arange(4, dtype=np.float32).reshape(-1, 1))
+        tampon.write(np.arange(4, 8, dtype=np.float32).reshape(-1, 1))
+        gorunum = tampon.view()
+
+        # Assertions
+        self.assertEqual(len(tampon), 8)
+        self.assertEqual(tampon.blocks, 2)
+        self.assertTrue(np.shares_memory(gorunum, tampon._data))
+        np.testing.assert_array_equal(gorunum[:, 0], np.arange(8))
+        np.testing.assert_array_equal(tampon.latest(3)[:, 0], [5, 6, 7])
+
+        tampon.write(np.arange(8, 13, dtype=np.float32).reshape(-1, 1))
+        self.assertTrue(tampon.full)
+        np.testing.assert_array_equal(tampon.view()[:, 0], np.arange(3, 13))
+        np.testing.assert_array_equal(tampon.latest(4)[:, 0], [9, 10, 11, 12])
+
+    def test_case_10_job_manager(self):
+        """
+        Test Case ID: TC_AUDIO_10
+        Test Case Name: Arka Plan İş Kuyruğu Testi
+        Objective: İşin hemen kimlik döndürdüğünü, aşama sonuçlarını sırayla yayınladığını ve kuyruğun sınırlı olduğunu kontrol etme
+        """
+        import threading
+        devam = threading.Event()
+
+        def isleme(on_stage):
+            on_stage("transcript", {"wordCount": 3})
+            devam.wait(5)
+            on_stage("topics", {})
+            return {"status": "success"}
+
+        isler = JobManager(workers=1, max_pending=1)
+        is_id = isler.submit(isleme)
+        ikinci_id = isler.submit(isleme)
+
+        # Assertions
+        with self.assertRaises(JobQueueFull):
+            isler.submit(isleme)
+        olaylar = isler.events(is_id, timeout=5)
+        ilk_olay = next(olaylar)
+        while "transcript" not in ilk_olay["stages"]:
+            ilk_olay = next(olaylar)
+        self.assertEqual(ilk_olay["status"], "running")
+        self.assertEqual(isler.get(ikinci_id)["status"], "queued")
+
+        devam.set()
+        son = isler.wait(is_id, timeout=5)
+        self.assertEqual(son["status"], "done")
+        self.assertEqual(list(son["stages"]), ["transcript", "topics"])
+        self.assertEqual(isler.wait(ikinci_id, timeout=5)["result"], {"status": "success"})
+        self.assertIsNone(isler.get("olmayan"))
+
+        # Havuz işi reddederse yer geri verilir; ikinci deneme de kuyruk dolu değil havuz hatası alır
+        kapali = JobManager(workers=1, max_pending=0)
+        kapali._pool.shutdown()
+        for _ in range(2):
+            with self.assertRaises(RuntimeError):
+                kapali.submit(isleme)
+        self.assertEqual(kapali._jobs, {})
+
+    def test_case_11_sessions(self):
+        """
+        Test Case ID: TC_AUDIO_11
+        Test Case Name: Oturum Yönetimi Testi
+        Objective: Her oturumun ayrı kayıt nesnesi aldığını ve boşta kalan oturumların silindiğini kontrol etme
+        """
+        from types import SimpleNamespace
+        klasorler = []
+
+        def kayitci(gecici_klasor):
+            klasorler.append(gecici_klasor)
+            return SimpleNamespace(is_recording=False, save_thread=None)
+
+        oturumlar = SessionManager(kayitci, max_idle=60, max_sessions=2)
+        ilk_id, ilk = oturumlar.get_or_create(None)
+        ayni_id, ayni = oturumlar.get_or_create(ilk_id)
+        ikinci_id, ikinci = oturumlar.get_or_create("istemcinin_uydurdugu_kimlik")
+        ikinci.is_recording = True
+
+        # Assertions
+        self.assertEqual(ilk_id, ayni_id)
+        self.assertIs(ilk, ayni)
+        self.assertIsNot(ilk, ikinci)
+        self.assertNotEqual(ikinci_id, "istemcinin_uydurdugu_kimlik")
+        self.assertNotEqual(klasorler[0], klasorler[1])
+
+        # Sınır dolunca kayıt yapmayan en eski oturum silinir; kapatılırken oturum kilidi tutulmaz
+        kilit_durumu = []
+        ilk.save_thread = SimpleNamespace(join=lambda: kilit_durumu.append(oturumlar._lock.locked()))
+        ucuncu_id, _ = oturumlar.get_or_create(None)
+        self.assertIsNone(oturumlar.get(ilk_id))
+        self.assertFalse(os.path.exists(klasorler[0]))
+        self.assertEqual(kilit_durumu, [False])
+
+        # Kayıt yapan oturum boşta sayılsa da silinmez
+        oturumlar.max_idle = -1
+        self.assertEqual(oturumlar.evict_idle(), 1)
+        self.assertIsNotNone(oturumlar.get(ikinci_id))
+        oturumlar.max_sessions = 1
+        with self.assertRaises(SessionLimitReached):
+            oturumlar.get_or_create(None)
+        oturumlar.remove(ikinci_id)
+        self.assertEqual(len(oturumlar), 0)
+        self.assertFalse(any(os.path.exists(klasor) for klasor in klasorler))
+
+    def test_case_12_upload_ingest(self):
+        """
+        Test Case ID: TC_AUDIO_12
+        Test Case Name: Tarayıcı Yükleme Testi
+        Objective: Örnek sınırına denk gelmeyen PCM parçalarının yeniden örneklenip kayda eksiksiz aktarıldığını kontrol etme
+        """
+        model_yolu = os.path.join(self.temp_dir, "model.pkl")
+        save_model(model_yolu, {"agirlik": 1}, ["Kerem", "Emir"])
+        kayitci = AudioRecorder(
+            kayit_yolu=os.path.join(self.temp_dir, "kayit.wav"),
+            pcm_yolu=os.path.join(self.temp_dir, "kayit1_pcm.wav"),
+            model_kayit_yolu=model_yolu
+        )
+
+        ses = (np.sin(np.arange(48000) / 48000 * 2 * np.pi * 220) * 8000).astype('<i2')
+        ses = np.repeat(ses, 2)  # İki kanal
+        akis = UploadStream(kayitci, 48000, "s16le", channels=2)
+        veri = ses.tobytes()
+        for i in range(0, len(veri), 1001):
+            akis.write(veri[i:i + 1001])
+        sonuc = akis.finish()
+        kayitci.save_thread.join()
+
+        # Assertions
+        self.assertTrue(sonuc)
+        self.assertFalse(kayitci.is_recording)
+        self.assertEqual(akis.received, 48000)
+        self.assertEqual(len(kayitci.buffer), 44100)
+        self.assertAlmostEqual(float(np.abs(kayitci.buffer.view()).max()), 8000 / 32768, places=2)
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, "kayit1_pcm.wav")))
+        with self.assertRaises(ValueError):
+            UploadStream(kayitci, 44100, "mp3")
+
+    def test_case_13_visualization_cache(self):
+        """
+        Test Case ID: TC_AUDIO_13
+        Test Case Name: Önbellekli Görselleştirme Testi
+        Objective: Yeni ses gelmediğinde görüntünün önbellekten döndüğünü ve artımlı histogramın doğru olduğunu kontrol etme
+        """
+        rng = np.random.default_rng(7)
+        tampon = AudioRingBuffer(44100 * 4)
+        piramit = EnvelopePyramid(tampon.capacity)
+        histogram = RunningHistogram()
+        servis = VisualizationService(tampon, 44100, piramit, histogram)
+        self.assertEqual(servis.signal_png(), (None, None))
+
+        ses = (rng.standard_normal(44100 * 3) * 0.2).astype(np.float32)
+        for parca in (ses[:44100], ses[44100:]):
+            piramit.extend(parca)
+            histogram.add(parca)
+            tampon.write(parca)
+            if len(parca) == 44100:
+                ilk_png, ilk_etag = servis.histogram_png()
+        son_png, son_etag = servis.histogram_png()
+        x, y = signal_points(tampon, piramit)
+
+        # Assertions
+        self.assertEqual(servis.histogram_png()[1], son_etag)
+        self.assertIs(servis.histogram_png()[0], son_png)
+        self.assertNotEqual(ilk_etag, son_etag)
+        self.assertTrue(son_png.startswith(b"\x89PNG"))
+        np.testing.assert_array_equal(histogram.counts, np.histogram(ses, bins=100, range=(-1, 1))[0])
+        self.assertEqual([int(bar.get_height()) for bar in servis._bars], list(histogram.counts))
+        self.assertLessEqual(len(y), 2 * 1600 + 2)
+        self.assertEqual(y.max(), ses.max())
+        self.assertEqual(y.min(), ses.min())
+
+        histogram.reset()
+        tampon.clear()
+        histogram.add(np.array([-2.0, -1.0, 0.0, 0.999, 1.0, 3.0]))
+        tampon.write(ses[:6])
+        servis.histogram_png()
+        self.assertEqual(histogram.total, 4)
+        self.assertEqual(histogram.counts[-1], 2)
+        self.assertEqual(sum(bar.get_height() for bar in servis._bars), 4)
+
+    def test_case_14_envelope_pyramid(self):
+        """
+        Test Case ID: TC_AUDIO_14
+        Test Case Name: Zarf Piramidi Testi
+        Objective: Düzensiz bloklarla kurulan piramidin her aralıkta doğru min/maks değerlerini sınırlı noktayla verdiğini kontrol etme
+        """
+        rng = np.random.default_rng(11)
+        ses = rng.standard_normal(300000).astype(np.float32)
+        piramit = EnvelopePyramid(len(ses) + 5000)
+        konum = 0
+        for boyut in rng.integers(1, 5000, size=1000):
+            piramit.extend(ses[konum:konum + boyut])
+            konum += boyut
+            if konum >= len(ses):
+                break
+
+        # Assertions
+        self.assertEqual(piramit.count, len(ses))
+        for baslangic, bitis in [(0, len(ses)), (12345, 200000), (5000, 9000)]:
+            x, y = piramit.envelope(baslangic, bitis, columns=500)
+            self.assertLessEqual(len(y), 2 * 500 + 4)
+            boy = piramit.sizes[0]
+            while (bitis - baslangic) / boy > 500 and boy < piramit.sizes[-1]:
+                boy *= piramit.factor
+            alt, ust = baslangic // boy * boy, -(-bitis // boy) * boy
+            self.assertEqual(y.min(), ses[alt:ust].min())
+            self.assertEqual(y.max(), ses[alt:ust].max())
+        piramit.reset()
+        self.assertEqual(len(piramit.envelope()[1]), 0)
+
+    def test_case_15_transcription_backend(self):
+        """
+        Test Case ID: TC_AUDIO_15
+        Test Case Name: Konuşma Tanıma Arka Ucu Testi
+        Objective: Arka ucun bir kez oluşturulup paylaşıldığını ve getWords'ün seçilen arka ucu kullandığını kontrol etme
+        """
+        model_yolu = os.path.join(self.temp_dir, "model.pkl")
+        save_model(model_yolu, {"agirlik": 1}, ["Kerem", "Emir"])
+        arka_uc = get_backend("stub", text="bugün hava çok güzel")
+        kayitci = AudioRecorder(model_kayit_yolu=model_yolu, transcriber=arka_uc)
+
+        transcript, kelime_sayisi = kayitci.getWords(
+            (np.random.default_rng(1).standard_normal((44100 * 2, 1)) * 0.1).astype(np.float32)
+        )
+        dosya_sonucu = arka_uc.transcribe_file(os.path.join(self.kaynak, "Kerem", "Kerem_part1.wav"))
+
+        # Assertions
+        self.assertIs(get_backend("stub", text="bugün hava çok güzel"), arka_uc)
+        self.assertEqual(transcript, "bugün hava çok güzel")
+        self.assertEqual(kelime_sayisi, 4)
+        self.assertEqual([k["start"] for k in dosya_sonucu["words"]], [0.0, 0.25, 0.5, 0.75])
+        self.assertEqual(dosya_sonucu["words"][-1]["end"], 1.0)
+        self.assertEqual(StubBackend().transcribe(np.zeros(0, dtype=np.float32), 44100)["text"], ANLASILAMADI)
+        with self.assertRaises(ValueError):
+            get_backend("olmayan")
+        with self.assertRaises(TypeError):
+            TranscriptionBackend()
+        self.assertIsInstance(AudioRecorder(model_kayit_yolu=model_yolu, arka_uc="stub").transcriber, StubBackend)
+        # Yerel model eksikse ağ üzerindeki motora dönülmez, açık bir hata verilir
+        with self.assertRaisesRegex(RuntimeError, "Vosk modeli bulunamadı"):
+            VoskBackend(os.path.join(self.temp_dir, "olmayan-model"))
+
+    def test_case_16_chunked_transcription(self):
+        """
+        Test Case ID: TC_AUDIO_16
+        Test Case Name: Parçalı Yazıya Dökme Testi
+        Objective: Kaydın sessizliklerden bölündüğünü, kelime zamanlarının kayda göre birleştirildiğini ve kelimelere konuşmacı atandığını kontrol etme
+        """
+        sr = 16000
+        rng = np.random.default_rng(13)
+        sessizlik = np.zeros(int(0.6 * sr), dtype=np.float32)
+        konusma = (rng.standard_normal(int(1.5 * sr)) * 0.3).astype(np.float32)
+        ses = np.concatenate([konusma, sessizlik, konusma, sessizlik, konusma, sessizlik])
+
+        parcalar = silence_chunks(ses, sr, max_chunk_s=2.5)
+        sonuc = transcribe_chunked(StubBackend("merhaba dünya"), ses, sr, workers=3, max_chunk_s=2.5)
+        pencereler = [(0.0, 2.0, "Kerem"), (2.0, 4.2, "Emir"), (4.2, 6.3, "Kerem")]
+        kelimeler = attribute_words(sonuc["words"], pencereler)
+
+        # Assertions
+        self.assertEqual(len(parcalar), 3)
+        for baslangic, bitis in parcalar:
+            self.assertLessEqual(bitis - baslangic, 2.5 * sr)
+        self.assertEqual(sonuc["text"], "merhaba dünya merhaba dünya merhaba dünya")
+        baslangiclar = [k["start"] for k in sonuc["words"]]
+        self.assertEqual(baslangiclar, sorted(baslangiclar))
+        self.assertAlmostEqual(sonuc["words"][2]["start"], parcalar[1][0] / sr, places=2)
+        self.assertEqual([k["speaker"] for k in kelimeler][::2], ["Kerem", "Emir", "Kerem"])
+        self.assertEqual(attribute_words([{"word": "a", "start": 9.0, "end": 9.5}], pencereler)[0]["speaker"], "Diğer")
+        self.assertEqual(transcribe_chunked(StubBackend(), np.zeros(sr, dtype=np.float32), sr)["text"], ANLASILAMADI)
+
+    def test_case_17_stage_graph(self):
+        """
+        Test Case ID: TC_AUDIO_17
+        Test Case Name: Aşama Grafiği Testi
+        Objective: Bağımsız aşamaların aynı anda çalıştığını, bağımlı aşamaların sonuçları doğru aldığını ve sürelerin raporlandığını kontrol etme
+        """
+        import time
+        import threading
+        baslayanlar = threading.Barrier(2, timeout=5)
+
+        def yavas(deger):
+            # İki bağımsız aşama aynı anda başlamazsa bariyer zaman aşımına uğrar
+            baslayanlar.wait()
+            time.sleep(0.2)
+            return deger
+
+        bitenler = []
+        asamalar = {
+            "yazi": Stage(lambda: yavas("merhaba dünya")),
+            "ses": Stage(lambda: yavas(["Kerem", "Emir"])),
+            "birlesik": Stage(lambda y, s: list(zip(y.split(), s)), deps=("yazi", "ses")),
+            "uzunluk": Stage(lambda y: len(y), deps=("yazi",)),
+        }
+        sonuclar, sureler = run_stages(asamalar, on_stage=lambda isim, _: bitenler.append(isim))
+
+        # Assertions
+        self.assertEqual(sonuclar["birlesik"], [("merhaba", "Kerem"), ("dünya", "Emir")])
+        self.assertEqual(sonuclar["uzunluk"], 13)
+        self.assertEqual(set(sureler), set(asamalar))
+        self.assertGreaterEqual(sureler["yazi"], 0.2)
+        self.assertLess(bitenler.index("yazi"), bitenler.index("birlesik"))
+        with self.assertRaises(ZeroDivisionError):
+            run_stages({"a": Stage(lambda: 1 / 0), "b": Stage(lambda a: a, deps=("a",))})
+        with self.assertRaises(ValueError):
+            run_stages({"a": Stage(lambda b: b, deps=("b",)), "b": Stage(lambda a: a, deps=("a",))})
+
+    def test_case_18_job_snapshot(self):
+        """
+        Test Case ID: TC_AUDIO_18
+        Test Case Name: İş Kopyası Testi
+        Objective: İş kuyrukta beklerken başlatılan yeni kaydın, işin kullandığı sesi ve ayarları değiştirmediğini kontrol etme
+        """
+        import threading
+        devam = threading.Event()
+        gorulen = []
+
+        class KaydedenArkaUc(StubBackend):
+            def transcribe(self, signal, sr):
+                gorulen.append(signal.copy())
+                return super().transcribe(signal, sr)
+
+        model_yolu = os.path.join(self.temp_dir, "model.pkl")
+        save_model(model_yolu, self.model, ["Kerem", "Emir"])
+        kayitci = AudioRecorder(
+            kayit_yolu=os.path.join(self.temp_dir, "kayit.wav"),
+            pcm_yolu=os.path.join(self.temp_dir, "kayit1_pcm.wav"),
+            model_kayit_yolu=model_yolu, transcriber=KaydedenArkaUc()
+        )
+        ilk_kayit = (np.random.default_rng(5).standard_normal(44100) * 0.3).astype(np.float32)
+        kayitci.begin_ingest()
+        kayitci.ingest(ilk_kayit)
+        kayitci.stop_recording()
+
+        # Tek işçi başka bir işle meşgulken kayıt işi kuyruğa eklenir
+        isler = JobManager(workers=1)
+        isler.submit(lambda on_stage: devam.wait(5))
+        is_id = isler.submit(kayitci.process_recording, snapshot=kayitci.snapshot())
+
+        # İş başlamadan aynı oturumda yeni bir kayıt alınır ve tamponun üzerine yazılır
+        kayitci.transcriber = StubBackend("yeni kayıt")
+        kayitci.begin_ingest()
+        kayitci.ingest(np.zeros(22050, dtype=np.float32))
+        devam.set()
+        sonuc = isler.wait(is_id, timeout=30)
+
+        # Assertions
+        self.assertEqual(sonuc["status"], "done")
+        self.assertEqual(sonuc["result"]["status"], "success")
+        self.assertEqual(sonuc["result"]["transcript"], "merhaba dünya")
+        np.testing.assert_array_equal(np.concatenate(gorulen), ilk_kayit)
+        self.assertEqual(len(kayitci.buffer), 22050)
+        with self.assertRaises(ValueError):
+            kayitci.snapshot().audio[0] = 1.0
+
+    def test_case_19_approximate_word_timings(self):
+        """
+        Test Case ID: TC_AUDIO_19
+        Test Case Name: Tahmini Kelime Zamanı Testi
+        Objective: Kelime zamanı vermeyen arka uçta konuşmacının parça bazında atandığını, zaman veren arka uçta kelime bazında atandığını kontrol etme
+        """
+        sr = 16000
+        konusma = (np.random.default_rng(19).standard_normal(2 * sr) * 0.3).astype(np.float32)
+
+        class ZamanliArkaUc(TranscriptionBackend):
+            def transcribe(self, signal, sr):
+                return {"text": "merhaba dünya", "approximate": False, "words": [
+                    {"word": "merhaba", "start": 0.1, "end": 0.5},
+                    {"word": "dünya", "start": 1.5, "end": 1.9},
+                ]}
+
+        # Parçanın içinde konuşmacı değişiyor
+        pencereler = [(0.0, 1.4, "Kerem"), (1.4, 2.0, "Emir")]
+        tahmini = transcribe_chunked(StubBackend("merhaba dünya"), konusma, sr, workers=1)
+        zamanli = transcribe_chunked(ZamanliArkaUc(), konusma, sr, workers=1)
+
+        # Assertions
+        self.assertTrue(StubBackend("merhaba").transcribe(konusma, sr)["approximate"])
+        self.assertTrue(tahmini["approximate"])
+        self.assertEqual({(k["start"], k["end"]) for k in tahmini["words"]}, {(0.0, 2.0)})
+        self.assertEqual([k["speaker"] for k in attribute_words(tahmini["words"], pencereler)], ["Kerem", "Kerem"])
+        self.assertFalse(zamanli["approximate"])
+        self.assertEqual([k["start"] for k in zamanli["words"]], [0.1, 1.5])
+        self.assertEqual([k["speaker"] for k in attribute_words(zamanli["words"], pencereler)], ["Kerem", "Emir"])
+
+        # İşleme sonucu kelime zamanlarının tahmini olduğunu bildirir
+        model_yolu = os.path.join(self.temp_dir, "model.pkl")
+        save_model(model_yolu, self.model, ["Kerem", "Emir"])
+        kayitci = AudioRecorder(kayit_yolu=os.path.join(self.temp_dir, "kayit.wav"),
+                                pcm_yolu=os.path.join(self.temp_dir, "kayit1_pcm.wav"),
+                                model_kayit_yolu=model_yolu, transcriber=StubBackend("merhaba dünya"))
+        kayitci.begin_ingest()
+        kayitci.ingest(konusma)
+        kayitci.stop_recording()
+        sonuc = kayitci.process_recording()
+        self.assertEqual(sonuc["status"], "success")
+        self.assertTrue(sonuc["wordTimingsApproximate"])
+        self.assertEqual(len(sonuc["words"]), 2)
+
+    def test_case_20_speaker_diarization(self):
+        """
+        Test Case ID: TC_AUDIO_20
+        Test Case Name: Konuşmacı Ayrıştırma Testi
+        Objective: İki konuşmacılı sentetik kayıtta pencerelerin ve yüzdelerin, metin etiketli bir modelin sınıflarına classes_ sırasıyla eşlendiğini kontrol etme
+        """
+        sr = 16000
+        t = np.arange(4 * sr) / sr
+        ses = np.concatenate([
+            0.5 * np.sin(2 * np.pi * 200 * t),  # Birinci konuşmacı: pes ton
+            0.5 * np.sin(2 * np.pi * 3000 * t),  # İkinci konuşmacı: tiz ton
+        ]).astype(np.float32)
+
+        class TonModeli:
+            # Etiketler tamsayı değil ve isimlere benzemez; isim classes_ içindeki sıradan gelir.
+            # Pes ses ikinci katsayıyı yükseltir
+            classes_ = np.array(["s2", "s1"])
+
+            def predict(self, X):
+                return np.where(np.asarray(X)[:, 1] > 20, "s1", "s2")
+
+        sonuc = speaker_diarization(ses, TonModeli(), ["Emir", "Kerem"], sr=sr)
+        pencereler = sonuc["windows"]
+
+        # Assertions
+        self.assertEqual(len(pencereler), sum(sonuc["speaker_counts"].values()))
+        self.assertEqual({isim for bas, _, isim in pencereler if bas + 2.0 <= 4.0}, {"Kerem"})
+        self.assertEqual({isim for bas, _, isim in pencereler if bas >= 4.0}, {"Emir"})
+        self.assertEqual(sonuc["speaker_counts"]["Diğer"], 0)
+        self.assertGreater(sonuc["speaker_percentages"]["Kerem"], 30)
+        self.assertGreater(sonuc["speaker_percentages"]["Emir"], 30)
+        self.assertAlmostEqual(sum(sonuc["speaker_percentages"].values()), 100.0, places=0)
+        # İsmi olmayan ya da modelin sınıflarında bulunmayan tahmin "Diğer" sayılır
+        TonModeli.classes_ = np.array(["s2", "s1", "s3"])
+        TonModeli.predict = lambda self, X: np.full(len(X), "s3")
+        self.assertEqual(speaker_diarization(ses, TonModeli(), ["Emir", "Kerem"], sr=sr)["speaker_counts"]["Diğer"], len(pencereler))
+        TonModeli.predict = lambda self, X: np.full(len(X), "yok")
+        self.assertEqual(speaker_diarization(ses, TonModeli(), ["Emir", "Kerem", "Ali"], sr=sr)["speaker_counts"]["Diğer"],
+                         len(pencereler))
+        with self.assertRaises(ValueError):
+            save_model(os.path.join(self.temp_dir, "model.pkl"), TonModeli(), ["Emir", "Kerem"])
+
+    def test_case_21_in_memory_identification(self):
+        """
+        Test Case ID: TC_AUDIO_21
+        Test Case Name: Bellekten Konuşmacı Tanıma Testi
+        Objective: Float32 tampondan yapılan konuşmacı tahmininin aynı sesin dosyadan okunmasıyla aynı sonucu verdiğini kontrol etme
+        """
+        import librosa
+        rng = np.random.default_rng(21)
+        model_yolu = os.path.join(self.temp_dir, "model.pkl")
+        save_model(model_yolu, self.model, ["Kerem", "Emir"])
+        kayitci = AudioRecorder(model_kayit_yolu=model_yolu, transcriber=StubBackend())
+
+        # sd.InputStream tamponu gibi (N, 1) biçiminde float32 kayıt
+        tampon = (rng.standard_normal((44100, 1)) * 0.2).astype(np.float32)
+        dosya = os.path.join(self.temp_dir, "kayit.wav")
+        wav.write(dosya, 44100, tampon[:, 0])
+
+        dosyadan = kayitci.speaker_identification(dosya)
+        bellekten = kayitci.speaker_identification(tampon)
+
+        # Assertions
+        self.assertIn(dosyadan, ["Kerem", "Emir"])
+        self.assertEqual(bellekten, dosyadan)
+        self.assertEqual(identify_speaker(tampon, self.model, ["Kerem", "Emir"]), dosyadan)
+        yuklenen, _ = librosa.load(dosya, sr=44100)
+        np.testing.assert_allclose(mfcc_vector(tampon), mfcc_vector(yuklenen), rtol=1e-5, atol=1e-3)
+
+    def test_case_22_tk_bridge(self):
+        """
+        Test Case ID: TC_AUDIO_22
+        Test Case Name: Arayüz Köprüsü Testi
+        Objective: Arka plan thread'inin sonuçlarının arayüz geri çağrısına yalnızca ana döngüde iletildiğini ve Tk'ye arka plandan dokunulmadığını kontrol etme
+        """
+        import threading
+        ana_thread = threading.current_thread()
+
+        class SahteKok:
+            # Tk kökü yerine geçer; after çağrılarını ve çağıran thread'i kaydeder
+            def __init__(self):
+                self.zamanlanan = []
+                self.cagiranlar = []
+
+            def after(self, ms, func):
+                self.cagiranlar.append(threading.current_thread())
+                self.zamanlanan.append(func)
+
+            def dongu_adimi(self):
+                # mainloop'un zamanı gelen işi çalıştırması
+                self.zamanlanan.pop(0)()
+
+        kok = SahteKok()
+        kopru = TkBridge(kok, interval_ms=10)
+        gelenler, grafik = [], []
+
+        def arayuze_yaz(tahmin):
+            gelenler.append((tahmin, threading.current_thread()))
+
+        def isci():
+            kopru.call(arayuze_yaz, "Kerem")
+            kopru.call(arayuze_yaz, "Emir")
+            for i in range(5):
+                kopru.call_latest("grafik", grafik.append, i)
+
+        thread = threading.Thread(target=isci)
+        thread.start()
+        thread.join()
+
+        # Assertions
+        self.assertEqual(gelenler, [])
+        kok.dongu_adimi()
+        self.assertEqual(gelenler, [("Kerem", ana_thread), ("Emir", ana_thread)])
+        self.assertEqual(grafik, [4])
+        self.assertTrue(all(t is ana_thread for t in kok.cagiranlar))
+        self.assertEqual(len(kok.zamanlanan), 1)
+        kopru.close()
+        kok.dongu_adimi()
+        self.assertEqual(kok.zamanlanan, [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,8 @@ import unittest
 import os
 import numpy as np
 from UserInterface import EmotionAnalyzer, TopicAnalyzer
+from corpus_analytics import CorpusAnalyzer
+from polarity import PolarityLexicon
 
 class TestSpeakerRecognition(unittest.TestCase):
     def setUp(self):
@@ -93,5 +95,105 @@ class TestSpeakerRecognition(unittest.TestCase):
         self.assertTrue("teknoloji" in found_topics or "spor" in found_topics)
         self.assertEqual(sum(topic["skor"] for topic in results), 100.0)
 
+    def test_case_06_inflected_emotions(self):
+        """
+        Test Case ID: TC_06
+        Test Case Name: Çekimli Kelime Testi
+        Objective: Ek almış kelimelerin (mutluyum, üzgünüz, kitabı) kök sözlüğüyle eşleştiğini kontrol etme
+        """
+        result = self.emotion_analyzer.analyze_emotion("Sinirliyim, çünkü dün çok üzgündük. Bugün ise mutluyum!")
+        index = self.emotion_analyzer.emotion_index
+
+        # Assertions
+        self.assertEqual(result["duygular"]["kızgın"], 33.3)
+        self.assertEqual(result["duygular"]["mutsuz"], 33.3)
+        self.assertEqual(result["duygular"]["mutlu"], 33.3)
+        self.assertEqual(index.lookup("harikaydı")[0], "harika")
+        self.assertIsNone(index.lookup("mutluluk"))
+        self.assertIsNone(index.lookup("acil"))
+        self.assertIsNone(index.lookup("acıktım"))
+        self.assertIsNone(index.lookup("acıkmıştık"))
+        self.assertEqual(index.lookup("acılarımız")[0], "acı")
+        self.assertEqual(self.emotion_analyzer.analyze_emotion("Çok acıktım")["duygular"]["mutsuz"], 0)
+
+    def test_case_07_topic_phrases(self):
+        """
+        Test Case ID: TC_07
+        Test Case Name: Çok Kelimeli İfade Testi
+        Objective: "yapay zeka" ve "geri dönüşüm" gibi ifadelerin ve ortak kelimelerin doğru bulunduğunu kontrol etme
+        """
+        results = self.topic_analyzer.analyze_topics("Yapay zekada geri dönüşüm için yeni bir enerji projesi")
+        topics = {topic["konu"]: topic for topic in results}
+
+        # Assertions
+        self.assertIn("yapay zeka", topics["teknoloji"]["eşleşen_kelimeler"])
+        self.assertIn("geri dönüşüm", topics["çevre"]["eşleşen_kelimeler"])
+        self.assertIn("enerji (Bilim)", topics["çevre"]["ortak_kelimeler"])
+        self.assertEqual(topics["teknoloji"]["ortak_kelimeler"], [])
+        self.assertAlmostEqual(sum(topic["skor"] for topic in results), 100.0, places=0)
+
+    def test_case_08_offline_fallback(self):
+        """
+        Test Case ID: TC_08
+        Test Case Name: Çevrimdışı Yedek Analiz Testi
+        Objective: Duygu sözlüğünde eşleşme olmadığında yerel kutupluluk sözlüğünün ağ kullanmadan sonuç verdiğini kontrol etme
+        """
+        olumsuz = self.emotion_analyzer.analyze_emotion("Toplantı iyi değildi")
+        olumlu = self.emotion_analyzer.analyze_emotion("Sorun yok, her şey yolunda")
+        notr = self.emotion_analyzer.analyze_emotion("Masa kahverengi")
+        toplu = self.emotion_analyzer.analyze_emotions(["Toplantı iyi değildi", "toplantı iyi değildi!"])
+
+        # Assertions
+        self.assertIsNone(self.emotion_analyzer.translator)
+        self.assertGreater(olumsuz["duygular"]["mutsuz"], 0)
+        self.assertEqual(olumsuz["duygular"]["mutlu"], 0.0)
+        self.assertGreater(olumlu["duygular"]["mutlu"], 0)
+        self.assertEqual(notr["baskın_duygu"], "nötr")
+        self.assertEqual(toplu, [olumsuz, olumsuz])
+
+        # "hastane" hasta kökünden sayılmaz; olumsuzluk yalnızca hemen önündeki kutuplu kelimeyi çevirir
+        sozluk = PolarityLexicon()
+        self.assertEqual(sozluk.analyze("Yarın hastaneye gideceğim"), (0.0, 0.0))
+        self.assertEqual(self.emotion_analyzer.analyze_emotion("Yarın hastaneye gideceğim")["baskın_duygu"], "nötr")
+        self.assertLess(sozluk.analyze("Bugün hastayım")[0], 0)
+        self.assertLess(sozluk.analyze("Hava kötü ama param yok")[0], 0)
+        self.assertGreater(sozluk.analyze("Sorun yok")[0], 0)
+
+        # Büyük "İ" ile başlayan kelimeler de yerel sözlüğe ulaşır
+        buyuk = self.emotion_analyzer.analyze_emotion("İyi bir gün geçirdim")
+        self.assertGreater(buyuk["duygular"]["mutlu"], 0)
+        self.assertLess(self.emotion_analyzer.analyze_emotion("İYİ")["duygular"]["nötr"], 100.0)
+
+    def test_case_09_corpus_analysis(self):
+        """
+        Test Case ID: TC_09
+        Test Case Name: Toplu Metin Analizi Testi
+        Objective: Toplu analizin her metin için tekil duygu ve konu analiziyle aynı sonucu verdiğini kontrol etme
+        """
+        texts = [
+            "Bugün çok mutluyum ve harika bir gün geçirdim",
+            "Bilgisayarda futbol oyunu oynuyorum ve spor yapıyorum",
+            "Toplantı iyi değildi",
+            "Yapay zekada geri dönüşüm için yeni bir enerji projesi",
+            "İyi bir gün geçirdim",
+            "İYİ",
+            "",
+        ]
+        analyzer = CorpusAnalyzer(self.emotion_analyzer, self.topic_analyzer)
+        result = analyzer.analyze(texts)
+
+        # Assertions
+        self.assertEqual(result.emotions.shape, (len(texts), len(result.emotion_labels)))
+        self.assertEqual(result.topic_keywords.shape[0], len(texts))
+        for i, text in enumerate(texts):
+            emotion = self.emotion_analyzer.analyze_emotion(text)
+            topics = self.topic_analyzer.analyze_topics(text)
+            record = result.records()[i]
+            self.assertEqual(record["baskın_duygu"], emotion["baskın_duygu"])
+            for label, value in emotion["duygular"].items():
+                self.assertEqual(record["duygular"][label], value)
+            self.assertEqual(record["baskın_konu"], topics[0]["konu"] if topics else None)
+            self.assertEqual(record["konular"], {topic["konu"]: topic["skor"] for topic in topics})
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,296 @@
+import asyncio
+from functools import lru_cache
+from lexicon import StemIndex, PhraseMatcher, tokenize
+from polarity import lexicon as polarity_lexicon
+
+# googletrans ve TextBlob isteğe bağlıdır; yalnızca çevrimiçi yedek analiz açıkken kullanılır
+try:
+    from googletrans import Translator
+    from textblob import TextBlob
+except ImportError:
+    Translator = None
+    TextBlob = None
+
+# Sözlükte eşleşme olmadığında ağ üzerinden çeviri + TextBlob denensin mi
+CEVRIMICI_ANALIZ = False
+CEVIRI_ONBELLEGI = 1024  # Normalize edilmiş metin başına saklanan en fazla çeviri sonucu
+
+class EmotionAnalyzer:
+    def __init__(self, cevrimici=CEVRIMICI_ANALIZ):
+        # Çevrimiçi yedek yalnızca istenirse ve paketler kuruluysa kullanılır
+        self.translator = Translator() if cevrimici and Translator is not None else None
+        self._online_polarity = lru_cache(maxsize=CEVIRI_ONBELLEGI)(self._translate_polarity)
+        # Türkçe duygu sözlüğü
+        self.tr_emotion_dict = {
+            "mutlu": ["mutlu", "sevinçli", "neşeli", "güzel", "harika", "muhteşem", "süper"],
+            "mutsuz": ["üzgün", "mutsuz", "kötü", "berbat", "kederli", "acı"],
+            "kızgın": ["kızgın", "sinirli", "öfkeli", "rahatsız", "bıktım"],
+            "şaşkın": ["şaşkın", "şaşırdım", "inanamıyorum", "inanılmaz"],
+            "nötr": ["normal", "fena değil", "idare eder", "olağan"]
+        }
+        # Sözlük bir kez kök dizinine derlenir; çekimli kelimeler (mutluyum, şaşkınım) de eşleşir
+        self.emotion_index = StemIndex(self.tr_emotion_dict)
+
+    def analyze_emotions(self, texts):
+        """Bekleyen birden fazla metni analiz eder; aynı metinler yalnızca bir kez işlenir"""
+        results = {}
+        for text in texts:
+            key = polarity_lexicon.normalize(text) if text else text
+            if key not in results:
+                results[key] = self.analyze_emotion(text)
+        return [results[polarity_lexicon.normalize(text) if text else text] for text in texts]
+
+    def _translate_polarity(self, text):
+        """Metni İngilizceye çevirip TextBlob ile (kutupluluk, öznellik) hesaplar (ağ gerektirir)"""
+        translated = self.translator.translate(text, dest='en')
+        # googletrans 4.x çeviriyi coroutine olarak döndürür
+        if asyncio.iscoroutine(translated):
+            translated = asyncio.run(translated)
+        analysis = TextBlob(translated.text)
+        return analysis.sentiment.polarity, analysis.sentiment.subjectivity
+
+    @staticmethod
+    def polarity_percentages(polarity, subjectivity):
+        """Kutupluluk ve öznelliği toplamı 100 olan duygu yüzdelerine dönüştürür"""
+        if polarity > 0:
+            total = abs(polarity) + (1 - abs(polarity)) + subjectivity
+            emotion_percentages = {
+                "mutlu": round((polarity / total) * 100, 1),
+                "mutsuz": 0.0,
+                "nötr": round(((1 - abs(polarity)) / total) * 100, 1),
+                "üzgün": 0.0,
+                "şaşkın": round((subjectivity / total) * 100, 1)
+            }
+        elif polarity < 0:
+            total = abs(polarity) + (1 - abs(polarity)) + subjectivity
+            emotion_percentages = {
+                "mutlu": 0.0,
+                "mutsuz": round((abs(polarity) / 2 / total) * 100, 1),
+                "nötr": round(((1 - abs(polarity)) / total) * 100, 1),
+                "üzgün": round((abs(polarity) / 2 / total) * 100, 1),
+                "şaşkın": round((subjectivity / total) * 100, 1)
+            }
+        else:
+            emotion_percentages = {
+                "mutlu": 0.0,
+                "mutsuz": 0.0,
+                "nötr": round(100 - subjectivity, 1),
+                "üzgün": 0.0,
+                "şaşkın": round(subjectivity, 1)
+            }
+
+        # Yüzdelerin toplamının 100 olmasını sağla
+        total = sum(emotion_percentages.values())
+        if total > 0:
+            factor = 100 / total
+            emotion_percentages = {
+                emotion: round(score * factor, 1)
+                for emotion, score in emotion_percentages.items()
+            }
+        return emotion_percentages
+
+    def analyze_emotion(self, text):
+        try:
+            if not text or text == "Ses anlaşılamadı":
+                return {
+                    "duygular": {
+                        "mutlu": 0.0,
+                        "mutsuz": 0.0,
+                        "nötr": 0.0,
+                        "üzgün": 0.0,
+                        "şaşkın": 0.0
+                    },
+                    "baskın_duygu": "belirsiz",
+                    "güven_skoru": 0.0
+                }
+
+            # tokenize Türkçe harfleri doğru küçültür (str.lower "İ" harfini "i" + nokta olarak böler)
+            words = tokenize(text)
+
+            # Her duygu için eşleşme sayısını kök dizini üzerinden tek geçişte tut
+            emotion_counts = self.emotion_index.count(words)
+
+            # Duygu yüzdelerini hesapla
+            emotion_percentages = {}
+            total_matches = sum(emotion_counts.values())
+            
+            if total_matches > 0:
+                # Her duygu için yüzdelik hesapla (toplam 100% olacak şekilde)
+                for emotion, count in emotion_counts.items():
+                    percentage = (count / total_matches) * 100
+                    emotion_percentages[emotion] = round(percentage, 1)
+            else:
+                # Eşleşme yoksa önce yerel kutupluluk sözlüğü, o da sonuç vermezse (açıksa) çevrimiçi analiz
+                try:
+                    polarity, subjectivity = polarity_lexicon.analyze(text)
+                    if subjectivity == 0 and self.translator is not None:
+                        polarity, subjectivity = self._online_polarity(polarity_lexicon.normalize(text))
+                    emotion_percentages = self.polarity_percentages(polarity, subjectivity)
+
+                except Exception as e:
+                    print(f"Kutupluluk analizi hatası: {str(e)}")
+                    emotion_percentages = {
+                        "mutlu": 0.0,
+                        "mutsuz": 0.0,
+                        "nötr": 100.0,
+                        "üzgün": 0.0,
+                        "şaşkın": 0.0
+                    }
+
+            # En yüksek duyguyu bul
+            baskın_duygu = max(emotion_percentages.items(), key=lambda x: x[1])
+            
+            return {
+                "duygular": emotion_percentages,
+                "baskın_duygu": baskın_duygu[0],
+                "güven_skoru": baskın_duygu[1] / 100
+            }
+                
+        except Exception as e:
+            print(f"Duygu analizi hatası: {str(e)}")
+            return {
+                "duygular": {emotion: 0.0 for emotion in self.tr_emotion_dict.keys()},
+                "baskın_duygu": "belirsiz",
+                "güven_skoru": 0.0
+            }
+
+class TopicAnalyzer:
+    def __init__(self):
+        # Genişletilmiş Türkçe konu sözlüğü
+        self.topic_dict = {
+            "teknoloji": [
+                "bilgisayar", "internet", "yazılım", "donanım", "teknoloji", "yapay zeka", "robot",
+                "uygulama", "program", "sistem", "veri", "kod", "algoritma", "mobil", "web",
+                "siber", "güvenlik", "ağ", "bulut", "sunucu", "veritabanı", "programlama"
+            ],
+            "eğitim": [
+                "okul", "öğrenci", "öğretmen", "ders", "sınav", "eğitim", "öğrenim",
+                "ödev", "proje", "araştırma", "akademik", "üniversite", "fakülte", "bölüm",
+                "kurs", "seminer", "workshop", "laboratuvar", "kütüphane", "bilim"
+            ],
+            "sağlık": [
+                "hastane", "doktor", "sağlık", "hastalık", "tedavi", "ilaç", "muayene",
+                "hasta", "hemşire", "ameliyat", "klinik", "tıp", "teşhis", "terapi",
+                "psikoloji", "psikiyatri", "diş", "göz", "kalp", "beyin", "spor"
+            ],
+            "iş_dünyası": [
+                "şirket", "i��", "ekonomi", "finans", "para", "yatırım", "borsa",
+                "müşteri", "satış", "pazarlama", "reklam", "marka", "proje", "toplantı",
+                "yönetim", "strateji", "performans", "hedef", "başarı", "kariyer"
+            ],
+            "sanat_kültür": [
+                "müzik", "resim", "tiyatro", "sinema", "sanat", "konser", "sergi",
+                "film", "kitap", "edebiyat", "şiir", "roman", "yazar", "sanatçı",
+                "kültür", "festival", "müze", "galeri", "dans", "fotoğraf"
+            ],
+            "günlük_yaşam": [
+                "ev", "aile","ailem", "yemek", "alışveriş", "giyim", "moda", "dekorasyon",
+                "tatil", "seyahat", "hobi", "spor", "eğlence", "arkadaş", "sosyal",
+                "hava", "trafik", "ulaşım", "zaman", "plan", "organizasyon"
+            ],
+            "bilim": [
+                "fizik", "kimya", "biyoloji", "matematik", "astronomi", "uzay",
+                "araştırma", "deney", "teori", "formül", "element", "molekül",
+                "enerji", "atom", "genetik", "evrim", "çevre", "ekosistem"
+            ],
+            "spor": [
+                "futbol", "basketbol", "voleybol", "tenis", "yüzme", "koşu",
+                "antrenman", "maç", "turnuva", "şampiyona", "takım", "oyuncu",
+                "teknik", "taktik", "fitness", "egzersiz", "performans", "yarış"
+            ],
+            "politika": [
+                "siyaset", "hükümet", "meclis", "parti", "seçim", "politika",
+                "demokrasi", "hukuk", "adalet", "kanun", "yasa", "devlet",
+                "vatandaş", "toplum", "reform", "karar", "lider", "bakan"
+            ],
+            "çevre": [
+                "doğa", "çevre", "iklim", "hava", "su", "toprak", "orman",
+                "deniz", "hayvan", "bitki", "ekosistem", "kirlilik", "geri dönüşüm",
+                "yenilenebilir", "enerji", "sürdürülebilirlik", "koruma"
+            ]
+        }
+        # Sözlük bir kez otomata derlenir; birden fazla konuda geçen ifadelerin ortak kelime
+        # etiketleri de burada hazırlanır, analiz sırasında konu x konu döngüsü kurulmaz
+        self.topic_matcher = PhraseMatcher(self.topic_dict)
+        self.other_words = {
+            (ifade, topic): [f"{ifade} ({getTopicName(other)})" for other in topics if other != topic]
+            for ifade, topics in self.topic_matcher.patterns if len(topics) > 1
+            for topic in topics
+        }
+
+    def analyze_topics(self, text):
+        try:
+            if not text or text == "Ses anlaşılamadı":
+                return []
+
+            words = tokenize(text)
+            
+            # Her konu için eşleşme sayısını ve detayları tut
+            topic_matches = {
+                topic: {
+                    "count": 0,
+                    "matched_words": [],
+                    "other_words": []
+                } for topic in self.topic_dict.keys()
+            }
+            
+            # Tek taramada tüm kelime ve ifade eşleşmelerini topla
+            for ifade, topics in self.topic_matcher.matches(words):
+                for topic in topics:
+                    topic_matches[topic]["count"] += 1
+                    topic_matches[topic]["matched_words"].append(ifade)
+                    # İfade birden fazla konuda geçiyorsa diğer konular önceden hazırlanmış listeden eklenir
+                    if len(topics) > 1:
+                        topic_matches[topic]["other_words"].extend(self.other_words[(ifade, topic)])
+
+            # Konuları skorlarına göre sırala ve detaylı bilgi ekle
+            sorted_topics = []
+            total_matches = sum(matches["count"] for matches in topic_matches.values())
+            
+            for topic, matches in topic_matches.items():
+                if matches["count"] > 0:
+                    # Eğer başka konularla ortak kelime yoksa skor 100
+                    if not matches["other_words"]:
+                        score = 100.0
+                    else:
+                        # Ortak kelimeler varsa, kelime sayısına göre orantılı hesapla
+                        score = (matches["count"] / total_matches) * 100
+
+                    sorted_topics.append({
+                        "konu": topic,
+                        "skor": round(score, 1),
+                        "eşleşen_kelimeler": list(set(matches["matched_words"])),
+                        "ortak_kelimeler": list(set(matches["other_words"])),
+                        "kelime_sayısı": matches["count"]
+                    })
+
+            # Skorlarına göre sırala
+            sorted_topics.sort(key=lambda x: (x["kelime_sayısı"], x["skor"]), reverse=True)
+            
+            # Toplam kelime sayısına göre yüzdeleri yeniden hesapla
+            if len(sorted_topics) > 0:
+                total_words = sum(topic["kelime_sayısı"] for topic in sorted_topics)
+                for topic in sorted_topics:
+                    if total_words > 0:
+                        topic["skor"] = round((topic["kelime_sayısı"] / total_words) * 100, 1)
+
+            return sorted_topics
+
+        except Exception as e:
+            print(f"Konu analizi hatası: {str(e)}")
+            return []
+
+def getTopicName(topic):
+    topic_names = {
+        'teknoloji': 'Teknoloji',
+        'eğitim': 'Eğitim',
+        'sağlık': 'Sağlık',
+        'iş_dünyası': 'İş Dünyası',
+        'sanat_kültür': 'Sanat ve Kültür',
+        'günlük_yaşam': 'Günlük Yaşam',
+        'bilim': 'Bilim',
+        'spor': 'Spor',
+        'politika': 'Politika',
+        'çevre': 'Çevre'
+    }
+    return topic_names.get(topic, topic)
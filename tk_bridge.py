@@ -0,0 +1,64 @@
+import queue
+import threading
+import tkinter as tk
+
+# Kuyruğun ana döngüde kontrol edilme sıklığı
+KONTROL_ARALIGI_MS = 50
+
+
+class TkBridge:
+    """Arka plan thread'lerinden (ses callback'i, canlı tanıma) gelen arayüz işlerini Tk ana döngüsünde çalıştırır
+
+    Tk nesnelerine yalnızca ana thread dokunur; diğer thread'ler işleri
+    kuyruğa bırakır ve hemen döner.
+    """
+
+    def __init__(self, root, interval_ms=KONTROL_ARALIGI_MS):
+        self.root = root
+        self.interval_ms = interval_ms
+        self._queue = queue.SimpleQueue()
+        self._latest = {}
+        self._lock = threading.Lock()
+        self._closed = False
+        self.root.after(self.interval_ms, self._drain)
+
+    def call(self, func, *args):
+        """func(*args) ana thread'de sırayla çalıştırılır; her thread'den çağrılabilir"""
+        self._queue.put((func, args))
+
+    def call_latest(self, key, func, *args):
+        """Aynı anahtarla bekleyen iş varsa yalnızca en son argümanlarla bir kez çalıştırılır
+
+        Grafik güncellemesi gibi sık gelen işlerde arayüzün geride kalmasını önler.
+        """
+        with self._lock:
+            pending = key in self._latest
+            self._latest[key] = (func, args)
+        if not pending:
+            self._queue.put((self._run_latest, (key,)))
+
+    def _run_latest(self, key):
+        with self._lock:
+            func, args = self._latest.pop(key)
+        func(*args)
+
+    def _drain(self):
+        while True:
+            try:
+                func, args = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                func(*args)
+            except Exception as e:
+                print(f"Arayüz güncelleme hatası: {str(e)}")
+
+        if not self._closed:
+            try:
+                self.root.after(self.interval_ms, self._drain)
+            except tk.TclError:
+                # Pencere kapatıldı
+                self._closed = True
+
+    def close(self):
+        self._closed = True
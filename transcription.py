@@ -0,0 +1,256 @@
+import os
+import json
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import soundfile as sf
+import soxr
+from audio_features import to_mono, to_pcm16
+
+# Kullanılacak konuşma tanıma arka ucu: "google" (çevrimiçi), "vosk" (yerel, çevrimdışı) veya "stub" (testler için).
+# Ağ bağlantısı olmayan kurulumlarda KONUSMA_TANIMA=vosk ortam değişkeniyle yerel motor seçilir.
+ARKA_UC_DEGISKENI = "KONUSMA_TANIMA"
+VARSAYILAN_ARKA_UC = os.environ.get(ARKA_UC_DEGISKENI, "google")
+
+# Yerel Vosk Türkçe modelinin klasörü (https://alphacephei.com/vosk/models); VOSK_MODEL_YOLU ile değiştirilebilir
+VOSK_MODEL_YOLU = os.environ.get("VOSK_MODEL_YOLU", "vosk-model-small-tr-0.3")
+VOSK_ORNEKLEME_HIZI = 16000
+
+# Uzun kayıtların bölünme ayarları
+PARCA_SANIYE = 15.0  # Bir parçanın en fazla uzunluğu
+SESSIZLIK_SANIYE = 0.3  # Kesme noktası sayılacak en kısa sessizlik
+SESSIZLIK_KARE_SANIYE = 0.02  # Enerji hesabında kullanılan kare uzunluğu
+SESSIZLIK_ORANI = 0.1  # Kayıttaki tipik enerjiye göre sessizlik eşiği
+ISCI_SAYISI = 4  # Aynı anda yazıya dökülecek parça sayısı
+
+# Arayüzün tanıdığı sonuç metinleri
+ANLASILAMADI = "Could not understand audio"
+
+
+def _result(text, words=(), approximate=False):
+    """Tüm arka uçların ortak sonuç biçimi; kelimeler saniye cinsinden başlangıç/bitiş içerir
+
+    approximate=True ise kelime zamanları arka uçtan gelmemiştir, tahminidir.
+    """
+    return {"text": text, "words": list(words), "approximate": approximate}
+
+
+def spread_words(text, start, end):
+    """Zaman bilgisi vermeyen arka uçlar için kelimeleri aralığa eşit dağıtır
+
+    Bu zamanlar gerçek konuşmayı yansıtmaz; sonuç approximate olarak işaretlenmelidir.
+    """
+    tokens = text.split()
+    if not tokens:
+        return []
+    step = (end - start) / len(tokens)
+    return [
+        {"word": token, "start": round(start + i * step, 3), "end": round(start + (i + 1) * step, 3)}
+        for i, token in enumerate(tokens)
+    ]
+
+
+class TranscriptionBackend(ABC):
+    """Konuşma tanıma arka uçlarının ortak arayüzü"""
+
+    name = None
+
+    @abstractmethod
+    def transcribe(self, signal, sr):
+        """Mono float32 sinyali yazıya döker; {"text", "words"} döndürür"""
+
+    def transcribe_file(self, path):
+        signal, sr = sf.read(path, dtype='float32', always_2d=True)
+        return self.transcribe(to_mono(signal), sr)
+
+
+class GoogleBackend(TranscriptionBackend):
+    """speech_recognition üzerinden Google Web Speech API (ağ bağlantısı gerekir)"""
+
+    name = "google"
+
+    def __init__(self, language="tr-TR"):
+        import speech_recognition as sr
+        self._sr = sr
+        self.language = language
+
+    def transcribe(self, signal, sr):
+        recognizer = self._sr.Recognizer()
+        audio = self._sr.AudioData(to_pcm16(signal).tobytes(), sr, 2)
+        try:
+            text = recognizer.recognize_google(audio, language=self.language)
+        except self._sr.UnknownValueError:
+            return _result(ANLASILAMADI)
+        except self._sr.RequestError as e:
+            return _result(f"Could not request results; {e}")
+        # Google kelime zamanı vermez; kelimeler kaydın süresine yayılır ve sonuç tahmini sayılır
+        return _result(text, spread_words(text, 0.0, len(signal) / sr), approximate=True)
+
+
+class VoskBackend(TranscriptionBackend):
+    """Vosk/Kaldi ile tamamen yerel, CPU üzerinde çalışan tanıma
+
+    Model süreç başına bir kez yüklenir ve tüm thread'lerce paylaşılır;
+    her çağrı yalnızca hafif bir tanıyıcı nesnesi oluşturur.
+    """
+
+    name = "vosk"
+
+    def __init__(self, model_path=VOSK_MODEL_YOLU):
+        # Model yoksa ağ üzerindeki motora sessizce dönülmez; kurulum hatası açıkça bildirilir
+        if not os.path.isdir(model_path):
+            raise RuntimeError(
+                f"Vosk modeli bulunamadı: '{model_path}'. Türkçe modeli https://alphacephei.com/vosk/models "
+                f"adresinden indirip bu klasöre açın ya da VOSK_MODEL_YOLU ile klasörün yolunu verin"
+            )
+        try:
+            import vosk
+        except ImportError:
+            raise RuntimeError("Yerel tanıma için 'vosk' paketi kurulu olmalıdır (pip install vosk)")
+        vosk.SetLogLevel(-1)
+        self._vosk = vosk
+        self.model = vosk.Model(model_path)
+
+    def transcribe(self, signal, sr):
+        if sr != VOSK_ORNEKLEME_HIZI:
+            signal = soxr.resample(signal, sr, VOSK_ORNEKLEME_HIZI)
+        recognizer = self._vosk.KaldiRecognizer(self.model, VOSK_ORNEKLEME_HIZI)
+        recognizer.SetWords(True)
+        recognizer.AcceptWaveform(to_pcm16(signal).tobytes())
+        result = json.loads(recognizer.FinalResult())
+
+        words = [
+            {"word": w["word"], "start": round(w["start"], 3), "end": round(w["end"], 3)}
+            for w in result.get("result", [])
+        ]
+        text = result.get("text", "").strip()
+        return _result(text, words) if text else _result(ANLASILAMADI)
+
+
+class StubBackend(TranscriptionBackend):
+    """Testler için ağ ve model gerektirmeyen, her zaman aynı sonucu veren arka uç"""
+
+    name = "stub"
+
+    def __init__(self, text="merhaba dünya"):
+        self.text = text
+
+    def transcribe(self, signal, sr):
+        if len(signal) == 0 or not self.text:
+            return _result(ANLASILAMADI)
+        return _result(self.text, spread_words(self.text, 0.0, len(signal) / sr), approximate=True)
+
+
+ARKA_UCLAR = {backend.name: backend for backend in (GoogleBackend, VoskBackend, StubBackend)}
+
+_backends = {}
+_backends_lock = threading.Lock()
+
+
+def get_backend(name=None, **kwargs):
+    """Arka ucu süreç başına bir kez oluşturur ve sonraki çağrılarda aynı (sıcak) örneği döndürür"""
+    name = name or VARSAYILAN_ARKA_UC
+    if name not in ARKA_UCLAR:
+        raise ValueError(f"Bilinmeyen konuşma tanıma arka ucu: {name}")
+    key = (name, tuple(sorted(kwargs.items())))
+    backend = _backends.get(key)
+    if backend is None:
+        with _backends_lock:
+            backend = _backends.get(key)
+            if backend is None:
+                backend = ARKA_UCLAR[name](**kwargs)
+                _backends[key] = backend
+    return backend
+
+
+def transcribe_file(path, backend=None):
+    """Dosyayı seçili arka uçla yazıya döker ve yalnızca metni döndürür"""
+    return (backend or get_backend()).transcribe_file(path)["text"]
+
+
+def silence_chunks(signal, sr, max_chunk_s=PARCA_SANIYE, min_silence_s=SESSIZLIK_SANIYE):
+    """Sinyali sessiz noktalardan en fazla max_chunk_s uzunluğunda parçalara böler
+
+    (başlangıç, bitiş) örnek aralıklarını döndürür; tamamen sessiz parçalar atlanır.
+    """
+    n = len(signal)
+    frame = max(1, int(SESSIZLIK_KARE_SANIYE * sr))
+    n_frames = n // frame
+    if n_frames == 0:
+        return [(0, n)] if n else []
+
+    energy = np.sqrt(np.square(signal[:n_frames * frame]).reshape(n_frames, frame).mean(axis=1))
+    threshold = max(np.percentile(energy, 90) * SESSIZLIK_ORANI, 1e-4)
+    silent = energy < threshold
+
+    # Yeterince uzun sessizliklerin ortaları kesme adayıdır
+    padded = np.concatenate(([False], silent, [False]))
+    edges = np.flatnonzero(np.diff(padded.astype(np.int8)))
+    run_starts, run_ends = edges[::2], edges[1::2]
+    long_runs = (run_ends - run_starts) * frame >= min_silence_s * sr
+    cuts = ((run_starts[long_runs] + run_ends[long_runs]) // 2) * frame
+
+    max_len = int(max_chunk_s * sr)
+    chunks = []
+    start = 0
+    while start < n:
+        limit = start + max_len
+        if limit >= n:
+            end = n
+        else:
+            candidates = cuts[(cuts > start) & (cuts <= limit)]
+            end = int(candidates[-1]) if len(candidates) else limit
+        # Parça tamamen sessizse yazıya dökülmez
+        if not silent[start // frame:max(start // frame + 1, end // frame)].all():
+            chunks.append((start, end))
+        start = end
+    return chunks
+
+
+def transcribe_chunked(backend, signal, sr, workers=ISCI_SAYISI, max_chunk_s=PARCA_SANIYE):
+    """Uzun kaydı sessizliklerden bölüp parçaları aynı anda yazıya döker
+
+    Parça sonuçları sırayla birleştirilir; kelime zamanları parçanın kayıttaki
+    konumuna göre kaydırılarak tüm kayda göre verilir. Arka uç kelime zamanı
+    vermiyorsa (approximate) uydurulmuş kelime aralıkları kullanılmaz; her kelimeye
+    bulunduğu parçanın aralığı verilir ve sonuç approximate olarak işaretlenir.
+    """
+    signal = to_mono(signal)
+    chunks = silence_chunks(signal, sr, max_chunk_s)
+    if not chunks:
+        return _result(ANLASILAMADI)
+
+    def run(chunk):
+        start, end = chunk
+        return backend.transcribe(signal[start:end], sr)
+
+    if workers > 1 and len(chunks) > 1:
+        with ThreadPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            results = list(pool.map(run, chunks))
+    else:
+        results = [run(chunk) for chunk in chunks]
+
+    texts, words, failures = [], [], []
+    approximate = False
+    for (start, end), result in zip(chunks, results):
+        if result["text"] == ANLASILAMADI or result["text"].startswith("Could not request results"):
+            failures.append(result["text"])
+            continue
+        offset = start / sr
+        texts.append(result["text"])
+        if result.get("approximate"):
+            approximate = True
+            chunk_start, chunk_end = round(offset, 3), round(end / sr, 3)
+            words.extend(dict(word, start=chunk_start, end=chunk_end) for word in result["words"])
+        else:
+            words.extend(
+                dict(word, start=round(word["start"] + offset, 3), end=round(word["end"] + offset, 3))
+                for word in result["words"]
+            )
+
+    if not texts:
+        # Ağ hatası varsa onu, yoksa anlaşılamadı bilgisini döndür
+        errors = [f for f in failures if f != ANLASILAMADI]
+        return _result(errors[0] if errors else ANLASILAMADI)
+    return _result(" ".join(texts), words, approximate)
@@ -0,0 +1,125 @@
+import io
+import base64
+import hashlib
+import threading
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+# Görüntü ayarları
+GORUNTU_BOYUTU = (8, 4)
+EKRAN_SUTUNU = 1600  # Sinyal grafiğinde çizilen en fazla min/maks sütunu
+
+
+def signal_points(buffer, envelope, start=0, end=None, columns=EKRAN_SUTUNU):
+    """Çizilecek (örnek konumu, değer) noktalarını döndürür; nokta sayısı kayıt uzunluğundan bağımsızdır
+
+    Aralık ekran çözünürlüğünden kısaysa örnekler doğrudan, uzunsa piramitteki zarf kullanılır.
+    """
+    end = min(envelope.count if end is None else end, envelope.count, buffer.written)
+    if end - start <= 2 * columns:
+        return np.arange(start, end), buffer.span(start, end)[:, 0]
+    return envelope.envelope(start, end, columns)
+
+
+def histogram_bars(ax, histogram):
+    """Histogram kutuları için çubukları bir kez oluşturur; sonraki çizimlerde yalnızca yükseklikleri değişir"""
+    bars = ax.bar(
+        histogram.edges[:-1], histogram.counts, width=np.diff(histogram.edges), align='edge', color='b', alpha=0.7
+    )
+    ax.set_xlim(histogram.lo, histogram.hi)
+    return bars
+
+
+def update_histogram_bars(ax, bars, histogram):
+    counts = histogram.counts.copy()
+    for bar, count in zip(bars, counts):
+        bar.set_height(count)
+    ax.set_ylim(0, max(int(counts.max()), 1) * 1.05)
+
+
+class VisualizationService:
+    """Kayıt tamponunun sinyal ve histogram görüntülerini yeniden kullanılan figürlerle üretir
+
+    Figürler bir kez oluşturulur; yeni ses gelmediyse son PNG baytları ve ETag
+    değeri yeniden çizilmeden döndürülür. Histogram ve zarf ses geldikçe
+    kayıt tarafında güncellenir; burada yalnızca çizilir.
+    """
+
+    def __init__(self, buffer, sr, envelope, histogram):
+        self.buffer = buffer
+        self.envelope = envelope  # Ses geldikçe güncellenen min/maks piramidi (envelope.EnvelopePyramid)
+        self.histogram = histogram  # Ses geldikçe güncellenen genlik histogramı (histogram.RunningHistogram)
+        self.sr = sr
+        self._lock = threading.Lock()
+        self._cache = {}
+
+        # pyplot kullanılmaz; figürler doğrudan Agg tuvaline bağlanır, arka uç değiştirmek gerekmez
+        self._signal_fig = Figure(figsize=GORUNTU_BOYUTU)
+        FigureCanvasAgg(self._signal_fig)
+        self._signal_ax = self._signal_fig.add_subplot(111)
+        self._signal_line, = self._signal_ax.plot([], [], linewidth=0.8)
+        self._signal_ax.set_title('Ses Sinyali')
+        self._signal_ax.set_xlabel('Zaman (s)')
+        self._signal_ax.set_ylabel('Amplitüd')
+        self._signal_fig.subplots_adjust(left=0.1, right=0.95, top=0.9, bottom=0.15)
+
+        self._hist_fig = Figure(figsize=GORUNTU_BOYUTU)
+        FigureCanvasAgg(self._hist_fig)
+        self._hist_ax = self._hist_fig.add_subplot(111)
+        self._bars = histogram_bars(self._hist_ax, histogram)
+        self._hist_ax.set_title('Ses Verisi Dağılımı')
+        self._hist_ax.set_xlabel('Amplitüd')
+        self._hist_ax.set_ylabel('Frekans')
+        self._hist_fig.subplots_adjust(left=0.12, right=0.95, top=0.9, bottom=0.15)
+
+    def _state(self):
+        return self.buffer.generation, self.buffer.written
+
+    def signal_png(self):
+        """(PNG baytları, ETag) döndürür; tampon boşsa (None, None)"""
+        return self._cached("signal", self._render_signal)
+
+    def histogram_png(self):
+        return self._cached("histogram", self._render_histogram)
+
+    def _cached(self, name, render):
+        with self._lock:
+            state = self._state()
+            if state[1] == 0:
+                return None, None
+            cached = self._cache.get(name)
+            if cached is not None and cached[0] == state:
+                return cached[1], cached[2]
+
+            png = render()
+            etag = hashlib.md5(png).hexdigest()
+            self._cache[name] = (state, png, etag)
+            return png, etag
+
+    def _render_signal(self):
+        x, y = signal_points(self.buffer, self.envelope)
+        self._signal_line.set_data(x / self.sr, y)
+        self._signal_ax.set_xlim(0, max(self.envelope.count / self.sr, 1 / self.sr))
+        peak = float(np.abs(y).max()) if len(y) else 1.0
+        peak = peak or 1.0
+        self._signal_ax.set_ylim(-peak * 1.05, peak * 1.05)
+        return self._print(self._signal_fig)
+
+    def _render_histogram(self):
+        update_histogram_bars(self._hist_ax, self._bars, self.histogram)
+        return self._print(self._hist_fig)
+
+    @staticmethod
+    def _print(fig):
+        buf = io.BytesIO()
+        fig.canvas.print_png(buf)
+        return buf.getvalue()
+
+    def signal_base64(self):
+        png, _ = self.signal_png()
+        return None if png is None else base64.b64encode(png).decode('utf-8')
+
+    def histogram_base64(self):
+        png, _ = self.histogram_png()
+        return None if png is None else base64.b64encode(png).decode('utf-8')